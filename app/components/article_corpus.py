@@ -0,0 +1,214 @@
+"""
+Component holding the process-wide article corpus shared by all sessions.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils.article import Article
+from utils.article_index import ArticleIndex
+from utils.topic_sampler import TopicSampler
+from utils.article_store import get_article_store, RUNNING_KEY, ERRORS_KEY
+from utils.expiry_queue import ExpiryQueue
+from utils.metrics import metrics
+from utils.config import (
+    APP_METRICS_FILE, APP_METRICS_SECONDS, CACHE_TTL_DAYS, CORPUS_RELOAD_SECONDS, EMBEDDED_INGEST
+)
+
+# How often (in seconds) to check the store while there is nothing to show yet
+EMPTY_RELOAD_SECONDS = 1
+
+
+class ArticleCorpus:
+    """
+    Single in-memory copy of the stored articles, read by every Streamlit session.
+    
+    The app never scrapes on its own: articles are written to the article store
+    by the ingest daemon (see ingest.py), and the corpus reloads them whenever the
+    store reports a change. Hosts that can't run a separate daemon can enable
+    EMBEDDED_INGEST to run the ingest job in a thread of the app process instead.
+    
+    Articles also age out between reloads: each one is queued by the time it
+    expires, and every poll evicts just the articles at the front of the queue.
+    
+    The app process doesn't serve metrics, so the reload job also writes its
+    metrics (content cache lookups, evictions) to APP_METRICS_FILE.
+    """
+    
+    def __init__(self, reload_interval: float = CORPUS_RELOAD_SECONDS, embedded_ingest: bool = EMBEDDED_INGEST):
+        """
+        Initialize the corpus from the article store so a restart serves cached
+        articles right away.
+        
+        Args:
+            reload_interval: Seconds between checks for newly ingested articles
+            embedded_ingest: Whether to run the ingest job inside this process
+        """
+        self.reload_interval = reload_interval
+        self.logger = logging.getLogger("article_corpus")
+        self.errors: Dict[str, str] = {}
+        self.ingest = None
+        if embedded_ingest:
+            # The ingest job, and the scrapers it loads, are only imported when it runs here
+            from ingest import IngestService
+            self.ingest = IngestService()
+        self.ttl_seconds = CACHE_TTL_DAYS * 86400
+        # Holds the live articles, so selections never scan the corpus
+        self.index = ArticleIndex()
+        # Live article URLs ordered by the time they expire
+        self.expiry = ExpiryQueue()
+        # Draws topics with the configured probabilities, among topics with articles
+        self.sampler = TopicSampler(counts={})
+        self._refreshing = False
+        self._content_version: Optional[int] = None
+        self._changed = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.reload()
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    @property
+    def articles(self) -> List[Article]:
+        """A list of the current articles, built on every access."""
+        return self.index.articles()
+    
+    @property
+    def refreshing(self) -> bool:
+        """Whether an ingest is currently running."""
+        return self._refreshing
+    
+    def reload(self) -> bool:
+        """
+        Read the ingest state, and reload the articles if they changed since the
+        last load.
+        
+        The ingest state is a couple of small meta values, read on every call;
+        only a change to the articles themselves triggers a full reload.
+        
+        Returns:
+            bool: True if the articles had changed
+        """
+        store = get_article_store()
+        articles = None
+        try:
+            refreshing = store.get_meta(RUNNING_KEY) == "1"
+            errors = json.loads(store.get_meta(ERRORS_KEY) or "{}")
+            content_version = store.content_version()
+            if content_version != self._content_version:
+                # Readers only get the first copy of a syndicated story
+                articles = [
+                    (article, cached_at) for article, cached_at in store.load_timed_articles(CACHE_TTL_DAYS)
+                    if not article.duplicate_of
+                ]
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to load cached articles: {e}")
+            return False
+        
+        if articles is not None:
+            for url in self.index.sync(article for article, _ in articles):
+                self.expiry.discard(url)
+            for article, cached_at in articles:
+                self.expiry.push(article.url, cached_at + self.ttl_seconds)
+            self.sampler.update_counts(self.index.topic_counts())
+        with self._changed:
+            if articles is not None:
+                self._content_version = content_version
+            self._refreshing = refreshing
+            self.errors = errors
+            self._changed.notify_all()
+        return articles is not None
+    
+    def evict_expired(self, now: Optional[float] = None) -> int:
+        """
+        Drop the articles that expired since they were loaded.
+        
+        Only the expired articles are touched, so a pass that finds none is O(1).
+        
+        Args:
+            now: Current timestamp, time.time() by default
+            
+        Returns:
+            int: Number of articles evicted
+        """
+        with metrics.timed("corpus_eviction_seconds"):
+            expired = self.expiry.pop_expired(now)
+            for url in expired:
+                self.index.remove(url)
+            if expired:
+                self.sampler.update_counts(self.index.topic_counts())
+        if expired:
+            metrics.inc("corpus_evictions_total", len(expired))
+            self.logger.info(f"Evicted {len(expired)} expired articles")
+        return len(expired)
+    
+    def start(self) -> None:
+        """Start watching the store (and the embedded ingest job) if not running yet."""
+        with self._changed:
+            if self._thread is not None:
+                return
+            if self.ingest is not None:
+                # Mark a due ingest as running right away so readers know to wait for it
+                if self.ingest.is_due():
+                    self._refreshing = True
+                threading.Thread(target=self.ingest.run_forever, name="article-ingest", daemon=True).start()
+            self._thread = threading.Thread(target=self._run, name="article-corpus", daemon=True)
+            self._thread.start()
+    
+    def _write_metrics(self) -> None:
+        """Write this process's metrics snapshot, for reading alongside the ingest's."""
+        try:
+            metrics.write_json(APP_METRICS_FILE)
+        except OSError as e:
+            self.logger.warning(f"Could not write metrics snapshot: {e}")
+    
+    def _run(self) -> None:
+        """Background job: reload whenever the store changes, and export the metrics."""
+        metrics_due = time.monotonic() + APP_METRICS_SECONDS
+        while True:
+            try:
+                self.reload()
+                self.evict_expired()
+            except Exception as e:
+                self.logger.error(f"Article reload failed: {e}")
+            if time.monotonic() >= metrics_due:
+                self._write_metrics()
+                metrics_due = time.monotonic() + APP_METRICS_SECONDS
+            time.sleep(EMPTY_RELOAD_SECONDS if not self.index else self.reload_interval)
+    
+    def wait_for_articles(self, timeout: float) -> bool:
+        """
+        Block until the corpus has at least one article or the running ingest ends.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            bool: True if articles are available
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self.index or not self._refreshing, timeout)
+            return bool(self.index)
+
+
+_corpus: Optional[ArticleCorpus] = None
+_corpus_lock = threading.Lock()
+
+
+def get_article_corpus() -> ArticleCorpus:
+    """
+    Get the process-wide article corpus, starting its reload job on first use.
+    
+    Returns:
+        ArticleCorpus: The shared corpus
+    """
+    global _corpus
+    if _corpus is None:
+        with _corpus_lock:
+            if _corpus is None:
+                _corpus = ArticleCorpus()
+                _corpus.start()
+    return _corpus
@@ -2,28 +2,29 @@
 Component for displaying the selected daily article.
 """
 import streamlit as st
-from typing import Dict
+from typing import Dict, Optional
 import requests
 from bs4 import BeautifulSoup
 import re
-import datetime
 
-# Try importing Newspaper3k, but gracefully handle if it's not available
-try:
-    from newspaper import Article, ArticleException
-    NEWSPAPER_AVAILABLE = True
-except ImportError:
-    NEWSPAPER_AVAILABLE = False
-    # Define a placeholder to avoid reference errors
-    class ArticleException(Exception):
-        pass
+from utils import http_client
+from utils.article import Article
+from utils.content_cache import get_content_cache
+from scrapers.extraction import load_newspaper
 
-def display_article(article: Dict) -> None:
+# Headers used when downloading an article for display
+ARTICLE_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+def display_article(article: Optional[Article]) -> None:
     """
     Display the selected article in the Streamlit UI.
     
     Args:
-        article: Dictionary containing article information
+        article: The article to display
     """
     # Add CSS to hide any "Related Topics" sections
     st.markdown("""
@@ -67,53 +68,36 @@ def display_article(article: Dict) -> None:
         
         with col1:
             # Get the article category (use this as the primary label)
-            category = article.get("category", "General")
+            category = article.category or "General"
             
             # Display category badge instead of topic
             st.markdown(f"<div style='display:inline-block; background-color:#1E88E5; color:white; padding:4px 12px; border-radius:20px; font-size:0.8em'>{category}</div>", unsafe_allow_html=True)
         
         # Display article title
-        st.markdown(f"## {article.get('title', 'Untitled Article')}")
-        
-        # Get publication date
-        pub_date = article.get("pub_date", "")
-        if not pub_date and "date" in article:
-            pub_date = article.get("date", "")
+        st.markdown(f"## {article.title or 'Untitled Article'}")
         
-        # Format the date nicely if it exists
+        # Format the publication date nicely if it is known
         date_display = ""
-        if pub_date:
-            # Try to parse the date if it's a string
-            if isinstance(pub_date, str):
-                try:
-                    # Try common date formats
-                    for fmt in ["%Y-%m-%d", "%Y/%m/%d", "%d-%m-%Y", "%d/%m/%Y", "%b %d, %Y", "%B %d, %Y", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ"]:
-                        try:
-                            parsed_date = datetime.datetime.strptime(pub_date, fmt)
-                            date_display = f"📅 {parsed_date.strftime('%B %d, %Y')}"
-                            break
-                        except ValueError:
-                            continue
-                except:
-                    # If parsing fails, just use the string as is
-                    date_display = f"📅 {pub_date}"
-            else:
-                # If it's already a datetime object
-                date_display = f"📅 {pub_date.strftime('%B %d, %Y') if hasattr(pub_date, 'strftime') else str(pub_date)}"
+        published_at = article.published_at
+        if published_at:
+            date_display = f"📅 {published_at.strftime('%B %d, %Y')}"
+        elif article.published_date:
+            # If parsing failed, just use the string as is
+            date_display = f"📅 {article.published_date}"
         
         # Source info with date if available
-        source_line = f"**Source:** {article.get('source', 'Unknown')}"
+        source_line = f"**Source:** {article.source or 'Unknown'}"
         if date_display:
             source_line += f" | {date_display}"
         st.markdown(source_line)
         
         # Display image if available
-        image_url = article.get("image_url")
+        image_url = article.image_url
         if image_url:
             st.image(image_url, use_container_width=True)
         
         # Get the article URL
-        article_url = article.get("url")
+        article_url = article.url
         
         # Display article content directly
         if article_url:
@@ -199,142 +183,182 @@ def display_text_only_article(url: str) -> None:
     """
     Display a text-only version of the article by extracting main content.
     Uses Newspaper3k if available, otherwise falls back to BeautifulSoup.
+    Extracted content is cached, so articles seen before render without a new download.
     
     Args:
         url: URL of the article to extract text from
     """
     try:
-        with st.spinner("Extracting article content..."):
-            # Define headers for requests
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml",
-                "Accept-Language": "en-US,en;q=0.9",
-            }
-            
-            # Create styled container
-            st.markdown("""
-            <style>
-            .article-text-container {
-                padding: 20px;
-                background-color: #f8f9fa;
-                border-radius: 5px;
-                max-height: 600px;
-                overflow-y: auto;
-                border: 1px solid #e9ecef;
-                margin-top: 0;
-                margin-bottom: 20px;
-            }
-            .article-text-container p {
-                margin-bottom: 15px;
-                line-height: 1.6;
-            }
-            .article-text-container h1, 
-            .article-text-container h2,
-            .article-text-container h3,
-            .article-text-container h4,
-            .article-text-container h5,
-            .article-text-container h6 {
-                margin-top: 20px;
-                margin-bottom: 10px;
-                color: #333;
-            }
-            .article-keywords {
-                display: flex;
-                flex-wrap: wrap;
-                gap: 8px;
-                margin-bottom: 15px;
-            }
-            .article-keyword {
-                background-color: #e9ecef;
-                padding: 4px 10px;
-                border-radius: 15px;
-                font-size: 0.8em;
-                color: #495057;
-            }
-            /* Minimize spacing in Streamlit containers */
-            .block-container {
-                padding-top: 0;
-                padding-bottom: 0;
-            }
-            .stSpinner {
-                margin-top: 0;
-                margin-bottom: 0;
-                padding-top: 0;
-                padding-bottom: 0;
-            }
-            </style>
-            """, unsafe_allow_html=True)
-            
-            # Start the container with no gap
-            st.markdown('<div class="article-text-container">', unsafe_allow_html=True)
-            
-            # Try using Newspaper3k if available
-            if NEWSPAPER_AVAILABLE:
-                try:
-                    # Use Newspaper3k for content extraction
-                    article = Article(url)
-                    article.headers = headers
-                    
-                    # Download and parse the article
-                    article.download()
-                    article.parse()
-                    
-                    # Try NLP if possible
-                    has_nlp = False
-                    try:
-                        article.nlp()
-                        has_nlp = True
-                    except:
-                        pass
-                    
-                    # Display article content
-                    if article.text:
-                        # Show keywords if available
-                        if has_nlp and article.keywords:
-                            st.markdown('<div class="article-keywords">', unsafe_allow_html=True)
-                            for keyword in article.keywords[:8]:  # Limit to top 8 keywords
-                                st.markdown(f'<span class="article-keyword">{keyword}</span>', unsafe_allow_html=True)
-                            st.markdown('</div>', unsafe_allow_html=True)
-                        
-                        # Show article text, split into paragraphs
-                        paragraphs = article.text.split('\n\n')
-                        for paragraph in paragraphs:
-                            if paragraph.strip():
-                                st.markdown(f"<p>{paragraph}</p>", unsafe_allow_html=True)
-                    else:
-                        # Fallback to BeautifulSoup if article text is empty
-                        _display_with_beautifulsoup(url, headers)
-                
-                except (ArticleException, ImportError):
-                    # Fallback to BeautifulSoup
-                    _display_with_beautifulsoup(url, headers)
-            else:
-                # If Newspaper3k is not available, use BeautifulSoup
-                _display_with_beautifulsoup(url, headers)
-            
-            # Close the container
-            st.markdown('</div>', unsafe_allow_html=True)
+        # Create styled container
+        st.markdown("""
+        <style>
+        .article-text-container {
+            padding: 20px;
+            background-color: #f8f9fa;
+            border-radius: 5px;
+            max-height: 600px;
+            overflow-y: auto;
+            border: 1px solid #e9ecef;
+            margin-top: 0;
+            margin-bottom: 20px;
+        }
+        .article-text-container p {
+            margin-bottom: 15px;
+            line-height: 1.6;
+        }
+        .article-text-container h1, 
+        .article-text-container h2,
+        .article-text-container h3,
+        .article-text-container h4,
+        .article-text-container h5,
+        .article-text-container h6 {
+            margin-top: 20px;
+            margin-bottom: 10px;
+            color: #333;
+        }
+        .article-keywords {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 8px;
+            margin-bottom: 15px;
+        }
+        .article-keyword {
+            background-color: #e9ecef;
+            padding: 4px 10px;
+            border-radius: 15px;
+            font-size: 0.8em;
+            color: #495057;
+        }
+        /* Minimize spacing in Streamlit containers */
+        .block-container {
+            padding-top: 0;
+            padding-bottom: 0;
+        }
+        .stSpinner {
+            margin-top: 0;
+            margin-bottom: 0;
+            padding-top: 0;
+            padding-bottom: 0;
+        }
+        </style>
+        """, unsafe_allow_html=True)
+        
+        content_cache = get_content_cache()
+        content = content_cache.get(url)
+        if content is None:
+            with st.spinner("Extracting article content..."):
+                content = extract_article_text(url)
+            # Only keep successful extractions so failures are retried next time
+            if content["blocks"]:
+                content_cache.put(url, content)
+        
+        # Start the container with no gap
+        st.markdown('<div class="article-text-container">', unsafe_allow_html=True)
+        _render_article_text(content)
+        
+        # Close the container
+        st.markdown('</div>', unsafe_allow_html=True)
             
     except Exception as e:
         st.error(f"Error extracting article text: {e}")
         st.info("Try opening the article in a new tab instead.")
 
-def _display_with_beautifulsoup(url: str, headers: Dict) -> None:
+def _render_article_text(content: Dict) -> None:
+    """
+    Render extracted article text.
+    
+    Args:
+        content: Extracted content as returned by extract_article_text
+    """
+    # Show keywords if available
+    if content.get("keywords"):
+        st.markdown('<div class="article-keywords">', unsafe_allow_html=True)
+        for keyword in content["keywords"][:8]:  # Limit to top 8 keywords
+            st.markdown(f'<span class="article-keyword">{keyword}</span>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    for tag, text in content["blocks"]:
+        st.markdown(f"<{tag}>{text}</{tag}>", unsafe_allow_html=True)
+    
+    if not content["blocks"]:
+        if content.get("error"):
+            st.error(f"Error with BeautifulSoup extraction: {content['error']}")
+            st.info("Try opening the article in a new tab instead.")
+        else:
+            st.warning(content.get("warning") or "No meaningful text content could be extracted from this article.")
+
+def extract_article_text(url: str) -> Dict:
     """
-    Fallback method to display article content using BeautifulSoup.
+    Download an article and extract its readable text.
+    Uses Newspaper3k if available, otherwise falls back to BeautifulSoup.
+    
+    This does no Streamlit rendering, so it is safe to call from any thread.
+    
+    Args:
+        url: URL of the article
+        
+    Returns:
+        Dict: `blocks` as a list of (tag, text) pairs, `keywords`, and a `warning`
+        or `error` message when nothing could be extracted
+    """
+    # The page as downloaded for Newspaper3k, so the fallback doesn't fetch it again
+    html = None
+    
+    # Try using Newspaper3k if available; it is imported on the first extraction
+    newspaper = load_newspaper()
+    if newspaper is not None:
+        Article, ArticleException = newspaper
+        try:
+            # Download through the shared connection pool, then parse with Newspaper3k
+            response = http_client.get(url, headers=ARTICLE_REQUEST_HEADERS)
+            response.raise_for_status()
+            html = response.text
+            article = Article(url)
+            article.download(input_html=html)
+            article.parse()
+            
+            # Try NLP if possible
+            keywords = []
+            try:
+                article.nlp()
+                keywords = list(article.keywords)
+            except:
+                pass
+            
+            if article.text:
+                # Split article text into paragraphs
+                paragraphs = article.text.split('\n\n')
+                blocks = [["p", paragraph] for paragraph in paragraphs if paragraph.strip()]
+                return {"blocks": blocks, "keywords": keywords}
+        
+        except (ArticleException, ImportError, requests.RequestException):
+            pass
+    
+    # Fallback to BeautifulSoup if Newspaper3k is unavailable, failed or found no text
+    return _extract_with_beautifulsoup(url, ARTICLE_REQUEST_HEADERS, html)
+
+def _extract_with_beautifulsoup(url: str, headers: Dict, html: Optional[str] = None) -> Dict:
+    """
+    Fallback method to extract article content using BeautifulSoup.
     
     Args:
         url: URL of the article
         headers: HTTP headers for the request
+        html: The page, if it was already downloaded; fetched otherwise
+        
+    Returns:
+        Dict: Extracted content in the same shape as extract_article_text
     """
+    blocks = []
     try:
-        # Fetch article content
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        # Fetch article content, unless Newspaper3k already did
+        if html is None:
+            response = http_client.get(url, headers=headers)
+            response.raise_for_status()
+            html = response.text
         
         # Parse HTML content
-        soup = BeautifulSoup(response.text, 'lxml')
+        soup = BeautifulSoup(html, 'lxml')
         
         # Remove script, style, and nav elements
         for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'form']):
@@ -406,7 +430,7 @@ def _display_with_beautifulsoup(url: str, headers: Dict) -> None:
                 # Only render substantial content or headings
                 if len(text) > 40 or elem.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
                     tag = elem.name if elem.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6'] else 'p'
-                    st.markdown(f"<{tag}>{text}</{tag}>", unsafe_allow_html=True)
+                    blocks.append([tag, text])
                     content_added = True
             
             # If no paragraphs found, display all text
@@ -415,14 +439,15 @@ def _display_with_beautifulsoup(url: str, headers: Dict) -> None:
                 # Remove any sections starting with "Related Topics" and going to the end of line
                 full_text = re.sub(r'Related Topics.*?(\n|$)', '', full_text, flags=re.IGNORECASE|re.MULTILINE)
                 if full_text:
-                    st.markdown(f"<p>{full_text}</p>", unsafe_allow_html=True)
+                    blocks.append(["p", full_text])
                     content_added = True
             
             if not content_added:
-                st.warning("No meaningful text content could be extracted from this article.")
+                return {"blocks": [], "keywords": [], "warning": "No meaningful text content could be extracted from this article."}
         else:
-            st.warning("Could not identify the main content of the article.")
+            return {"blocks": [], "keywords": [], "warning": "Could not identify the main content of the article."}
     
     except Exception as e:
-        st.error(f"Error with BeautifulSoup extraction: {e}")
-        st.info("Try opening the article in a new tab instead.") 
\ No newline at end of file
+        return {"blocks": [], "keywords": [], "error": str(e)}
+    
+    return {"blocks": blocks, "keywords": []} 
\ No newline at end of file
@@ -1,10 +1,24 @@
 """
 Component for loading articles from scrapers.
 """
-from typing import List, Dict
-from scrapers.base_scraper import BaseScraper
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Iterator, Optional, Tuple
+from utils.article import Article
+from utils.config import CACHE_TTL_DAYS, SCRAPER_TIMEOUT_SECONDS
+from utils import http_client
+from utils.article_store import get_article_store
 
-def load_articles(scraper: BaseScraper) -> List[Dict]:
+if TYPE_CHECKING:
+    from scrapers.base_scraper import BaseScraper
+
+logger = logging.getLogger("article_loader")
+
+def load_articles(scraper: "BaseScraper") -> List[Article]:
     """
     Load articles from a scraper.
     
@@ -12,10 +26,122 @@ def load_articles(scraper: BaseScraper) -> List[Dict]:
         scraper: Scraper instance
         
     Returns:
-        List[Dict]: List of articles
+        List[Article]: List of articles
     """
     try:
         return scraper.scrape_articles()
     except Exception as e:
-        print(f"Error loading articles from {scraper.source_name}: {str(e)}")
-        return [] 
\ No newline at end of file
+        logger.error(f"Error loading articles from {scraper.source_name}: {e}")
+        return []
+
+def commit_articles(articles: List[Article]) -> int:
+    """
+    Write the articles from a full refresh to the article store in one transaction.
+    
+    Scrapers no longer save their own results; collecting them here means each
+    refresh costs a single write proportional to the number of articles scraped.
+    
+    Args:
+        articles: Articles collected from all sources
+        
+    Returns:
+        int: Number of articles written
+    """
+    try:
+        return get_article_store().write_batch(articles, CACHE_TTL_DAYS)
+    except sqlite3.Error as e:
+        logger.error(f"Failed to save articles to cache: {e}")
+        return 0
+
+def stream_articles(scraper: "BaseScraper") -> Iterator[Article]:
+    """
+    Stream articles from a scraper as it extracts them.
+    
+    Args:
+        scraper: Scraper instance
+        
+    Yields:
+        Article: Articles, tagged with the scraper's source id as source_key
+    """
+    try:
+        for article in scraper.iter_articles():
+            # Add source_key for filtering
+            article.source_key = scraper.source_id
+            yield article
+    except Exception as e:
+        logger.error(f"Error loading articles from {scraper.source_name}: {e}")
+
+def stream_articles_concurrently(
+    scrapers: List["BaseScraper"],
+    timeout: float = SCRAPER_TIMEOUT_SECONDS
+) -> Iterator[Tuple["BaseScraper", Optional[Article], Optional[str]]]:
+    """
+    Run all scrapers in parallel and yield each article as soon as any source
+    produces it.
+    
+    Every scraper gets its own worker thread, so all sources start at the same time
+    and the timeout applies to each source individually. A source that has not
+    finished within the timeout is reported as failed and told to stop after the
+    article it is currently working on, so one slow site never holds up the others.
+    
+    Args:
+        scrapers: Scraper instances to run
+        timeout: Maximum number of seconds to wait for each source
+        
+    Yields:
+        Tuple of (scraper, article, error). Articles are tagged with the scraper's
+        source id as source_key. When a source fails or times out, article is None and error
+        describes what went wrong.
+    """
+    if not scrapers:
+        return
+    
+    results = queue.Queue()
+    stop = threading.Event()
+    finished = object()
+    
+    def run(scraper: "BaseScraper") -> None:
+        try:
+            for article in scraper.iter_articles():
+                if stop.is_set():
+                    return
+                article.source_key = scraper.source_id
+                results.put((scraper, article, None))
+        except Exception as e:
+            logger.error(f"Error loading articles from {scraper.source_name}: {e}")
+            results.put((scraper, None, str(e)))
+        finally:
+            results.put((scraper, finished, None))
+    
+    executor = ThreadPoolExecutor(max_workers=len(scrapers), thread_name_prefix="scraper")
+    for scraper in scrapers:
+        executor.submit(run, scraper)
+    deadline = time.monotonic() + timeout
+    running = set(scrapers)
+    
+    try:
+        while running:
+            remaining = deadline - time.monotonic()
+            try:
+                scraper, article, error = results.get(timeout=max(remaining, 0))
+            except queue.Empty:
+                break
+            
+            if article is finished:
+                running.discard(scraper)
+            elif scraper in running:
+                yield scraper, article, error
+        
+        # Anything still running has exceeded its time budget
+        for scraper in running:
+            logger.warning(f"Timed out loading articles from {scraper.source_name} after {timeout}s")
+            yield scraper, None, f"Timed out after {timeout:g} seconds"
+    finally:
+        # Ask abandoned workers to stop and don't block on them
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        stats = http_client.connection_stats()
+        logger.info(
+            f"HTTP connection reuse: {stats['requests']} requests over "
+            f"{stats['connections']} connections ({stats['reused']} reused)"
+        )
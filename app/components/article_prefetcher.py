@@ -0,0 +1,149 @@
+"""
+Component for prefetching the content of articles the reader is likely to open next.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
+
+from components.article_display import extract_article_text
+from components.article_selector import select_article
+from utils.article import Article
+from utils.article_index import ArticleIndex
+from utils.topic_sampler import TopicSampler
+from utils.config import PREFETCH_SETTINGS
+from utils.content_cache import get_content_cache
+
+logger = logging.getLogger("article_prefetcher")
+
+
+class ArticlePrefetcher:
+    """
+    Background worker pool that extracts article text into the content cache
+    before the reader asks for it.
+    """
+    
+    def __init__(self, max_workers: int = PREFETCH_SETTINGS["workers"]):
+        """
+        Initialize the prefetcher.
+        
+        Args:
+            max_workers: Number of articles extracted in parallel
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._in_flight = set()
+        self._lock = threading.Lock()
+    
+    def prefetch(self, url: str) -> None:
+        """
+        Queue an article for extraction unless it is cached or already queued.
+        
+        Args:
+            url: URL of the article
+        """
+        if not url:
+            return
+        with self._lock:
+            if url in self._in_flight:
+                return
+            self._in_flight.add(url)
+        self._executor.submit(self._warm, url)
+    
+    def _warm(self, url: str) -> None:
+        """Extract an article and store the result in the content cache."""
+        try:
+            cache = get_content_cache()
+            if cache.get(url) is not None:
+                return
+            content = extract_article_text(url)
+            if content["blocks"]:
+                cache.put(url, content)
+        except Exception as e:
+            logger.warning(f"Prefetch failed for {url}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(url)
+
+
+_prefetcher: Optional[ArticlePrefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_prefetcher() -> ArticlePrefetcher:
+    """
+    Get the process-wide prefetcher shared by all sessions.
+    
+    Returns:
+        ArticlePrefetcher: The shared prefetcher
+    """
+    global _prefetcher
+    if _prefetcher is None:
+        with _prefetcher_lock:
+            if _prefetcher is None:
+                _prefetcher = ArticlePrefetcher()
+    return _prefetcher
+
+
+def next_article(
+    articles: Union[ArticleIndex, List[Article]],
+    topic: Optional[str],
+    source: Optional[str],
+    upcoming: List[Article],
+    lookahead: int = PREFETCH_SETTINGS["lookahead"],
+    sampler: Optional[TopicSampler] = None
+) -> Optional[Article]:
+    """
+    Take the next article to show from a queue of upcoming picks, then top the
+    queue back up and prefetch the content of everything in it.
+    
+    Picks are made with select_article, so they follow the same topic and source
+    filters as a direct selection. Without a topic filter, each pick's topic is
+    drawn from the sampler, if given, so the configured topic probabilities apply.
+    The caller owns the queue and must clear it when the filters change.
+    
+    Args:
+        articles: Index or list of available articles
+        topic: Selected topic or None for all topics
+        source: Selected source or None for all sources
+        upcoming: Queue of articles already picked for this reader (modified in place)
+        lookahead: Number of articles to keep queued and prefetched
+        sampler: Topic sampler used when no topic is selected
+        
+    Returns:
+        Optional[Article]: The article to show, or None if no article matches
+    """
+    # Index a plain list once rather than on every pick
+    if not isinstance(articles, ArticleIndex):
+        articles = ArticleIndex(articles)
+    
+    # Draw the topics of all picks this call may make in one batch
+    drawn_topics = iter(sampler.sample_many(lookahead * 3 + 1)) if sampler is not None and not topic else None
+    
+    def pick() -> Optional[Article]:
+        if drawn_topics is None:
+            return select_article(articles, topic, source)
+        # The drawn topic may have no articles from the selected source
+        return select_article(articles, next(drawn_topics, None), source) or select_article(articles, None, source)
+    
+    selected = upcoming.pop(0) if upcoming else pick()
+    if selected is None:
+        return None
+    
+    # Refill the queue, skipping repeats where the corpus allows it
+    queued_urls = {selected.url} | {article.url for article in upcoming}
+    attempts = lookahead * 3
+    while len(upcoming) < lookahead and attempts > 0:
+        attempts -= 1
+        candidate = pick()
+        if candidate is None:
+            break
+        if candidate.url in queued_urls:
+            continue
+        queued_urls.add(candidate.url)
+        upcoming.append(candidate)
+    
+    prefetcher = get_prefetcher()
+    for article in upcoming:
+        prefetcher.prefetch(article.url)
+    
+    return selected
@@ -1,9 +1,12 @@
 """
 Component for processing article content.
 """
-from typing import Dict
+import dataclasses
+from typing import Optional
 
-def process_article(article: Dict) -> Dict:
+from utils.article import Article
+
+def process_article(article: Optional[Article]) -> Optional[Article]:
     """
     Process article content for display.
     
@@ -11,19 +14,17 @@ def process_article(article: Dict) -> Dict:
         article: Raw article data
         
     Returns:
-        Dict: Processed article data
+        Optional[Article]: Processed article data
     """
     if not article:
-        return {}
+        return None
         
+    # The view renders the page fetched by URL, so a body the corpus didn't load
+    # is left in the store rather than read on every rerun
+    if article.body is None:
+        return article
+    
     # Clean and format content
-    content = article.get('content', '').strip()
-    content = ' '.join(content.split())  # Normalize whitespace
+    content = ' '.join(article.body.split())  # Normalize whitespace
     
-    return {
-        'title': article.get('title', ''),
-        'url': article.get('url', ''),
-        'content': content,
-        'source': article.get('source', ''),
-        'topic': article.get('topic', '')
-    } 
\ No newline at end of file
+    return dataclasses.replace(article, body=content)
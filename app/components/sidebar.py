@@ -5,7 +5,8 @@ import streamlit as st
 import datetime
 from typing import Dict
 
-from utils.config import TOPICS, NEWS_SOURCES
+from utils.config import TOPICS
+from scrapers.registry import source_registry
 
 def render_sidebar() -> None:
     """
@@ -51,8 +52,7 @@ def render_sidebar() -> None:
         st.subheader("News Sources")
         
         # Display all news sources
-        for source_key, source_data in NEWS_SOURCES.items():
-            source_name = source_data["name"]
+        for source_name in source_registry.display_names().values():
             st.markdown(f"- {source_name}")
             
         st.markdown("---")
@@ -3,6 +3,7 @@ Component for news source selection in the sidebar.
 """
 import streamlit as st
 from typing import Optional
+from scrapers.registry import source_registry
 
 def display_source_selection() -> Optional[str]:
     """
@@ -11,15 +12,7 @@ def display_source_selection() -> Optional[str]:
     Returns:
         Optional[str]: Selected source or None if 'All Sources' is selected
     """
-    sources = {
-        "hindu": "The Hindu",
-        "telegraph": "The Telegraph",
-        "bbc": "BBC News",
-        "reuters": "Reuters",
-        "guardian": "The Guardian",
-        "toi": "Times of India",
-        None: "All Sources"
-    }
+    sources = {**source_registry.display_names(), None: "All Sources"}
     
     selected_source = st.selectbox(
         "Select News Source",
@@ -0,0 +1,276 @@
+"""
+Headless article ingest daemon.
+
+Runs the scrapers on a schedule and writes their articles to the article store,
+independently of the Streamlit app, which only reads from the store. Each feed
+is fetched again once it is older than its freshness target in NEWS_SOURCES.
+
+Usage:
+    python -m app.ingest          # keep running, ingesting whenever a feed goes stale
+    python -m app.ingest --once   # ingest once and exit
+    python -m app.ingest --once --sources bbc,toi   # ingest only some sources
+    python -m app.ingest --metrics-port 9100   # also serve the pipeline metrics over HTTP
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# The app modules import each other relative to the app directory
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.article import Article
+from utils.article_store import (
+    get_article_store, LAST_INGEST_KEY, RUNNING_KEY, ERRORS_KEY, SOURCE_HEALTH_KEY
+)
+from utils.config import CACHE_TTL_DAYS, INGEST_CHECK_SECONDS, METRICS_FILE
+from utils.metrics import metrics, serve_metrics
+from utils.near_duplicates import NearDuplicateIndex
+from scrapers.scheduler import FeedScheduler
+
+# With an empty store, articles are written in batches of this size so the app
+# has something to show before the whole ingest finishes
+PROGRESSIVE_BATCH_SIZE = 10
+
+
+class IngestService:
+    """
+    Scrapes the feeds that went stale (see scrapers/scheduler.py) and commits the
+    results to the article store in one write. Only entries whose URLs aren't
+    stored yet are downloaded and extracted, so the work of a run grows with
+    what is new rather than with the size of the feeds.
+    
+    The service is the only writer of the article store; the app processes just
+    read it. Whether an ingest is running and which sources failed are recorded
+    in the store as well, so the app can report them.
+    
+    Syndicated copies of a story are grouped as they arrive: each is stored with
+    `duplicate_of` set to the first copy seen, and RSS scrapers skip entries
+    whose copy was ingested already. Both compare the RSS title and summary
+    (see Article.story_fields), so the skip matches what the grouping would do.
+    """
+    
+    def __init__(self, check_interval: float = INGEST_CHECK_SECONDS):
+        """
+        Initialize the service.
+        
+        Args:
+            check_interval: Seconds between checks whether an ingest is due
+        """
+        self.check_interval = check_interval
+        self.logger = logging.getLogger("ingest")
+        self.errors: Dict[str, str] = {}
+        self.running = False
+        self.scheduler = FeedScheduler()
+        self._lock = threading.Lock()
+    
+    @property
+    def last_ingest(self) -> Optional[datetime]:
+        """Time of the last successful ingest, shared through the article store."""
+        value = get_article_store().get_meta(LAST_INGEST_KEY)
+        return datetime.fromisoformat(value) if value else None
+    
+    def is_due(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check whether any feed is stale.
+        
+        Args:
+            now: Current time, defaults to datetime.now()
+            
+        Returns:
+            bool: True if some feeds should be fetched again
+        """
+        return bool(self.scheduler.stale_feeds(now.timestamp() if now else None))
+    
+    def _near_duplicate_index(self) -> NearDuplicateIndex:
+        """Build a near-duplicate index holding the stored articles, grouped as before."""
+        duplicates = NearDuplicateIndex()
+        duplicates.add_all(
+            (article.url, *article.story_fields(), article.duplicate_of or article.url)
+            for article in get_article_store().load_articles(CACHE_TTL_DAYS)
+        )
+        return duplicates
+    
+    def run_once(self, on_article: Optional[Callable[[Article], None]] = None,
+                 sources: Optional[List[str]] = None, feeds: Optional[Dict[str, List[str]]] = None) -> int:
+        """
+        Scrape the sources and commit the new articles to the store.
+        Does nothing if an ingest is already running.
+        
+        Args:
+            on_article: Called with each article as soon as it arrives
+            sources: Ids of the sources to scrape, all enabled sources by default
+            feeds: Names of the feeds to fetch by source id, as returned by
+                FeedScheduler.stale_feeds(); sources missing from it are skipped.
+                All feeds of the sources by default.
+            
+        Returns:
+            int: Number of articles ingested
+        """
+        with self._lock:
+            if self.running:
+                return 0
+            self.running = True
+        
+        started = datetime.now()
+        articles = []
+        errors = {}
+        store = None
+        try:
+            # The scrapers are only imported once an ingest runs, so an app that just
+            # reads the store doesn't pay for importing them at startup
+            from components.article_loader import stream_articles_concurrently, commit_articles
+            from scrapers.registry import source_registry
+            from scrapers.scraper_factory import ScraperFactory
+            
+            store = get_article_store()
+            store.set_meta(RUNNING_KEY, "1")
+            # With nothing to show yet, write articles as they arrive instead of only at the end
+            progressive = store.count() == 0
+            pending = []
+            duplicates = self._near_duplicate_index()
+            if feeds is not None:
+                sources = [source_id for source_id in feeds if sources is None or source_id in sources]
+            scrapers = ScraperFactory.get_scrapers(sources)
+            counts = {scraper.source_id: 0 for scraper in scrapers}
+            known_urls = store.known_urls()
+            for scraper in scrapers:
+                scraper.duplicates = duplicates
+                scraper.skip_urls = known_urls
+                if feeds is not None:
+                    scraper.only_feeds = set(feeds[scraper.source_id])
+            for scraper, article, error in stream_articles_concurrently(scrapers):
+                if error:
+                    errors[scraper.source_name] = error
+                    source_registry.record_failure(scraper.source_id, error)
+                    counts.pop(scraper.source_id, None)
+                    continue
+                canonical = duplicates.add(article.url, *article.story_fields())
+                article.duplicate_of = canonical if canonical != article.url else ""
+                articles.append(article)
+                if scraper.source_id in counts:
+                    counts[scraper.source_id] += 1
+                if on_article is not None:
+                    on_article(article)
+                if progressive:
+                    pending.append(article)
+                    if len(pending) >= PROGRESSIVE_BATCH_SIZE:
+                        store.upsert_articles(pending)
+                        pending = []
+            
+            for source_id, count in counts.items():
+                source_registry.record_success(source_id, count)
+            self.scheduler.record(scrapers, errors)
+            
+            if articles:
+                # Save everything from this run in one write
+                commit_articles(articles)
+                store.set_meta(LAST_INGEST_KEY, started.isoformat())
+            metrics.inc("ingest_articles_total", len(articles))
+            self.logger.info(
+                f"Ingested {len(articles)} articles ({len(errors)} sources failed, "
+                f"{duplicates.stats()['duplicates']} near-duplicates grouped)"
+            )
+            return len(articles)
+        finally:
+            self.errors = errors
+            self.running = False
+            # A store that failed to open has no state to reset
+            if store is not None:
+                try:
+                    store.set_meta(ERRORS_KEY, json.dumps(errors))
+                    store.set_meta(SOURCE_HEALTH_KEY, json.dumps(source_registry.health()))
+                    store.set_meta(RUNNING_KEY, "0")
+                except sqlite3.Error as e:
+                    self.logger.error(f"Could not record the ingest state: {e}")
+            metrics.observe("ingest_seconds", (datetime.now() - started).total_seconds())
+            try:
+                metrics.write_json(METRICS_FILE)
+            except OSError as e:
+                self.logger.warning(f"Could not write metrics snapshot: {e}")
+    
+    def clear_running_flag(self) -> None:
+        """
+        Clear the running flag left in the store by a process that was killed
+        during a run, so the app doesn't show a refresh that never ends.
+        """
+        if get_article_store().get_meta(RUNNING_KEY) == "1":
+            self.logger.info("Clearing the running flag of an interrupted ingest")
+            get_article_store().set_meta(RUNNING_KEY, "0")
+    
+    def run_forever(self, on_article: Optional[Callable[[Article], None]] = None,
+                    sources: Optional[List[str]] = None) -> None:
+        """
+        Ingest the stale feeds, checking every `check_interval` seconds.
+        
+        Args:
+            on_article: Called with each article as soon as it arrives
+            sources: Ids of the sources to scrape, all enabled sources by default
+        """
+        while True:
+            try:
+                stale = self.scheduler.stale_feeds()
+                if sources is not None:
+                    stale = {source_id: names for source_id, names in stale.items() if source_id in sources}
+                if stale:
+                    self.run_once(on_article, sources, stale)
+            except Exception as e:
+                self.logger.error(f"Ingest failed: {e}")
+            time.sleep(self.check_interval)
+
+
+def _interrupt(signum, frame) -> None:
+    """Turn SIGTERM into KeyboardInterrupt, so a stopped run unwinds like Ctrl+C."""
+    raise KeyboardInterrupt
+
+
+def main(argv=None) -> int:
+    """
+    Run the ingest daemon from the command line.
+    
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:]
+        
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Scrape news sources into the article store.")
+    parser.add_argument("--once", action="store_true", help="ingest once and exit, even if not due")
+    parser.add_argument("--interval", type=float, default=INGEST_CHECK_SECONDS,
+                        help="seconds between checks whether an ingest is due")
+    parser.add_argument("--sources",
+                        help="comma-separated ids of the sources to scrape, e.g. bbc,toi (default: all enabled)")
+    parser.add_argument("--metrics-port", type=int,
+                        help="serve the pipeline metrics at /metrics (Prometheus) and /metrics.json on this port")
+    args = parser.parse_args(argv)
+    
+    # run.py stops the daemon with SIGTERM; run_once's cleanup must still run then
+    signal.signal(signal.SIGTERM, _interrupt)
+    if args.metrics_port:
+        serve_metrics(args.metrics_port)
+    service = IngestService(check_interval=args.interval)
+    sources = args.sources.split(",") if args.sources else None
+    try:
+        if args.once:
+            service.run_once(sources=sources)
+            # Finding nothing new is a healthy run; only failed sources make it fail
+            return 1 if service.errors else 0
+        
+        # No run is in progress when the daemon starts, whatever the store says
+        service.clear_running_flag()
+        service.run_forever(sources=sources)
+    except KeyboardInterrupt:
+        # An interrupted --once run didn't finish its ingest
+        return 1 if args.once else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,29 +2,34 @@
 Main Streamlit application for displaying daily articles.
 """
 import streamlit as st
-from datetime import datetime
-from scrapers.scraper_factory import ScraperFactory
 from components.article_display import display_article
 from components.topic_selection import display_topic_selection
 from components.source_selection import display_source_selection
-from components.article_loader import load_articles
-from components.article_selector import select_article
+from components.article_corpus import get_article_corpus
+from components.article_prefetcher import next_article
 from components.article_processor import process_article
-from components.article_cache import ArticleCache
+from utils.article_selector import get_daily_selection
+from scrapers.registry import source_registry
+from utils.config import SCRAPER_TIMEOUT_SECONDS
 
 # Initialize session state
-if "articles" not in st.session_state:
-    st.session_state.articles = []
 if "selected_article" not in st.session_state:
     st.session_state.selected_article = None
 if "selected_topic" not in st.session_state:
     st.session_state.selected_topic = None
 if "selected_source" not in st.session_state:
     st.session_state.selected_source = None
-if "last_update" not in st.session_state:
-    st.session_state.last_update = None
-if "article_cache" not in st.session_state:
-    st.session_state.article_cache = ArticleCache()
+if "upcoming_articles" not in st.session_state:
+    st.session_state.upcoming_articles = []
+if "upcoming_filters" not in st.session_state:
+    st.session_state.upcoming_filters = None
+if "showing_daily" not in st.session_state:
+    st.session_state.showing_daily = True
+
+# Asking for another article moves on from the day's article
+if st.session_state.get("reload_article"):
+    st.session_state.reload_article = False
+    st.session_state.showing_daily = False
 
 # Set page config
 st.set_page_config(
@@ -76,64 +81,53 @@ with st.sidebar:
     
     # Source information
     st.markdown("### 📋 News Sources")
-    st.markdown("""
-    Articles are fetched from multiple sources:
-    - The Hindu
-    - The Telegraph
-    - BBC News
-    - Reuters
-    - The Guardian
-    - Times of India
-    """)
+    st.markdown("Articles are fetched from multiple sources:\n" + "\n".join(
+        f"- {source_name}" for source_name in source_registry.display_names().values()
+    ))
     
     st.markdown("---")
     st.markdown("""
     ### ℹ️ About
     This app provides daily articles for VARC preparation.
-    Articles are automatically updated daily at 6 AM IST.
+    Articles are updated throughout the day, as each source publishes them.
     """)
 
 # Main content
 st.title("📰 Daily Articles")
 
-# Check if we need to update articles
-current_time = datetime.now()
-if (st.session_state.last_update is None or 
-    (current_time - st.session_state.last_update).days >= 1 or
-    current_time.hour >= 6 and st.session_state.last_update.day < current_time.day):
-    
+# Articles are shared by all sessions and reloaded whenever the ingest job stores new ones
+corpus = get_article_corpus()
+if not len(corpus) and corpus.refreshing:
     with st.spinner("Fetching latest articles..."):
-        # Get all scrapers
-        scrapers = ScraperFactory.get_all_scrapers()
-        
-        # Load articles from all sources
-        all_articles = []
-        for scraper in scrapers:
-            try:
-                articles = load_articles(scraper)
-                # Add source_key for filtering
-                for article in articles:
-                    article['source_key'] = scraper.source_name
-                all_articles.extend(articles)
-            except Exception as e:
-                st.error(f"Error loading articles from {scraper.source_name}: {str(e)}")
-                continue
-        
-        if all_articles:
-            st.session_state.articles = all_articles
-            st.session_state.last_update = current_time
-            st.success("Articles updated successfully!")
-        else:
-            st.error("No articles could be loaded. Please try again later.")
+        corpus.wait_for_articles(timeout=SCRAPER_TIMEOUT_SECONDS)
+
+has_articles = len(corpus) > 0
+if not has_articles:
+    for source_name, error in corpus.errors.items():
+        st.error(f"Error loading articles from {source_name}: {error}")
 
 # Display articles if available
-if st.session_state.articles:
-    # Select article based on topic and source
-    selected_article = select_article(
-        st.session_state.articles, 
-        st.session_state.selected_topic,
-        st.session_state.selected_source
-    )
+if has_articles:
+    # Articles queued for this reader were picked under the current filters only
+    current_filters = (st.session_state.selected_topic, st.session_state.selected_source)
+    if st.session_state.upcoming_filters != current_filters:
+        st.session_state.upcoming_articles = []
+        st.session_state.upcoming_filters = current_filters
+    
+    # Without filters, readers start with the day's article, the same all day
+    selected_article = None
+    if st.session_state.showing_daily and not any(current_filters):
+        selected_article = get_daily_selection(corpus.index)
+    
+    # Select article based on topic and source, prefetching the next few in the background
+    if selected_article is None:
+        selected_article = next_article(
+            corpus.index, 
+            st.session_state.selected_topic,
+            st.session_state.selected_source,
+            st.session_state.upcoming_articles,
+            sampler=corpus.sampler
+        )
     
     if selected_article:
         # Process article content
@@ -147,7 +141,8 @@ if st.session_state.articles:
         if st.session_state.selected_topic:
             filters_applied.append(f"topic '{st.session_state.selected_topic}'")
         if st.session_state.selected_source:
-            filters_applied.append(f"source '{st.session_state.selected_source}'")
+            source_name = source_registry.display_names().get(st.session_state.selected_source, st.session_state.selected_source)
+            filters_applied.append(f"source '{source_name}'")
             
         if filters_applied:
             st.info(f"""
@@ -0,0 +1,432 @@
+"""
+Asyncio fetch engine for fetching many pages, feeds and articles concurrently.
+"""
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Union
+from urllib.parse import urlparse
+
+import feedparser
+import requests
+from bs4 import BeautifulSoup
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    # Without aiohttp, requests go through the pooled requests session in threads
+    AIOHTTP_AVAILABLE = False
+
+from scrapers.base_scraper import BaseScraper, ScraperException
+from scrapers.extraction import ExtractionError, get_extraction_pool
+from scrapers.feed_cache import feed_cache
+from utils import http_client
+from utils.config import REQUEST_HEADERS, ASYNC_FETCH_SETTINGS, HTTP_POOL_SETTINGS
+from utils.metrics import metrics
+from utils.rate_limiter import rate_limiter, HostRateLimiter
+
+logger = logging.getLogger("async_fetcher")
+
+# Errors of the underlying HTTP client that mean the request failed
+REQUEST_ERRORS = (aiohttp.ClientError,) if AIOHTTP_AVAILABLE else (requests.RequestException,)
+
+
+class FetchResponse(NamedTuple):
+    """A fully read HTTP response."""
+    url: str
+    status: int
+    headers: Mapping[str, str]
+    content: bytes
+    encoding: Optional[str]
+
+    @property
+    def text(self) -> str:
+        """The body decoded as text."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+class AsyncFetcher:
+    """
+    Fetches pages, RSS feeds and articles concurrently in one event loop.
+
+    Requests are bounded both globally and per host by semaphores, and wait for
+    the host's token bucket in the shared rate limiter without blocking the loop.
+    Each request has a timeout, and cancelling a coroutine cancels its request.
+    Transient failures are retried with exponential backoff, like the shared
+    requests session does (see utils/http_client.py).
+    Parsing pages and feeds is CPU-bound, so it runs in a worker thread pool
+    instead of on the event loop, and article extraction in the extraction
+    process pool (see extraction.py).
+
+    Use it as an async context manager:
+
+        async with AsyncFetcher() as fetcher:
+            entries = await fetcher.fetch_rss_feed(feed_url)
+    """
+
+    def __init__(self,
+                 headers: Dict = REQUEST_HEADERS,
+                 max_concurrency: int = ASYNC_FETCH_SETTINGS["max_concurrency"],
+                 per_host_concurrency: int = ASYNC_FETCH_SETTINGS["per_host_concurrency"],
+                 timeout: float = ASYNC_FETCH_SETTINGS["timeout_seconds"],
+                 parse_workers: int = ASYNC_FETCH_SETTINGS["parse_workers"],
+                 limiter: HostRateLimiter = rate_limiter,
+                 retries: int = HTTP_POOL_SETTINGS["retries"],
+                 backoff_factor: float = HTTP_POOL_SETTINGS["backoff_factor"]):
+        """
+        Initialize the fetcher.
+
+        Args:
+            headers: Headers sent with every request
+            max_concurrency: Maximum number of requests in flight
+            per_host_concurrency: Maximum number of requests in flight to one host
+            timeout: Seconds allowed for each request, including reading the body
+            parse_workers: Number of threads parsing HTML and feeds
+            limiter: Per-host rate limiter, shared with the blocking scrapers by default
+            retries: Times a failed request or a retryable status is retried
+            backoff_factor: Base of the exponential delay between retries, in seconds
+        """
+        self.headers = dict(headers)
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.timeout = timeout
+        self.parse_workers = parse_workers
+        self.limiter = limiter
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._parse_pool: Optional[ThreadPoolExecutor] = None
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._host_semaphores = {}
+        self._parse_pool = ThreadPoolExecutor(max_workers=self.parse_workers, thread_name_prefix="async-parse")
+        if AIOHTTP_AVAILABLE:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host_concurrency)
+            )
+        else:
+            self._io_pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="async-io")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        for pool in (self._parse_pool, self._io_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._parse_pool = self._io_pool = None
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get or create the semaphore bounding requests to the host of a URL."""
+        host = (urlparse(url).hostname or "").lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return semaphore
+
+    async def _parse(self, func: Callable, *args):
+        """Run a CPU-bound parsing function in the worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, functools.partial(func, *args))
+
+    async def _send(self, url: str, headers: Optional[Dict]) -> FetchResponse:
+        """Send a GET request and read the whole response."""
+        if AIOHTTP_AVAILABLE:
+            host = (urlparse(url).hostname or "").lower()
+            started = time.perf_counter()
+            try:
+                async with self._session.get(url, headers=headers, allow_redirects=True) as response:
+                    content = await response.read()
+            except REQUEST_ERRORS:
+                metrics.inc("http_responses_total", host=host, status="error")
+                raise
+            finally:
+                metrics.observe("http_request_seconds", time.perf_counter() - started, host=host)
+            metrics.inc("http_responses_total", host=host, status=response.status)
+            metrics.inc("http_response_bytes_total", len(content), host=host)
+            return FetchResponse(str(response.url), response.status, response.headers, content, response.charset)
+
+        # A cancelled request stops being awaited, but its thread finishes the download
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self._io_pool,
+            functools.partial(http_client.get, url, headers=merged, timeout=self.timeout, allow_redirects=True)
+        )
+        return FetchResponse(response.url, response.status_code, response.headers, response.content,
+                             response.encoding or response.apparent_encoding)
+
+    def _retry_delay(self, attempt: int, response: Optional[FetchResponse] = None) -> float:
+        """Seconds to wait before retry number `attempt` + 1, honouring Retry-After."""
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff_factor * (2 ** attempt)
+
+    async def fetch(self, url: str, headers: Optional[Dict] = None) -> FetchResponse:
+        """
+        Fetch a URL once the concurrency and rate limits allow it, retrying
+        transient failures.
+
+        Args:
+            url: URL to fetch
+            headers: Extra headers for this request
+
+        Returns:
+            FetchResponse: The response, whatever its status code
+
+        Raises:
+            ScraperException: If the request fails or times out
+        """
+        # The requests session retries on its own
+        retries = self.retries if AIOHTTP_AVAILABLE else 0
+        for attempt in range(retries + 1):
+            # Every attempt takes a rate limit token, and waits for it before taking
+            # a slot, so a throttled host never holds slots other hosts could use
+            wait = self.limiter.reserve(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            response = error = None
+            async with self._semaphore, self._host_semaphore(url):
+                try:
+                    response = await asyncio.wait_for(self._send(url, headers), self.timeout)
+                except asyncio.TimeoutError:
+                    error = f"Timed out fetching {url} after {self.timeout:g} seconds"
+                except REQUEST_ERRORS as e:
+                    error = f"Failed to fetch {url}: {e}"
+            if attempt == retries or (response is not None and response.status not in http_client.RETRY_STATUSES):
+                break
+            # Back off without holding a slot either
+            await asyncio.sleep(self._retry_delay(attempt, response))
+
+        if error is not None:
+            logger.error(error)
+            raise ScraperException(error)
+        return response
+
+    async def _fetch_ok(self, url: str, headers: Optional[Dict] = None) -> FetchResponse:
+        """Fetch a URL and raise ScraperException for error statuses."""
+        response = await self.fetch(url, headers)
+        if response.status >= 400:
+            logger.error(f"Error fetching {url}: HTTP {response.status}")
+            raise ScraperException(f"Failed to fetch {url}: HTTP {response.status}")
+        return response
+
+    async def fetch_page(self, url: str) -> BeautifulSoup:
+        """
+        Fetch a page and parse it in the worker pool.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            BeautifulSoup object of the page
+
+        Raises:
+            ScraperException: If the request fails
+        """
+        response = await self._fetch_ok(url)
+        return await self._parse(_parse_html, response)
+
+    async def fetch_rss_feed(self, feed_url: str) -> List[Dict]:
+        """
+        Fetch and parse an RSS feed, reusing the stored entries if the server
+        reports it unchanged since the last poll.
+
+        Args:
+            feed_url: URL of the RSS feed
+
+        Returns:
+            List of entries
+
+        Raises:
+            ScraperException: If the feed cannot be fetched or has no entries
+        """
+        response = await self.fetch(feed_url, feed_cache.validators(feed_url))
+        if response.status == 304:
+            entries = feed_cache.get_entries(feed_url)
+            if entries:
+                logger.info(f"RSS feed not modified, reusing {len(entries)} stored entries: {feed_url}")
+                return entries
+            # The stored entries vanished in the meantime, so fetch the full feed
+            response = await self.fetch(feed_url)
+        if response.status >= 400:
+            logger.error(f"Error fetching RSS feed {feed_url}: HTTP {response.status}")
+            raise ScraperException(f"Failed to fetch RSS feed {feed_url}: HTTP {response.status}")
+
+        feed = await self._parse(_parse_feed, response.content)
+        if not feed.entries:
+            logger.error(f"No entries found in RSS feed: {feed_url}")
+            raise ScraperException(f"No entries found in RSS feed: {feed_url}")
+
+        # Remember the validators so the next poll can be conditional
+        await self._parse(
+            feed_cache.store,
+            feed_url,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            feed.entries
+        )
+        return feed.entries
+
+    async def extract_article_content(self, url: str, scraper: BaseScraper) -> Dict:
+        """
+        Fetch an article and extract its content in the extraction process pool.
+
+        Args:
+            url: URL of the article
+            scraper: Scraper whose extraction rules apply to the article
+
+        Returns:
+            Dict: Article data including title, text, publish date, and top image
+
+        Raises:
+            ScraperException: If the article cannot be fetched or parsed
+        """
+        response = await self._fetch_ok(url, scraper.headers)
+        # Extraction holds the GIL, so it goes to the process pool rather than a thread
+        future = get_extraction_pool().submit(scraper.extractor, url, response.content, response.encoding)
+        try:
+            return await asyncio.wrap_future(future)
+        except ExtractionError as e:
+            raise ScraperException(str(e))
+
+    async def extract_many(self, urls: List[str], scraper: BaseScraper,
+                           timeout: Optional[float] = None) -> Dict[str, Union[Dict, ScraperException]]:
+        """
+        Extract several articles concurrently.
+
+        Args:
+            urls: URLs of the articles
+            scraper: Scraper whose extraction rules apply to the articles
+            timeout: Overall deadline in seconds; articles still pending then are
+                cancelled and reported as failed
+
+        Returns:
+            Dict mapping each URL to its article data, or to the ScraperException
+            raised while extracting it
+        """
+        tasks = {url: asyncio.ensure_future(self.extract_article_content(url, scraper)) for url in urls}
+        if not tasks:
+            return {}
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        extracted = {}
+        for url, task in tasks.items():
+            if task in pending:
+                extracted[url] = ScraperException(f"Timed out after {timeout:g} seconds: {url}")
+            elif isinstance(task.exception(), ScraperException):
+                extracted[url] = task.exception()
+            elif task.exception() is not None:
+                extracted[url] = ScraperException(f"Failed to extract article content from {url}: {task.exception()}")
+            else:
+                extracted[url] = task.result()
+        return extracted
+
+
+def _parse_html(response: FetchResponse) -> BeautifulSoup:
+    """Decode and parse a page; runs in the worker pool."""
+    with metrics.timed("parse_seconds", parser="beautifulsoup"):
+        return BeautifulSoup(response.text, 'lxml')
+
+
+def _parse_feed(content: bytes):
+    """Parse an RSS feed; runs in the worker pool."""
+    with metrics.timed("parse_seconds", parser="feedparser"):
+        return feedparser.parse(content)
+
+
+class BackgroundFetcher:
+    """
+    One AsyncFetcher kept open in an event loop on a daemon thread, so blocking
+    code in any thread can run coroutines on it. Every feed and section of every
+    scraper then shares the fetcher's connection pool, keep-alive connections and
+    concurrency limits, instead of opening a new session per call.
+    """
+
+    def __init__(self, **fetcher_kwargs):
+        """
+        Start the event loop and open the fetcher.
+
+        Args:
+            **fetcher_kwargs: Passed on to AsyncFetcher
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-fetcher", daemon=True)
+        self._thread.start()
+        self.fetcher = AsyncFetcher(**fetcher_kwargs)
+        self.run(self.fetcher.__aenter__())
+
+    def run(self, coroutine, timeout: Optional[float] = None):
+        """
+        Run a coroutine on the fetcher's loop and wait for its result.
+
+        Args:
+            coroutine: The coroutine
+            timeout: Seconds to wait, forever by default
+
+        Returns:
+            The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def close(self) -> None:
+        """Close the fetcher and stop the event loop."""
+        self.run(self.fetcher.__aexit__(None, None, None))
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+_background_fetcher: Optional[BackgroundFetcher] = None
+_background_fetcher_lock = threading.Lock()
+
+
+def get_background_fetcher() -> BackgroundFetcher:
+    """
+    Get the process-wide background fetcher, starting it on first use.
+
+    Returns:
+        BackgroundFetcher: The shared fetcher
+    """
+    global _background_fetcher
+    if _background_fetcher is None:
+        with _background_fetcher_lock:
+            if _background_fetcher is None:
+                _background_fetcher = BackgroundFetcher()
+    return _background_fetcher
+
+
+def extract_articles(scraper: BaseScraper, urls: List[str],
+                     timeout: Optional[float] = ASYNC_FETCH_SETTINGS["batch_timeout_seconds"]) -> Dict[str, Union[Dict, ScraperException]]:
+    """
+    Extract several articles concurrently from blocking code, on the shared
+    background fetcher.
+
+    Args:
+        scraper: Scraper whose headers and extraction rules to use
+        urls: URLs of the articles
+        timeout: Overall deadline in seconds, so one hung page can't hold up the
+            batch; articles still pending then are cancelled and reported as failed
+
+    Returns:
+        Dict mapping each URL to its article data, or to the ScraperException
+        raised while extracting it
+    """
+    urls = list(dict.fromkeys(urls))
+    background = get_background_fetcher()
+    return background.run(background.fetcher.extract_many(urls, scraper, timeout))
@@ -1,27 +1,26 @@
 """
 Base scraper class for all news sources.
 """
-import json
-import os
+import html
 import logging
+import sqlite3
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
-import time
-from datetime import datetime, timedelta
+from html.parser import HTMLParser
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 import feedparser
-from ratelimit import limits, sleep_and_retry
-try:
-    from newspaper import Article, ArticleException
-    NEWSPAPER_AVAILABLE = True
-except ImportError:
-    # If newspaper3k or its dependencies are not available
-    NEWSPAPER_AVAILABLE = False
-    ArticleException = Exception  # Define a placeholder
-
 import requests
 from bs4 import BeautifulSoup
 
-from utils.config import REQUEST_HEADERS, TOPICS, ARTICLES_CACHE_FILE
+from utils.config import CACHE_TTL_DAYS, REQUEST_HEADERS
+from utils.article import Article
+from utils.article_store import get_article_store
+from utils.metrics import metrics
+from utils.near_duplicates import NearDuplicateIndex
+from utils.rate_limiter import rate_limiter
+from utils import http_client
+from scrapers.extraction import ExtractionError, extract_article, extract_article_fallback, get_extraction_pool
+from scrapers.feed_cache import feed_cache
+from scrapers.topic_classifier import topic_classifier
 
 # Configure logging
 logging.basicConfig(
@@ -33,14 +32,67 @@ class ScraperException(Exception):
     """Custom exception for scraper-related errors."""
     pass
 
+class EntryHTMLParser(HTMLParser):
+    """
+    Collects the text of an RSS entry's HTML summary and the first image in it,
+    in a single pass without building a tree.
+    """
+    
+    # Elements whose content isn't text, as BeautifulSoup's get_text() skips them
+    SKIPPED_TAGS = {"script", "style", "template"}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.image_url = ""
+        self._skipping = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self._skipping += 1
+        elif tag == "img" and not self.image_url:
+            self.image_url = dict(attrs).get("src") or ""
+    
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self._skipping:
+            self._skipping -= 1
+    
+    def handle_data(self, data):
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def normalize_entry_html(markup: str) -> Tuple[str, str]:
+    """
+    Turn an RSS entry's HTML summary into plain text and find its first image.
+    
+    Args:
+        markup: The summary HTML
+        
+    Returns:
+        (text, image URL); the image URL is empty if there is no image
+    """
+    if not markup:
+        return "", ""
+    if "<" not in markup and "&" not in markup:
+        # Plain text, the common case for some feeds
+        return markup.strip(), ""
+    parser = EntryHTMLParser()
+    parser.feed(markup)
+    parser.close()
+    return "".join(parser.parts).strip(), parser.image_url
+
 class BaseScraper(ABC):
     """
     Base class for all news source scrapers.
     """
     
-    # Rate limit: 1 request per 2 seconds
-    CALLS_PER_SECOND = 1/2
-    CACHE_TTL_DAYS = 1
+    CACHE_TTL_DAYS = CACHE_TTL_DAYS
+    
+    # Turns a downloaded article page into an article record. It runs in the
+    # extraction process pool, so it must be a module-level function taking
+    # (url, html bytes, encoding)
+    extractor = staticmethod(extract_article)
     
     def __init__(self, source_name: str, base_url: str):
         """
@@ -51,12 +103,40 @@ class BaseScraper(ABC):
             base_url: Base URL of the news source
         """
         self.source_name = source_name
+        # Key of the source in NEWS_SOURCES, set by the source registry; articles are tagged with it
+        self.source_id = source_name
         self.base_url = base_url
         self.headers = REQUEST_HEADERS
         self.logger = logging.getLogger(f"scraper.{source_name}")
+        # Requests are throttled per host, shared with every other scraper
+        self.rate_limiter = rate_limiter
+        # Stories ingested so far, set by the ingest job so syndicated copies aren't extracted again
+        self.duplicates: Optional[NearDuplicateIndex] = None
+        # Names of the feeds (or site sections) to read, all of them if None; set by the ingest scheduler
+        self.only_feeds: Optional[Set[str]] = None
+        # URLs already in the store, skipped before they are downloaded or extracted
+        self.skip_urls: Set[str] = set()
+        # Names of the feeds read successfully, so the scheduler knows which ones are fresh
+        self.fetched_feeds: Set[str] = set()
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET request through the shared connection pool once the host's
+        rate limit allows it.
+        
+        Args:
+            url: URL to fetch
+            **kwargs: Extra arguments passed on to requests.Session.get; any
+                `headers` are merged over the scraper's default headers
+            
+        Returns:
+            requests.Response: The response
+        """
+        headers = dict(self.headers)
+        headers.update(kwargs.pop('headers', None) or {})
+        self.rate_limiter.acquire(url)
+        return http_client.get(url, headers=headers, **kwargs)
         
-    @sleep_and_retry
-    @limits(calls=1, period=1/CALLS_PER_SECOND)
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """
         Fetch a page and return a BeautifulSoup object.
@@ -71,15 +151,14 @@ class BaseScraper(ABC):
             ScraperException: If the request fails
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'lxml')
+            with metrics.timed("parse_seconds", parser="beautifulsoup"):
+                return BeautifulSoup(response.text, 'lxml')
         except requests.RequestException as e:
             self.logger.error(f"Error fetching {url}: {e}")
             raise ScraperException(f"Failed to fetch {url}: {e}")
     
-    @sleep_and_retry
-    @limits(calls=1, period=1/CALLS_PER_SECOND)
     def fetch_rss_feed(self, feed_url: str) -> Optional[List[Dict]]:
         """
         Fetch and parse an RSS feed.
@@ -94,8 +173,18 @@ class BaseScraper(ABC):
             ScraperException: If the feed cannot be parsed
         """
         try:
-            # First try to handle redirects using requests
-            response = requests.get(feed_url, headers=self.headers, timeout=10, allow_redirects=True)
+            # Ask the server to skip the body if the feed hasn't changed since the last poll
+            conditional_headers = feed_cache.validators(feed_url)
+            response = self._get(feed_url, headers=conditional_headers, allow_redirects=True)
+            
+            if response.status_code == 304:
+                entries = feed_cache.get_entries(feed_url)
+                if entries:
+                    self.logger.info(f"RSS feed not modified, reusing {len(entries)} stored entries: {feed_url}")
+                    return entries
+                # The stored entries vanished in the meantime, so fetch the full feed
+                response = self._get(feed_url, allow_redirects=True)
+            
             response.raise_for_status()
             
             # Use the final URL after redirects for feedparser
@@ -103,19 +192,22 @@ class BaseScraper(ABC):
             self.logger.info(f"Using RSS feed URL: {final_url} (originally: {feed_url})")
             
             # Parse the feed from the response content directly
-            feed = feedparser.parse(response.content)
-            
-            # Check if feedparser found entries
-            if not feed.entries:
-                # Fallback - try parsing the feed URL directly
-                self.logger.warning(f"No entries found in response content, trying direct URL parsing")
-                feed = feedparser.parse(final_url)
+            with metrics.timed("parse_seconds", parser="feedparser"):
+                feed = feedparser.parse(response.content)
             
             # Validate feed has entries
             if not feed.entries:
                 self.logger.error(f"No entries found in RSS feed: {feed_url}")
                 raise ScraperException(f"No entries found in RSS feed: {feed_url}")
             
+            # Remember the validators so the next poll can be conditional
+            feed_cache.store(
+                feed_url,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                feed.entries
+            )
+            
             return feed.entries
         except requests.RequestException as e:
             self.logger.error(f"Error fetching RSS feed {feed_url}: {e}")
@@ -124,8 +216,6 @@ class BaseScraper(ABC):
             self.logger.error(f"Error parsing RSS feed {feed_url}: {e}")
             raise ScraperException(f"Failed to parse RSS feed {feed_url}: {e}")
     
-    @sleep_and_retry
-    @limits(calls=1, period=1/CALLS_PER_SECOND)
     def extract_article_content(self, url: str) -> Dict:
         """
         Extract article content using Newspaper3k if available, or fallback to a simple
@@ -140,53 +230,60 @@ class BaseScraper(ABC):
         Raises:
             ScraperException: If the article cannot be parsed
         """
-        # Check if Newspaper3k is available
-        if not NEWSPAPER_AVAILABLE:
-            return self._extract_article_fallback(url)
-            
+        # Download the page once through the shared session; both extraction paths reuse it
         try:
-            # Configure article
-            article = Article(url)
-            article.headers = self.headers
-            
-            # Download and parse
-            article.download()
-            article.parse()
+            response = self._get(url)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.error(f"Error fetching article {url}: {e}")
+            raise ScraperException(f"Failed to fetch article {url}: {e}")
+        return self.parse_article_html(url, response.content, response.encoding)
+    
+    def parse_article_html(self, url: str, html: Union[bytes, str], encoding: Optional[str] = None) -> Dict:
+        """
+        Extract article content from already downloaded HTML with the scraper's
+        extractor, in the extraction process pool.
+        
+        Args:
+            url: URL of the article
+            html: Page HTML as downloaded
+            encoding: Encoding reported by the server, if any
             
-            # Extract metadata
-            result = {
-                'title': article.title,
-                'text': article.text,
-                'authors': article.authors,
-                'publish_date': article.publish_date,
-                'top_image': article.top_image,
-                'images': list(article.images),
-            }
+        Returns:
+            Dict: Article data including title, text, publish date, and top image
             
-            # Try to extract more data if NLP is available
-            try:
-                article.nlp()
-                result.update({
-                    'summary': article.summary,
-                    'keywords': article.keywords,
-                })
-            except Exception as e:
-                self.logger.warning(f"NLP extraction failed for {url}: {e}")
-                
-            return result
+        Raises:
+            ScraperException: If the article cannot be parsed
+        """
+        try:
+            return get_extraction_pool().run(self.extractor, url, html, encoding)
+        except ExtractionError as e:
+            raise ScraperException(str(e))
+    
+    def extract_article_contents(self, urls: List[str]) -> Dict[str, Union[Dict, ScraperException]]:
+        """
+        Extract the content of several articles concurrently with the asyncio
+        fetch engine, keeping to the per-host rate and concurrency limits.
+        
+        Args:
+            urls: URLs of the articles
             
-        except (ArticleException, ImportError) as e:
-            self.logger.error(f"Error extracting article content from {url}: {e}")
-            # Try the fallback method if Newspaper3k fails
-            return self._extract_article_fallback(url)
+        Returns:
+            Dict mapping each URL to its article data, or to the ScraperException
+            raised while extracting it
+        """
+        # Imported here because the fetch engine itself builds on this module
+        from scrapers.async_fetcher import extract_articles
+        return extract_articles(self, urls)
     
-    def _extract_article_fallback(self, url: str) -> Dict:
+    def _extract_article_fallback(self, url: str, html: Optional[str] = None) -> Dict:
         """
         Fallback method to extract article content using BeautifulSoup when Newspaper3k is not available
         or fails.
         
         Args:
             url: URL of the article
+            html: Already downloaded page HTML, fetched from url if not given
             
         Returns:
             Dict: Article data extracted with BeautifulSoup
@@ -195,90 +292,13 @@ class BaseScraper(ABC):
             ScraperException: If the article cannot be parsed
         """
         try:
-            # Fetch the page
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # Extract data
-            title = soup.title.text.strip() if soup.title else ""
-            
-            # Try to find the main content using common patterns
-            main_content = None
-            for selector in ['article', 'main', '.article', '.story', '.content', '.post-content', '[itemprop="articleBody"]']:
-                content = soup.select(selector)
-                if content:
-                    main_content = content[0]
-                    break
-            
-            # Extract text from paragraphs
-            text = ""
-            if main_content:
-                paragraphs = main_content.find_all('p')
-                text = "\n\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
-            else:
-                # Fallback - get all paragraphs
-                paragraphs = soup.find_all('p')
-                text = "\n\n".join([p.text.strip() for p in paragraphs if p.text.strip() and len(p.text.strip()) > 100])
-            
-            # Look for a meta description for a summary
-            summary = ""
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            if meta_desc and 'content' in meta_desc.attrs:
-                summary = meta_desc['content'].strip()
-            
-            # Try to find publish date
-            publish_date = None
-            date_meta = soup.find('meta', attrs={'property': 'article:published_time'})
-            if date_meta and 'content' in date_meta.attrs:
-                try:
-                    publish_date = date_meta['content']
-                except:
-                    pass
-            
-            # Extract images
-            images = []
-            main_image_url = ""
-            
-            # Look for og:image first
-            og_image = soup.find('meta', attrs={'property': 'og:image'})
-            if og_image and 'content' in og_image.attrs:
-                main_image_url = og_image['content']
-                images.append(main_image_url)
-            
-            # Collect other images
-            if main_content:
-                for img in main_content.find_all('img'):
-                    if 'src' in img.attrs:
-                        img_url = img['src']
-                        if img_url not in images:
-                            images.append(img_url)
-            
-            # Find author
-            authors = []
-            author_meta = soup.find('meta', attrs={'name': 'author'})
-            if author_meta and 'content' in author_meta.attrs:
-                authors.append(author_meta['content'])
-            
-            # Alternative author methods
-            if not authors:
-                author_elem = soup.select('.author, .byline, [rel="author"]')
-                if author_elem:
-                    authors = [author.text.strip() for author in author_elem if author.text.strip()]
-            
-            return {
-                'title': title,
-                'text': text,
-                'summary': summary,
-                'authors': authors,
-                'publish_date': publish_date,
-                'top_image': main_image_url,
-                'images': images,
-            }
-            
-        except Exception as e:
+            # Fetch the page unless the caller already has it
+            if html is None:
+                response = self._get(url)
+                response.raise_for_status()
+                html = response.text
+            return extract_article_fallback(url, html)
+        except (requests.RequestException, ExtractionError) as e:
             self.logger.error(f"Fallback extraction failed for {url}: {e}")
             raise ScraperException(f"Failed to extract article content from {url}: {e}")
     
@@ -293,96 +313,164 @@ class BaseScraper(ABC):
         Returns:
             Topic key (e.g., "business", "science", etc.)
         """
-        text = (title + " " + content).lower()
+        with metrics.timed("classify_seconds"):
+            return topic_classifier.classify(title, content)
+    
+    def classify_topics(self, items: List[Tuple[str, str]]) -> List[str]:
+        """
+        Classify a batch of articles into the predefined topics in one pass.
         
-        # Count weighted keyword matches for each topic
-        topic_scores = {}
-        for topic_key, topic_data in TOPICS.items():
-            score = 0
-            # Title matches are worth more
-            for keyword in topic_data["keywords"]:
-                keyword = keyword.lower()
-                if keyword in title.lower():
-                    score += 2
-                if keyword in content.lower():
-                    score += 1
-            topic_scores[topic_key] = score * topic_data.get("probability", 1.0)
+        Args:
+            items: (title, content) pairs
+            
+        Returns:
+            List of topic keys, in the same order as items
+        """
+        with metrics.timed("classify_seconds"):
+            return topic_classifier.classify_many(items)
+    
+    def normalize_entry(self, entry: Dict) -> Tuple[str, str]:
+        """
+        Get the plain text summary of an RSS entry and the first image in its
+        summary HTML, parsing the HTML once.
         
-        # Get topic with highest score
-        max_topic = max(topic_scores.items(), key=lambda x: x[1])[0]
-        return max_topic
+        Args:
+            entry: A feedparser entry
+            
+        Returns:
+            (summary, image URL); the image URL is empty if the summary has no image
+        """
+        markup = entry.get('summary') or entry.get('description') or ''
+        if not markup:
+            for content in entry.get('content') or []:
+                if content.get('value'):
+                    markup = content['value']
+                    break
+        with metrics.timed("parse_seconds", parser="entry"):
+            text, image_url = normalize_entry_html(markup)
+        # Feeds often escape entities twice; decode what is left after parsing
+        return html.unescape(text), image_url
     
-    def save_articles_to_cache(self, articles: List[Dict]) -> None:
+    def selected_feeds(self, feeds: Dict[str, str]) -> List[Tuple[str, str]]:
         """
-        Save scraped articles to cache file with TTL.
+        Pick the feeds to read this run.
         
         Args:
-            articles: List of article dictionaries
+            feeds: Feed URLs by name
+            
+        Returns:
+            (name, URL) pairs of the feeds in `only_feeds`, or of all feeds if it isn't set
+        """
+        return [(name, url) for name, url in feeds.items() if self.only_feeds is None or name in self.only_feeds]
+    
+    def reads_all_feeds(self, feeds: Dict[str, str]) -> bool:
         """
-        existing_articles = []
-        current_time = datetime.now()
+        Check whether this run reads every feed, rather than just the ones the
+        scheduler found stale.
         
-        # Load and clean existing cache
-        if os.path.exists(ARTICLES_CACHE_FILE):
-            try:
-                with open(ARTICLES_CACHE_FILE, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    # Filter out expired articles
-                    for article in cache_data:
-                        cached_time = datetime.fromisoformat(article.get('cached_time', '2000-01-01'))
-                        if current_time - cached_time < timedelta(days=self.CACHE_TTL_DAYS):
-                            existing_articles.append(article)
-            except json.JSONDecodeError:
-                self.logger.warning("Cache file corrupted, starting fresh")
-                existing_articles = []
+        Args:
+            feeds: Feed URLs by name
+            
+        Returns:
+            bool: True if no feed is left out by `only_feeds`
+        """
+        return len(self.selected_feeds(feeds)) == len(feeds)
+    
+    def is_known(self, url: str) -> bool:
+        """
+        Check whether an article is already stored, so its entry can be skipped.
         
-        # Add new articles with timestamp
-        existing_urls = {article.get('url') for article in existing_articles}
-        for article in articles:
-            if article.get('url') not in existing_urls:
-                article['cached_time'] = current_time.isoformat()
-                existing_articles.append(article)
+        Args:
+            url: URL of the article
+            
+        Returns:
+            bool: True if the URL is in `skip_urls`
+        """
+        if url in self.skip_urls:
+            metrics.inc("ingest_known_urls_skipped_total")
+            return True
+        return False
+    
+    def entry_story(self, entry: Dict) -> Tuple[str, str]:
+        """
+        Get the title and summary text of an RSS entry, normalized as every RSS
+        scraper stores them and as near-duplicate signatures are built from them.
+        
+        Args:
+            entry: A feedparser entry
+            
+        Returns:
+            (title, summary)
+        """
+        return html.unescape(entry.get('title', '')), self.normalize_entry(entry)[0]
+    
+    def is_near_duplicate(self, url: str, title: str, summary: str = "") -> bool:
+        """
+        Check whether a story is a copy of one already ingested under another URL,
+        so it can be skipped before its page is downloaded and extracted.
+        
+        Args:
+            url: URL of the story
+            title: Title of the story
+            summary: Summary of the story
+            
+        Returns:
+            bool: True if the story is a near-duplicate
+        """
+        if self.duplicates is None:
+            return False
+        canonical = self.duplicates.match(title, summary)
+        if canonical is not None and canonical != url:
+            self.logger.debug(f"Skipping {url}, a copy of {canonical}")
+            return True
+        return False
+    
+    def save_articles_to_cache(self, articles: List[Article]) -> None:
+        """
+        Save scraped articles to the article store and drop expired ones.
         
-        # Save updated cache
+        Args:
+            articles: List of articles
+        """
         try:
-            with open(ARTICLES_CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(existing_articles, f, indent=4)
-        except IOError as e:
+            get_article_store().write_batch(articles, self.CACHE_TTL_DAYS)
+        except sqlite3.Error as e:
             self.logger.error(f"Failed to save cache: {e}")
     
-    def load_cached_articles(self) -> List[Dict]:
+    def load_cached_articles(self) -> List[Article]:
         """
-        Load non-expired articles from cache file.
+        Load non-expired articles from the article store.
         
         Returns:
-            List of article dictionaries
+            List of articles
         """
-        if not os.path.exists(ARTICLES_CACHE_FILE):
-            return []
-        
         try:
-            current_time = datetime.now()
-            with open(ARTICLES_CACHE_FILE, 'r', encoding='utf-8') as f:
-                articles = json.load(f)
-                # Filter out expired articles
-                return [
-                    article for article in articles
-                    if current_time - datetime.fromisoformat(article.get('cached_time', '2000-01-01'))
-                    < timedelta(days=self.CACHE_TTL_DAYS)
-                ]
-        except (json.JSONDecodeError, IOError) as e:
+            return get_article_store().load_articles(self.CACHE_TTL_DAYS)
+        except sqlite3.Error as e:
             self.logger.error(f"Failed to load cache: {e}")
             return []
     
-    @abstractmethod
-    def scrape_articles(self) -> List[Dict]:
+    def scrape_articles(self) -> List[Article]:
         """
         Scrape articles from the news source.
         
         Returns:
-            List of article dictionaries
+            List of articles
+            
+        Raises:
+            ScraperException: If scraping fails
+        """
+        return list(self.iter_articles())
+    
+    @abstractmethod
+    def iter_articles(self) -> Iterator[Article]:
+        """
+        Scrape articles from the news source incrementally.
+        
+        Yields:
+            Articles as soon as each one is extracted
             
         Raises:
             ScraperException: If scraping fails
         """
-        pass 
\ No newline at end of file
+        pass
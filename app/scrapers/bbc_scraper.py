@@ -1,13 +1,13 @@
 """
 Scraper for BBC News.
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import datetime
 import html
-from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
 from utils.config import NEWS_SOURCES
+from utils.article import Article
 
 
 class BBCScraper(BaseScraper):
@@ -21,18 +21,18 @@ class BBCScraper(BaseScraper):
         super().__init__(source_config["name"], source_config["base_url"])
         self.rss_feeds = source_config.get("rss_feeds", {})
     
-    def scrape_articles(self) -> List[Dict]:
+    def iter_articles(self) -> Iterator[Article]:
         """
         Scrape articles from BBC News using RSS feeds.
         
-        Returns:
-            List of article dictionaries
+        Yields:
+            Articles as soon as each one is extracted
         """
-        articles = []
         
         # Iterate through the RSS feeds
-        for category, feed_url in self.rss_feeds.items():
+        for category, feed_url in self.selected_feeds(self.rss_feeds):
             entries = self.fetch_rss_feed(feed_url)
+            self.fetched_feeds.add(category)
             
             if not entries:
                 print(f"No entries found for {category} feed")
@@ -45,19 +45,19 @@ class BBCScraper(BaseScraper):
                     title = entry.get('title', '')
                     article_url = entry.get('link', '')
                     
-                    # Extract summary/content
-                    summary = ''
-                    if 'summary' in entry:
-                        # Clean up HTML tags in summary
-                        soup = BeautifulSoup(entry.summary, 'lxml')
-                        summary = soup.get_text().strip()
-                    elif 'description' in entry:
-                        soup = BeautifulSoup(entry.description, 'lxml')
-                        summary = soup.get_text().strip()
+                    # Skip articles already stored
+                    if self.is_known(article_url):
+                        continue
+                    
+                    # Extract summary/content, and any image in it, in one pass
+                    summary, summary_image_url = self.normalize_entry(entry)
                     
                     # Decode HTML entities
                     title = html.unescape(title)
-                    summary = html.unescape(summary)
+                    
+                    # Skip stories already ingested from another source
+                    if self.is_near_duplicate(article_url, title, summary):
+                        continue
                     
                     # Extract published date if available
                     published_date = None
@@ -81,34 +81,26 @@ class BBCScraper(BaseScraper):
                                 break
                     
                     # Try to find an image in the summary
-                    if not image_url and summary:
-                        soup = BeautifulSoup(summary, 'lxml')
-                        img_tag = soup.find('img')
-                        if img_tag and img_tag.has_attr('src'):
-                            image_url = img_tag['src']
+                    if not image_url:
+                        image_url = summary_image_url
                     
                     # Classify topic
                     topic = self.classify_topic(title, summary)
                     
                     # Create article data
-                    article_data = {
-                        "title": title,
-                        "url": article_url,
-                        "summary": summary,
-                        "image_url": image_url,
-                        "source": self.source_name,
-                        "topic": topic,
-                        "category": category,
-                        "scraped_date": datetime.datetime.now().strftime("%Y-%m-%d"),
-                        "published_date": published_date
-                    }
+                    article_data = Article(
+                        title=title,
+                        url=article_url,
+                        summary=summary,
+                        image_url=image_url,
+                        source=self.source_name,
+                        topic=topic,
+                        category=category,
+                        scraped_date=datetime.datetime.now().strftime("%Y-%m-%d"),
+                        published_date=published_date
+                    )
                     
-                    articles.append(article_data)
+                    yield article_data
                     
                 except Exception as e:
                     print(f"Error extracting article data from BBC RSS: {e}")
-        
-        # Save articles to cache
-        self.save_articles_to_cache(articles)
-        
-        return articles 
\ No newline at end of file
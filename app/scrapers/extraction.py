@@ -0,0 +1,396 @@
+"""
+CPU-bound article extraction, run in a pool of worker processes.
+
+Parsing HTML with lxml, BeautifulSoup and Newspaper3k holds the GIL, so
+extracting articles in threads stays on a single core. The functions here take
+the raw HTML bytes of a downloaded page and return a compact article record.
+They are module-level and free of shared state so they can be sent to a
+ProcessPoolExecutor, which lets a refresh use every core.
+"""
+import datetime
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup
+
+from utils.config import EXTRACTION_SETTINGS
+from utils.metrics import metrics
+
+logger = logging.getLogger("extraction")
+
+# Most images kept per article record; pages often reference dozens of icons
+MAX_IMAGES = 10
+
+# (Article, ArticleException) from newspaper3k once imported, False if it isn't available
+_newspaper = None
+_newspaper_lock = threading.Lock()
+
+
+def load_newspaper() -> Optional[Tuple[type, type]]:
+    """
+    Import Newspaper3k on first use.
+    
+    Importing newspaper pulls in nltk and the lxml cleaners, which takes long
+    enough to delay the app's first frame noticeably, so it is only imported
+    once an article actually needs extracting.
+    
+    Returns:
+        (Article, ArticleException) or None if newspaper3k or its dependencies
+        are not available
+    """
+    global _newspaper
+    if _newspaper is None:
+        with _newspaper_lock:
+            if _newspaper is None:
+                try:
+                    from newspaper import Article, ArticleException
+                    _newspaper = (Article, ArticleException)
+                except ImportError:
+                    _newspaper = False
+    return _newspaper or None
+
+
+class ExtractionError(Exception):
+    """Raised when no article can be extracted from a page."""
+    pass
+
+
+def decode_html(html: Union[bytes, str], encoding: Optional[str] = None) -> str:
+    """
+    Decode raw page bytes.
+    
+    Args:
+        html: Page HTML as downloaded
+        encoding: Encoding reported by the server, if any
+        
+    Returns:
+        str: The decoded HTML
+    """
+    if isinstance(html, str):
+        return html
+    return html.decode(encoding or "utf-8", errors="replace")
+
+
+def extract_article(url: str, html: Union[bytes, str], encoding: Optional[str] = None) -> Dict:
+    """
+    Extract article content using Newspaper3k if available, or fallback to a simple
+    BeautifulSoup based extraction.
+    
+    Args:
+        url: URL of the article
+        html: Page HTML as downloaded
+        encoding: Encoding reported by the server, if any
+        
+    Returns:
+        Dict: Article data including title, text, publish date, and top image
+        
+    Raises:
+        ExtractionError: If the article cannot be parsed
+    """
+    html = decode_html(html, encoding)
+    
+    # Check if Newspaper3k is available
+    newspaper = load_newspaper()
+    if newspaper is None:
+        return extract_article_fallback(url, html)
+    Article, ArticleException = newspaper
+    
+    try:
+        # Parse the downloaded HTML
+        article = Article(url)
+        with metrics.timed("parse_seconds", parser="newspaper"):
+            article.download(input_html=html)
+            article.parse()
+        
+        # Extract metadata
+        result = {
+            'title': article.title,
+            'text': article.text,
+            'authors': article.authors,
+            'publish_date': article.publish_date,
+            'top_image': article.top_image,
+            'images': list(article.images),
+        }
+        
+        # Try to extract more data if NLP is available
+        try:
+            with metrics.timed("parse_seconds", parser="newspaper"):
+                article.nlp()
+            result.update({
+                'summary': article.summary,
+                'keywords': article.keywords,
+            })
+        except Exception as e:
+            logger.warning(f"NLP extraction failed for {url}: {e}")
+        
+        return _compact(result)
+    
+    except (ArticleException, ImportError) as e:
+        logger.error(f"Error extracting article content from {url}: {e}")
+        # Try the fallback method if Newspaper3k fails
+        return extract_article_fallback(url, html)
+
+
+def extract_article_fallback(url: str, html: Union[bytes, str], encoding: Optional[str] = None) -> Dict:
+    """
+    Fallback method to extract article content using BeautifulSoup when Newspaper3k is not available
+    or fails.
+    
+    Args:
+        url: URL of the article
+        html: Page HTML as downloaded
+        encoding: Encoding reported by the server, if any
+        
+    Returns:
+        Dict: Article data extracted with BeautifulSoup
+        
+    Raises:
+        ExtractionError: If the article cannot be parsed
+    """
+    started = time.perf_counter()
+    try:
+        html = decode_html(html, encoding)
+        
+        # Parse HTML
+        soup = BeautifulSoup(html, 'lxml')
+        
+        # Extract data
+        title = soup.title.text.strip() if soup.title else ""
+        
+        # Try to find the main content using common patterns
+        main_content = None
+        for selector in ['article', 'main', '.article', '.story', '.content', '.post-content', '[itemprop="articleBody"]']:
+            content = soup.select(selector)
+            if content:
+                main_content = content[0]
+                break
+        
+        # Extract text from paragraphs
+        text = ""
+        if main_content:
+            paragraphs = main_content.find_all('p')
+            text = "\n\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
+        else:
+            # Fallback - get all paragraphs
+            paragraphs = soup.find_all('p')
+            text = "\n\n".join([p.text.strip() for p in paragraphs if p.text.strip() and len(p.text.strip()) > 100])
+        
+        # Look for a meta description for a summary
+        summary = ""
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        if meta_desc and 'content' in meta_desc.attrs:
+            summary = meta_desc['content'].strip()
+        
+        # Try to find publish date
+        publish_date = None
+        date_meta = soup.find('meta', attrs={'property': 'article:published_time'})
+        if date_meta and 'content' in date_meta.attrs:
+            try:
+                publish_date = date_meta['content']
+            except:
+                pass
+        
+        # Extract images
+        images = []
+        main_image_url = ""
+        
+        # Look for og:image first
+        og_image = soup.find('meta', attrs={'property': 'og:image'})
+        if og_image and 'content' in og_image.attrs:
+            main_image_url = og_image['content']
+            images.append(main_image_url)
+        
+        # Collect other images
+        if main_content:
+            for img in main_content.find_all('img'):
+                if 'src' in img.attrs:
+                    img_url = img['src']
+                    if img_url not in images:
+                        images.append(img_url)
+        
+        # Find author
+        authors = []
+        author_meta = soup.find('meta', attrs={'name': 'author'})
+        if author_meta and 'content' in author_meta.attrs:
+            authors.append(author_meta['content'])
+        
+        # Alternative author methods
+        if not authors:
+            author_elem = soup.select('.author, .byline, [rel="author"]')
+            if author_elem:
+                authors = [author.text.strip() for author in author_elem if author.text.strip()]
+        
+        return {
+            'title': title,
+            'text': text,
+            'summary': summary,
+            'authors': authors,
+            'publish_date': publish_date,
+            'top_image': main_image_url,
+            'images': images[:MAX_IMAGES],
+        }
+        
+    except Exception as e:
+        logger.error(f"Fallback extraction failed for {url}: {e}")
+        raise ExtractionError(f"Failed to extract article content from {url}: {e}")
+    finally:
+        metrics.observe("parse_seconds", time.perf_counter() - started, parser="beautifulsoup")
+
+
+def _compact(result: Dict) -> Dict:
+    """Shrink an article record before it is sent back to the parent process."""
+    if isinstance(result.get('publish_date'), datetime.datetime):
+        result['publish_date'] = result['publish_date'].isoformat()
+    result['images'] = result.get('images', [])[:MAX_IMAGES]
+    return result
+
+
+def _run_measured(func: Callable, url: str, html: Union[bytes, str], encoding: Optional[str]):
+    """
+    Run an extraction function in a worker process and hand back the metrics it
+    recorded there along with its outcome.
+    
+    Returns:
+        (result, exception, metrics snapshot); exception is None on success
+    """
+    try:
+        return func(url, html, encoding), None, metrics.drain()
+    except Exception as e:
+        return None, e, metrics.drain()
+
+
+class ExtractionPool:
+    """
+    Process pool running extraction functions on raw page HTML.
+    
+    The worker processes are started on first use and reused afterwards. They
+    are spawned rather than forked, since forking a process that runs threads
+    can copy locks held by those threads. With `workers` set to 0, extraction runs inline instead.
+    
+    Metrics the extraction functions record in a worker are sent back with each
+    result and added to the parent's registry.
+    """
+    
+    def __init__(self, workers: Optional[int] = EXTRACTION_SETTINGS["workers"]):
+        """
+        Initialize the pool.
+        
+        Args:
+            workers: Number of worker processes, None for one per CPU core,
+                0 to extract in the calling thread
+        """
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the process pool, starting it on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+        return self._executor
+    
+    def submit(self, func: Callable, url: str, html: Union[bytes, str], encoding: Optional[str] = None) -> Future:
+        """
+        Schedule an extraction.
+        
+        Args:
+            func: Module-level extraction function, called as func(url, html, encoding)
+            url: URL of the article
+            html: Page HTML as downloaded
+            encoding: Encoding reported by the server, if any
+            
+        Returns:
+            Future: Resolves to the function's result
+        """
+        started = time.perf_counter()
+        extractor = getattr(func, "__name__", "extractor")
+        if self.workers == 0:
+            future = Future()
+            try:
+                future.set_result(func(url, html, encoding))
+            except Exception as e:
+                future.set_exception(e)
+            metrics.observe("extract_seconds", time.perf_counter() - started, extractor=extractor)
+            return future
+        
+        try:
+            measured = self._get_executor().submit(_run_measured, func, url, html, encoding)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool once
+            logger.warning("Extraction pool broke, restarting it")
+            with self._lock:
+                self._executor = None
+            measured = self._get_executor().submit(_run_measured, func, url, html, encoding)
+        
+        future = Future()
+        
+        def finish(done: Future) -> None:
+            metrics.observe("extract_seconds", time.perf_counter() - started, extractor=extractor)
+            if done.cancelled():
+                future.cancel()
+                return
+            if done.exception() is not None:
+                future.set_exception(done.exception())
+                return
+            result, error, recorded = done.result()
+            metrics.merge(recorded)
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        
+        # Cancelling the caller's future cancels the extraction if it hasn't started
+        future.add_done_callback(lambda f: measured.cancel() if f.cancelled() else None)
+        measured.add_done_callback(finish)
+        return future
+    
+    def run(self, func: Callable, url: str, html: Union[bytes, str], encoding: Optional[str] = None):
+        """
+        Run an extraction and wait for its result.
+        
+        Args:
+            func: Module-level extraction function, called as func(url, html, encoding)
+            url: URL of the article
+            html: Page HTML as downloaded
+            encoding: Encoding reported by the server, if any
+            
+        Returns:
+            The function's result
+        """
+        return self.submit(func, url, html, encoding).result()
+    
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_pool: Optional[ExtractionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """
+    Get the shared extraction pool.
+    
+    Returns:
+        ExtractionPool: The process-wide pool
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ExtractionPool()
+    return _pool
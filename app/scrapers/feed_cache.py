@@ -0,0 +1,157 @@
+"""
+Store of RSS feed validators (ETag / Last-Modified) and the entries they cover.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import feedparser
+
+from utils.config import FEED_CACHE_DIR
+from utils.metrics import metrics
+
+
+class FeedCache:
+    """
+    Remembers the validators and parsed entries of every feed fetched, so a
+    later poll can send a conditional GET and reuse the entries on a 304.
+    
+    Each feed is stored in its own JSON file under FEED_CACHE_DIR, and the most
+    recent copy is also kept in memory so repeat polls in the same process don't
+    touch the disk at all.
+    """
+    
+    def __init__(self, cache_dir: str = FEED_CACHE_DIR):
+        """
+        Initialize the feed cache.
+        
+        Args:
+            cache_dir: Directory holding one JSON file per feed
+        """
+        self.cache_dir = cache_dir
+        self.logger = logging.getLogger("feed_cache")
+        self._memory: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _path(self, feed_url: str) -> str:
+        """Return the file path used to store a feed."""
+        digest = hashlib.sha1(feed_url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    def _load(self, feed_url: str) -> Optional[Dict]:
+        """Load the stored record for a feed from memory or disk."""
+        record = self._memory.get(feed_url)
+        if record is not None:
+            return record
+        
+        path = self._path(feed_url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.warning(f"Ignoring unreadable feed cache for {feed_url}: {e}")
+            return None
+        
+        record["entries"] = [_to_feed_dict(entry) for entry in record.get("entries", [])]
+        with self._lock:
+            self._memory[feed_url] = record
+        return record
+    
+    def validators(self, feed_url: str) -> Dict[str, str]:
+        """
+        Build the conditional request headers for a feed.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            
+        Returns:
+            Dict: If-None-Match / If-Modified-Since headers, empty if nothing is stored
+        """
+        record = self._load(feed_url)
+        if not record or not record.get("entries"):
+            return {}
+        
+        headers = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("modified"):
+            headers["If-Modified-Since"] = record["modified"]
+        return headers
+    
+    def get_entries(self, feed_url: str) -> List[Dict]:
+        """
+        Get the entries stored for a feed.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            
+        Returns:
+            List of feed entries, empty if nothing is stored
+        """
+        record = self._load(feed_url)
+        entries = record.get("entries", []) if record else []
+        # Only called for unchanged feeds, so finding the entries is a hit
+        metrics.inc("cache_requests_total", cache="feed", result="hit" if entries else "miss")
+        return entries
+    
+    def store(self, feed_url: str, etag: Optional[str], modified: Optional[str], entries: List[Dict]) -> None:
+        """
+        Store the validators and parsed entries of a freshly downloaded feed.
+        
+        Args:
+            feed_url: URL of the RSS feed
+            etag: ETag response header, if any
+            modified: Last-Modified response header, if any
+            entries: Entries parsed from the feed
+        """
+        metrics.inc("cache_requests_total", cache="feed", result="miss")
+        record = {
+            "url": feed_url,
+            "etag": etag,
+            "modified": modified,
+            "fetched_time": time.time(),
+            "entries": list(entries)
+        }
+        with self._lock:
+            self._memory[feed_url] = record
+        
+        # Write to a temporary file first so a crash never leaves a torn cache file
+        path = self._path(feed_url)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(record, f, default=str)
+            os.replace(tmp_path, path)
+        except (IOError, TypeError, ValueError) as e:
+            self.logger.error(f"Failed to save feed cache for {feed_url}: {e}")
+
+
+def _to_feed_dict(value):
+    """
+    Turn JSON-decoded entry data back into the feedparser structures scrapers expect.
+    
+    Dicts become FeedParserDicts (so attribute access like `entry.summary` works) and
+    `*_parsed` date lists become time.struct_time again.
+    """
+    if isinstance(value, dict):
+        result = feedparser.FeedParserDict()
+        for key, item in value.items():
+            if key.endswith("_parsed") and isinstance(item, list) and len(item) == 9:
+                result[key] = time.struct_time(item)
+            else:
+                result[key] = _to_feed_dict(item)
+        return result
+    if isinstance(value, list):
+        return [_to_feed_dict(item) for item in value]
+    return value
+
+
+# Shared by every scraper
+feed_cache = FeedCache()
@@ -1,70 +1,74 @@
 """
 Scraper for The Guardian articles.
 """
-import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict
-from .base_scraper import BaseScraper
+from typing import Dict, Iterator, Optional, Union
+from .base_scraper import BaseScraper, ScraperException
+from .extraction import decode_html
+from utils.article import Article
+from utils.config import NEWS_SOURCES
+from utils.metrics import metrics
+
+
+def extract_guardian_article(url: str, html: Union[bytes, str], encoding: Optional[str] = None) -> Optional[Dict]:
+    """Get the content of a specific article; runs in the extraction process pool."""
+    with metrics.timed("parse_seconds", parser="beautifulsoup"):
+        soup = BeautifulSoup(decode_html(html, encoding), 'html.parser')
+    
+    title = soup.find('h1')
+    if not title:
+        return None
+        
+    content = soup.find('div', class_='article-body-commercial-selector')
+    if not content:
+        return None
+        
+    # Remove unwanted elements
+    for element in content.find_all(['script', 'style', 'iframe']):
+        element.decompose()
+        
+    return {
+        'title': title.text.strip(),
+        'url': url,
+        'body': content.get_text().strip(),
+        'source': 'The Guardian'
+    }
+
 
 class GuardianScraper(BaseScraper):
     """Scraper for The Guardian articles."""
     
+    extractor = staticmethod(extract_guardian_article)
+    
     def __init__(self):
         super().__init__("guardian", "https://www.theguardian.com")
-        self.urls = {
-            "business": "https://www.theguardian.com/business",
-            "technology": "https://www.theguardian.com/technology",
-            "science": "https://www.theguardian.com/science",
-            "environment": "https://www.theguardian.com/environment",
-            "education": "https://www.theguardian.com/education",
-            "health": "https://www.theguardian.com/society/health"
-        }
+        self.urls = NEWS_SOURCES["guardian"]["sections"]
     
-    def scrape_articles(self) -> List[Dict]:
+    def iter_articles(self) -> Iterator[Article]:
         """Scrape articles from The Guardian."""
-        articles = []
-        for section, url in self.urls.items():
+        for section, url in self.selected_feeds(self.urls):
             try:
-                response = requests.get(url)
+                response = self._get(url)
+                response.raise_for_status()
+                self.fetched_feeds.add(section)
                 soup = BeautifulSoup(response.text, 'html.parser')
                 article_links = soup.find_all('a', class_='u-faux-block-link__overlay')
                 
-                for link in article_links[:5]:  # Limit to 5 articles per section
-                    article_url = link.get('href')
-                    if article_url and article_url.startswith('https://www.theguardian.com/'):
-                        article = self._get_article_content(article_url)
-                        if article:
-                            article['topic'] = section
-                            articles.append(article)
+                article_urls = [link.get('href') for link in article_links[:5]]  # Limit to 5 articles per section
+                article_urls = [
+                    u for u in article_urls
+                    if u and u.startswith('https://www.theguardian.com/') and not self.is_known(u)
+                ]
+                
+                # Download the section's articles concurrently and extract them in the process pool
+                contents = self.extract_article_contents(article_urls)
+                for article_url in article_urls:
+                    article = contents[article_url]
+                    if isinstance(article, ScraperException):
+                        print(f"Error getting Guardian article content: {str(article)}")
+                        continue
+                    if article:
+                        yield Article(topic=section, **article)
             except Exception as e:
                 print(f"Error scraping Guardian {section}: {str(e)}")
-                continue
-        return articles
-    
-    def _get_article_content(self, url: str) -> Dict:
-        """Get the content of a specific article."""
-        try:
-            response = requests.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            title = soup.find('h1')
-            if not title:
-                return None
-                
-            content = soup.find('div', class_='article-body-commercial-selector')
-            if not content:
-                return None
-                
-            # Remove unwanted elements
-            for element in content.find_all(['script', 'style', 'iframe']):
-                element.decompose()
-                
-            return {
-                'title': title.text.strip(),
-                'url': url,
-                'content': content.get_text().strip(),
-                'source': 'The Guardian'
-            }
-        except Exception as e:
-            print(f"Error getting Guardian article content: {str(e)}")
-            return None 
\ No newline at end of file
+                continue
\ No newline at end of file
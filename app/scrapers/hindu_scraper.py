@@ -1,13 +1,13 @@
 """
 Scraper for The Hindu.
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import datetime
 import html
-from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper
 from utils.config import NEWS_SOURCES
+from utils.article import Article
 
 
 class HinduScraper(BaseScraper):
@@ -21,22 +21,25 @@ class HinduScraper(BaseScraper):
         super().__init__(source_config["name"], source_config["base_url"])
         self.rss_feeds = source_config.get("rss_feeds", {})
     
-    def scrape_articles(self) -> List[Dict]:
+    def iter_articles(self) -> Iterator[Article]:
         """
         Scrape articles from The Hindu using RSS feeds.
         
-        Returns:
-            List of article dictionaries
+        Yields:
+            Articles as soon as each one is extracted
         """
-        articles = []
+        found_articles = False
         
         # Iterate through the RSS feeds
-        for category, feed_url in self.rss_feeds.items():
+        for category, feed_url in self.selected_feeds(self.rss_feeds):
             entries = self.fetch_rss_feed(feed_url)
+            self.fetched_feeds.add(category)
             
             if not entries:
                 print(f"No entries found for {category} feed")
                 continue
+            # The feed works, even if all its entries turn out to be stored already
+            found_articles = True
             
             # Process each entry from the feed
             for entry in entries[:15]:  # Limit to 15 articles per feed
@@ -45,19 +48,19 @@ class HinduScraper(BaseScraper):
                     title = entry.get('title', '')
                     article_url = entry.get('link', '')
                     
-                    # Extract summary/content
-                    summary = ''
-                    if 'summary' in entry:
-                        # Clean up HTML tags in summary
-                        soup = BeautifulSoup(entry.summary, 'lxml')
-                        summary = soup.get_text().strip()
-                    elif 'description' in entry:
-                        soup = BeautifulSoup(entry.description, 'lxml')
-                        summary = soup.get_text().strip()
+                    # Skip articles already stored
+                    if self.is_known(article_url):
+                        continue
+                    
+                    # Extract summary/content, and any image in it, in one pass
+                    summary, summary_image_url = self.normalize_entry(entry)
                     
                     # Decode HTML entities
                     title = html.unescape(title)
-                    summary = html.unescape(summary)
+                    
+                    # Skip stories already ingested from another source
+                    if self.is_near_duplicate(article_url, title, summary):
+                        continue
                     
                     # Extract published date if available
                     published_date = None
@@ -73,50 +76,43 @@ class HinduScraper(BaseScraper):
                                 break
                     
                     # Fallback - try to find image in the summary
-                    if not image_url and summary:
-                        soup = BeautifulSoup(summary, 'lxml')
-                        img_tag = soup.find('img')
-                        if img_tag and img_tag.has_attr('src'):
-                            image_url = img_tag['src']
+                    if not image_url:
+                        image_url = summary_image_url
                     
                     # Classify topic
                     topic = self.classify_topic(title, summary)
                     
                     # Create article data
-                    article_data = {
-                        "title": title,
-                        "url": article_url,
-                        "summary": summary,
-                        "image_url": image_url,
-                        "source": self.source_name,
-                        "topic": topic,
-                        "category": category,
-                        "scraped_date": datetime.datetime.now().strftime("%Y-%m-%d"),
-                        "published_date": published_date
-                    }
-                    
-                    articles.append(article_data)
+                    article_data = Article(
+                        title=title,
+                        url=article_url,
+                        summary=summary,
+                        image_url=image_url,
+                        source=self.source_name,
+                        topic=topic,
+                        category=category,
+                        scraped_date=datetime.datetime.now().strftime("%Y-%m-%d"),
+                        published_date=published_date
+                    )
+                    
+                    yield article_data
                     
                 except Exception as e:
                     print(f"Error extracting article data from The Hindu RSS: {e}")
         
-        # If RSS feeds didn't work, try to use the website scraping as a fallback
-        if not articles:
+        # If RSS feeds didn't work, try to use the website scraping as a fallback. A
+        # scheduled refresh of only some feeds leaves the website alone.
+        if not found_articles and self.reads_all_feeds(self.rss_feeds):
             print("Trying fallback method for The Hindu...")
-            articles = self._fallback_scrape()
-        
-        # Save articles to cache
-        self.save_articles_to_cache(articles)
-        
-        return articles
+            yield from self._fallback_scrape()
     
-    def _fallback_scrape(self) -> List[Dict]:
+    def _fallback_scrape(self) -> List[Article]:
         """
         Fallback method to scrape articles from The Hindu website directly.
         This is used only if RSS feeds don't work.
         
         Returns:
-            List of article dictionaries
+            List of articles
         """
         articles = []
         
@@ -152,6 +148,10 @@ class HinduScraper(BaseScraper):
                     if article_url and not article_url.startswith("http"):
                         article_url = self.base_url + article_url
                     
+                    # Skip articles already stored
+                    if self.is_known(article_url):
+                        continue
+                    
                     # Extract summary if available
                     summary_elem = article_elem.select_one("p.intro, h2.intro, div.summary")
                     summary = summary_elem.text.strip() if summary_elem else ""
@@ -166,16 +166,16 @@ class HinduScraper(BaseScraper):
                     topic = self.classify_topic(title, summary)
                     
                     # Create article data
-                    article_data = {
-                        "title": title,
-                        "url": article_url,
-                        "summary": summary,
-                        "image_url": image_url,
-                        "source": self.source_name,
-                        "topic": topic,
-                        "category": category,
-                        "scraped_date": datetime.datetime.now().strftime("%Y-%m-%d")
-                    }
+                    article_data = Article(
+                        title=title,
+                        url=article_url,
+                        summary=summary,
+                        image_url=image_url,
+                        source=self.source_name,
+                        topic=topic,
+                        category=category,
+                        scraped_date=datetime.datetime.now().strftime("%Y-%m-%d")
+                    )
                     
                     articles.append(article_data)
                     
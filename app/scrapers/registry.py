@@ -0,0 +1,202 @@
+"""
+Registry of the configured news sources, loading each source's scraper only when
+it is scraped.
+"""
+import importlib
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Type
+
+from utils.config import DEFAULT_REFRESH_MINUTES, NEWS_SOURCES
+
+
+@dataclass
+class SourceHealth:
+    """Outcome of the recent scrapes of one source."""
+    last_success: Optional[float] = None
+    last_failure: Optional[float] = None
+    last_error: str = ""
+    consecutive_failures: int = 0
+    last_article_count: int = 0
+
+
+class SourceRegistry:
+    """
+    The news sources from NEWS_SOURCES, keyed by source id.
+
+    A source's scraper module is imported the first time the source is scraped,
+    so a refresh limited to a few sources never imports the others. Disabled
+    sources are skipped. The registry also tracks each source's health: when it
+    last succeeded or failed, and how many articles it produced.
+    """
+
+    def __init__(self, sources: Dict = NEWS_SOURCES):
+        """
+        Initialize the registry.
+
+        Args:
+            sources: News source configuration (see utils.config.NEWS_SOURCES)
+        """
+        self.sources = sources
+        self.logger = logging.getLogger("source_registry")
+        self._classes: Dict[str, Type] = {}
+        self._health: Dict[str, SourceHealth] = {}
+        self._lock = threading.Lock()
+
+    def source_ids(self, include_disabled: bool = False) -> List[str]:
+        """
+        List the source ids in configuration order.
+
+        Args:
+            include_disabled: Also list sources switched off in the configuration
+
+        Returns:
+            List of source ids
+        """
+        return [
+            source_id for source_id, config in self.sources.items()
+            if include_disabled or config.get("enabled", True)
+        ]
+
+    def display_names(self) -> Dict[str, str]:
+        """
+        Get the display name of every enabled source.
+
+        Returns:
+            Dict mapping source id to display name
+        """
+        return {source_id: self.sources[source_id]["name"] for source_id in self.source_ids()}
+
+    def feed_names(self, source_id: str) -> List[str]:
+        """
+        List the feeds of a source: its RSS feeds, or the site sections it reads.
+
+        Args:
+            source_id: The source id
+
+        Returns:
+            List of feed names
+        """
+        config = self.sources[source_id]
+        return list(config.get("rss_feeds") or config.get("sections") or {})
+
+    def refresh_seconds(self, source_id: str, feed: str) -> float:
+        """
+        Get how old a feed may get before it is fetched again.
+
+        Args:
+            source_id: The source id
+            feed: The feed name
+
+        Returns:
+            float: The freshness target in seconds
+        """
+        config = self.sources[source_id]
+        minutes = config.get("feed_refresh_minutes", {}).get(feed, config.get("refresh_minutes", DEFAULT_REFRESH_MINUTES))
+        return minutes * 60
+
+    def scraper_class(self, source_id: str) -> Type:
+        """
+        Import and return the scraper class of a source.
+
+        Args:
+            source_id: The source id
+
+        Returns:
+            The scraper class
+
+        Raises:
+            KeyError: If the source isn't configured
+            ImportError: If the scraper can't be imported
+        """
+        cls = self._classes.get(source_id)
+        if cls is None:
+            module_name, _, class_name = self.sources[source_id]["scraper"].partition(":")
+            cls = getattr(importlib.import_module(module_name), class_name)
+            self._classes[source_id] = cls
+        return cls
+
+    def create_scraper(self, source_id: str):
+        """
+        Create the scraper of a source.
+
+        Args:
+            source_id: The source id
+
+        Returns:
+            BaseScraper: The scraper, with its source_id set
+        """
+        scraper = self.scraper_class(source_id)()
+        scraper.source_id = source_id
+        return scraper
+
+    def create_scrapers(self, source_ids: Optional[Iterable[str]] = None) -> List:
+        """
+        Create the scrapers of the enabled sources.
+
+        Args:
+            source_ids: Sources to create scrapers for, all enabled ones by default.
+                Unknown and disabled sources are skipped.
+
+        Returns:
+            List of scrapers, in configuration order
+        """
+        wanted = None if source_ids is None else set(source_ids)
+        scrapers = []
+        for source_id in self.source_ids():
+            if wanted is not None and source_id not in wanted:
+                continue
+            try:
+                scrapers.append(self.create_scraper(source_id))
+            except Exception as e:
+                # A source whose scraper can't even be loaded is reported like a failed scrape
+                self.logger.error(f"Could not load the scraper for {source_id}: {e}")
+                self.record_failure(source_id, f"Could not load scraper: {e}")
+        if wanted is not None:
+            for source_id in sorted(wanted - set(self.source_ids())):
+                self.logger.warning(f"Skipping unknown or disabled source {source_id}")
+        return scrapers
+
+    def record_success(self, source_id: str, article_count: int) -> None:
+        """
+        Record a completed scrape of a source.
+
+        Args:
+            source_id: The source id
+            article_count: Articles the scrape produced
+        """
+        with self._lock:
+            health = self._health.setdefault(source_id, SourceHealth())
+            health.last_success = time.time()
+            health.consecutive_failures = 0
+            health.last_article_count = article_count
+
+    def record_failure(self, source_id: str, error: str) -> None:
+        """
+        Record a failed scrape of a source.
+
+        Args:
+            source_id: The source id
+            error: What went wrong
+        """
+        with self._lock:
+            health = self._health.setdefault(source_id, SourceHealth())
+            health.last_failure = time.time()
+            health.last_error = error
+            health.consecutive_failures += 1
+
+    def health(self) -> Dict[str, Dict]:
+        """
+        Get the health of every source scraped so far.
+
+        Returns:
+            Dict mapping source id to its SourceHealth fields
+        """
+        with self._lock:
+            return {source_id: asdict(health) for source_id, health in self._health.items()}
+
+
+# Registry of the configured sources, shared by the ingest job and the UI
+source_registry = SourceRegistry()
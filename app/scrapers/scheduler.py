@@ -0,0 +1,80 @@
+"""
+Scheduler picking the feeds an ingest run fetches, from each feed's freshness target.
+"""
+import time
+from typing import Dict, List, Optional
+
+from utils.article_store import get_article_store
+from utils.config import FEED_RETRY_MINUTES
+from scrapers.registry import SourceRegistry, source_registry
+
+
+class FeedScheduler:
+    """
+    Tracks when each feed of each enabled source was last fetched, and calls a
+    feed stale once that is longer ago than the feed's freshness target (see
+    SourceRegistry.refresh_seconds). Wire feeds that change hourly are then
+    fetched hourly while slow feeds are left alone until they are due.
+
+    The fetch times live in the article store's feed_state table, so they survive
+    restarts and are shared by every process using the store. A feed that failed
+    is retried after FEED_RETRY_MINUTES rather than on every tick.
+    """
+
+    def __init__(self, registry: SourceRegistry = source_registry, retry_minutes: float = FEED_RETRY_MINUTES):
+        """
+        Initialize the scheduler.
+
+        Args:
+            registry: Registry of the sources to schedule
+            retry_minutes: Minutes to wait before retrying a failed feed
+        """
+        self.registry = registry
+        self.retry_seconds = retry_minutes * 60
+
+    def stale_feeds(self, now: Optional[float] = None) -> Dict[str, List[str]]:
+        """
+        Find the feeds that are due to be fetched.
+
+        Args:
+            now: Current time as a timestamp, defaults to time.time()
+
+        Returns:
+            Dict mapping source id to the names of its stale feeds; sources with
+            only fresh feeds are left out
+        """
+        now = time.time() if now is None else now
+        states = get_article_store().load_feed_states()
+        stale = {}
+        for source_id in self.registry.source_ids():
+            for feed in self.registry.feed_names(source_id):
+                state = states.get((source_id, feed))
+                if state is not None:
+                    refresh = self.registry.refresh_seconds(source_id, feed)
+                    if state["last_success"] is not None and now - state["last_success"] < refresh:
+                        continue
+                    if state["last_error"] and now - state["last_attempt"] < min(refresh, self.retry_seconds):
+                        continue
+                stale.setdefault(source_id, []).append(feed)
+        return stale
+
+    def record(self, scrapers: List, errors: Dict[str, str], now: Optional[float] = None) -> None:
+        """
+        Record which feeds a run fetched, after the scrapers have finished.
+
+        Args:
+            scrapers: The scrapers that ran, with their only_feeds and fetched_feeds
+            errors: Errors of the failed sources, by source name
+            now: Time of the run as a timestamp, defaults to time.time()
+        """
+        results = []
+        for scraper in scrapers:
+            feeds = self.registry.feed_names(scraper.source_id)
+            if scraper.only_feeds is not None:
+                feeds = [feed for feed in feeds if feed in scraper.only_feeds]
+            error = errors.get(scraper.source_name) or "Feed could not be read"
+            results += [
+                (scraper.source_id, feed, "" if feed in scraper.fetched_feeds else error)
+                for feed in feeds
+            ]
+        get_article_store().record_feed_results(results, time.time() if now is None else now)
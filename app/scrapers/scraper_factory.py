@@ -1,26 +1,27 @@
 """
 Factory for creating article scrapers.
 """
-from typing import List
+from typing import Iterable, List, Optional
 from .base_scraper import BaseScraper
-from .bbc_scraper import BBCScraper
-from .reuters_scraper import ReutersScraper
-from .guardian_scraper import GuardianScraper
-from .toi_scraper import TOIScraper
-from .hindu_scraper import HinduScraper
-from .telegraph_scraper import TelegraphScraper
+from .registry import source_registry
 
 class ScraperFactory:
     """Factory class for creating article scrapers."""
     
     @staticmethod
     def get_all_scrapers() -> List[BaseScraper]:
-        """Get all available scrapers with equal probability."""
-        return [
-            BBCScraper(),
-            ReutersScraper(),
-            GuardianScraper(),
-            TOIScraper(),
-            HinduScraper(),
-            TelegraphScraper()
-        ] 
\ No newline at end of file
+        """Get the scrapers of all enabled sources."""
+        return source_registry.create_scrapers()
+    
+    @staticmethod
+    def get_scrapers(source_ids: Optional[Iterable[str]] = None) -> List[BaseScraper]:
+        """
+        Get the scrapers of some sources, importing only their modules.
+        
+        Args:
+            source_ids: Source ids (keys of NEWS_SOURCES), all enabled sources if None
+            
+        Returns:
+            List[BaseScraper]: The scrapers of the enabled sources among them
+        """
+        return source_registry.create_scrapers(source_ids)
@@ -2,13 +2,13 @@
 Scraper for The Telegraph.
 """
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import datetime
 import html
-from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper, ScraperException
 from utils.config import NEWS_SOURCES
+from utils.article import Article
 
 
 class TelegraphScraper(BaseScraper):
@@ -22,26 +22,40 @@ class TelegraphScraper(BaseScraper):
         super().__init__(source_config["name"], source_config["base_url"])
         self.rss_feeds = source_config.get("rss_feeds", {})
     
-    def scrape_articles(self) -> List[Dict]:
+    def iter_articles(self) -> Iterator[Article]:
         """
         Scrape articles from The Telegraph using RSS feeds and Newspaper3k.
         
-        Returns:
-            List of article dictionaries
+        Yields:
+            Articles as soon as each one is extracted
         """
-        articles = []
+        found_articles = False
         
         # Iterate through the RSS feeds
-        for category, feed_url in self.rss_feeds.items():
+        for category, feed_url in self.selected_feeds(self.rss_feeds):
             try:
                 entries = self.fetch_rss_feed(feed_url)
+                self.fetched_feeds.add(category)
                 
                 if not entries:
                     self.logger.warning(f"No entries found for {category} feed")
                     continue
+                # The feed works, even if all its entries are skipped below
+                found_articles = True
+                
+                # Limit to 5 articles per feed for efficiency, skipping articles already stored
+                # and stories already ingested from another source
+                entries = [
+                    entry for entry in entries[:5]
+                    if not self.is_known(entry.get('link', ''))
+                    and not self.is_near_duplicate(entry.get('link', ''), *self.entry_story(entry))
+                ]
+                
+                # Download and extract the feed's articles concurrently
+                contents = self.extract_article_contents([entry.get('link', '') for entry in entries if entry.get('link')])
                 
                 # Process each entry from the feed
-                for entry in entries[:5]:  # Limit to 5 articles per feed for efficiency
+                for entry in entries:
                     try:
                         # Extract basic metadata from RSS
                         title = entry.get('title', '')
@@ -51,21 +65,19 @@ class TelegraphScraper(BaseScraper):
                         if not article_url:
                             continue
                         
-                        # Use Newspaper3k to extract detailed content
+                        # Use the content extracted with Newspaper3k
                         try:
-                            article_data = self.extract_article_content(article_url)
+                            article_data = contents[article_url]
+                            if isinstance(article_data, ScraperException):
+                                raise article_data
                             
                             # In case Newspaper3k failed to extract a title, use the one from RSS
                             if not article_data.get('title') and title:
                                 article_data['title'] = html.unescape(title)
                                 
                             # Extract summary from RSS if available and not in Newspaper3k data
-                            if 'summary' not in article_data and 'summary' in entry:
-                                soup = BeautifulSoup(entry.summary, 'lxml')
-                                article_data['summary'] = html.unescape(soup.get_text().strip())
-                            elif 'summary' not in article_data and 'description' in entry:
-                                soup = BeautifulSoup(entry.description, 'lxml')
-                                article_data['summary'] = html.unescape(soup.get_text().strip())
+                            if 'summary' not in article_data and ('summary' in entry or 'description' in entry):
+                                article_data['summary'] = self.normalize_entry(entry)[0]
                             
                             # Get content for classification
                             content_text = article_data.get('text', '')
@@ -77,41 +89,36 @@ class TelegraphScraper(BaseScraper):
                             # Classify topic
                             topic = self.classify_topic(title_text, content_text if content_text else summary_text)
                             
-                            # Create final article data
-                            final_article = {
-                                "title": title_text,
-                                "url": article_url,
-                                "summary": summary_text,
-                                "content": content_text,
-                                "image_url": article_data.get('top_image', ''),
-                                "images": article_data.get('images', []),
-                                "authors": article_data.get('authors', []),
-                                "publish_date": article_data.get('publish_date'),
-                                "keywords": article_data.get('keywords', []),
-                                "source": self.source_name,
-                                "topic": topic,
-                                "category": category,
-                                "scraped_date": datetime.datetime.now().isoformat()
-                            }
+                            # Keep the RSS title and summary the near-duplicate check used
+                            feed_title, feed_summary = self.entry_story(entry)
                             
-                            # Convert datetime objects to strings for JSON serialization
-                            if isinstance(final_article["publish_date"], datetime.datetime):
-                                final_article["publish_date"] = final_article["publish_date"].isoformat()
+                            # Create final article data
+                            final_article = Article(
+                                title=title_text,
+                                url=article_url,
+                                summary=summary_text,
+                                body=content_text,
+                                image_url=article_data.get('top_image', ''),
+                                images=article_data.get('images', []),
+                                authors=article_data.get('authors', []),
+                                published_date=article_data.get('publish_date'),
+                                keywords=article_data.get('keywords', []),
+                                source=self.source_name,
+                                topic=topic,
+                                category=category,
+                                scraped_date=datetime.datetime.now().isoformat(),
+                                feed_title=feed_title,
+                                feed_summary=feed_summary
+                            )
                             
-                            articles.append(final_article)
+                            yield final_article
                             
                         except ScraperException:
                             # If Newspaper3k extraction fails, fall back to basic RSS data
                             self.logger.warning(f"Newspaper extraction failed for {article_url}, using RSS data only")
                             
-                            # Extract summary from RSS
-                            summary = ''
-                            if 'summary' in entry:
-                                soup = BeautifulSoup(entry.summary, 'lxml')
-                                summary = html.unescape(soup.get_text().strip())
-                            elif 'description' in entry:
-                                soup = BeautifulSoup(entry.description, 'lxml')
-                                summary = html.unescape(soup.get_text().strip())
+                            # Extract summary from RSS, and any image in it, in one pass
+                            summary, summary_image_url = self.normalize_entry(entry)
                             
                             # Extract image URL if available
                             image_url = ""
@@ -127,11 +134,8 @@ class TelegraphScraper(BaseScraper):
                                         break
                             
                             # Fallback - try to find image in the summary
-                            if not image_url and summary:
-                                soup = BeautifulSoup(summary, 'lxml')
-                                img_tag = soup.find('img')
-                                if img_tag and img_tag.has_attr('src'):
-                                    image_url = img_tag['src']
+                            if not image_url:
+                                image_url = summary_image_url
                             
                             # Clean up title
                             title = html.unescape(title)
@@ -140,18 +144,18 @@ class TelegraphScraper(BaseScraper):
                             topic = self.classify_topic(title, summary)
                             
                             # Create article data with basic information
-                            article_data = {
-                                "title": title,
-                                "url": article_url,
-                                "summary": summary,
-                                "image_url": image_url,
-                                "source": self.source_name,
-                                "topic": topic,
-                                "category": category,
-                                "scraped_date": datetime.datetime.now().isoformat()
-                            }
+                            article_data = Article(
+                                title=title,
+                                url=article_url,
+                                summary=summary,
+                                image_url=image_url,
+                                source=self.source_name,
+                                topic=topic,
+                                category=category,
+                                scraped_date=datetime.datetime.now().isoformat()
+                            )
                             
-                            articles.append(article_data)
+                            yield article_data
                     
                     except Exception as e:
                         self.logger.error(f"Error extracting article data from Telegraph RSS: {str(e)}")
@@ -159,23 +163,19 @@ class TelegraphScraper(BaseScraper):
             except Exception as e:
                 self.logger.error(f"Error processing feed {feed_url}: {str(e)}")
         
-        # If RSS feeds didn't work, try to use the website scraping as a fallback
-        if not articles:
+        # If RSS feeds didn't work, try to use the website scraping as a fallback. A
+        # scheduled refresh of only some feeds leaves the website alone.
+        if not found_articles and self.reads_all_feeds(self.rss_feeds):
             self.logger.info("Trying fallback method for The Telegraph...")
-            articles = self._fallback_scrape()
-        
-        # Save articles to cache
-        self.save_articles_to_cache(articles)
-        
-        return articles
+            yield from self._fallback_scrape()
     
-    def _fallback_scrape(self) -> List[Dict]:
+    def _fallback_scrape(self) -> List[Article]:
         """
         Fallback method to scrape articles from The Telegraph website directly.
         This is used only if RSS feeds don't work.
         
         Returns:
-            List of article dictionaries
+            List of articles
         """
         articles = []
         
@@ -204,6 +204,10 @@ class TelegraphScraper(BaseScraper):
                             else:
                                 article_url = f"{self.base_url}/{article_url}"
                         
+                        # Skip articles already stored
+                        if self.is_known(article_url):
+                            continue
+                        
                         # Use Newspaper3k for content extraction
                         try:
                             article_data = self.extract_article_content(article_url)
@@ -223,25 +227,21 @@ class TelegraphScraper(BaseScraper):
                             topic = self.classify_topic(title_text, content_text if content_text else summary_text)
                             
                             # Create final article data
-                            final_article = {
-                                "title": title_text,
-                                "url": article_url,
-                                "summary": summary_text,
-                                "content": content_text,
-                                "image_url": article_data.get('top_image', ''),
-                                "images": article_data.get('images', []),
-                                "authors": article_data.get('authors', []),
-                                "publish_date": article_data.get('publish_date'),
-                                "keywords": article_data.get('keywords', []),
-                                "source": self.source_name,
-                                "topic": topic,
-                                "category": "general",
-                                "scraped_date": datetime.datetime.now().isoformat()
-                            }
-                            
-                            # Convert datetime objects to strings for JSON serialization
-                            if isinstance(final_article["publish_date"], datetime.datetime):
-                                final_article["publish_date"] = final_article["publish_date"].isoformat()
+                            final_article = Article(
+                                title=title_text,
+                                url=article_url,
+                                summary=summary_text,
+                                body=content_text,
+                                image_url=article_data.get('top_image', ''),
+                                images=article_data.get('images', []),
+                                authors=article_data.get('authors', []),
+                                published_date=article_data.get('publish_date'),
+                                keywords=article_data.get('keywords', []),
+                                source=self.source_name,
+                                topic=topic,
+                                category="general",
+                                scraped_date=datetime.datetime.now().isoformat()
+                            )
                             
                             articles.append(final_article)
                             
@@ -261,16 +261,16 @@ class TelegraphScraper(BaseScraper):
                             topic = self.classify_topic(title, summary)
                             
                             # Create article data with basic information
-                            article_data = {
-                                "title": title,
-                                "url": article_url,
-                                "summary": summary,
-                                "image_url": image_url,
-                                "source": self.source_name,
-                                "topic": topic,
-                                "category": "general",
-                                "scraped_date": datetime.datetime.now().isoformat()
-                            }
+                            article_data = Article(
+                                title=title,
+                                url=article_url,
+                                summary=summary,
+                                image_url=image_url,
+                                source=self.source_name,
+                                topic=topic,
+                                category="general",
+                                scraped_date=datetime.datetime.now().isoformat()
+                            )
                             
                             articles.append(article_data)
                     except Exception as e:
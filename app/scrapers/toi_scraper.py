@@ -1,39 +1,49 @@
 """
 Scraper for Times of India articles.
 """
-import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-from .base_scraper import BaseScraper
+from typing import List, Dict, Iterator, Optional, Union
+from .base_scraper import BaseScraper, ScraperException
+from .extraction import decode_html
+from utils.article import Article
+from utils.config import NEWS_SOURCES
+from utils.metrics import metrics
+
+
+def extract_toi_article(url: str, html: Union[bytes, str], encoding: Optional[str] = None) -> Optional[str]:
+    """Get the content of a specific article; runs in the extraction process pool."""
+    with metrics.timed("parse_seconds", parser="beautifulsoup"):
+        soup = BeautifulSoup(decode_html(html, encoding), 'html.parser')
+    content_div = soup.find('div', class_='_3WlLe')
+    if content_div:
+        # Remove unwanted elements
+        for element in content_div.find_all(['script', 'style', 'iframe']):
+            element.decompose()
+        return content_div.get_text(separator='\n', strip=True)
+    return None
+
 
 class TOIScraper(BaseScraper):
     """Scraper for Times of India articles."""
     
+    extractor = staticmethod(extract_toi_article)
+    
     def __init__(self):
         super().__init__("toi", "https://timesofindia.indiatimes.com")
-        self.article_url = "https://timesofindia.indiatimes.com/topic/{topic}"
+        self.sections = NEWS_SOURCES["toi"]["sections"]
         
-    def scrape_articles(self) -> List[Dict]:
+    def iter_articles(self) -> Iterator[Article]:
         """Scrape articles from Times of India."""
-        articles = []
         try:
             # Get articles from different sections
-            sections = [
-                "business",
-                "technology",
-                "science",
-                "environment",
-                "education",
-                "health"
-            ]
-            
-            for section in sections:
-                url = self.article_url.format(topic=section)
-                response = requests.get(url, headers=self.headers)
+            for section, url in self.selected_feeds(self.sections):
+                response = self._get(url)
                 if response.status_code == 200:
+                    self.fetched_feeds.add(section)
                     soup = BeautifulSoup(response.text, 'html.parser')
                     article_elements = soup.find_all('div', class_='uwU81')
                     
+                    links = []
                     for element in article_elements[:5]:  # Limit to 5 articles per section
                         try:
                             title_elem = element.find('div', class_='fHv_i')
@@ -44,41 +54,31 @@ class TOIScraper(BaseScraper):
                             link = element.find('a')['href']
                             if not link.startswith('http'):
                                 link = self.base_url + link
-                                
-                            # Get article content
-                            article_content = self._get_article_content(link)
-                            if not article_content:
+                            if self.is_known(link):
                                 continue
-                                
-                            articles.append({
-                                'title': title,
-                                'url': link,
-                                'source': self.source_name,
-                                'content': article_content,
-                                'topic': section
-                            })
+                            links.append((title, link))
                             
                         except Exception as e:
                             print(f"Error processing TOI article: {e}")
                             continue
+                    
+                    # Download the section's articles concurrently and extract them in the process pool
+                    contents = self.extract_article_contents([link for _, link in links])
+                    for title, link in links:
+                        article_content = contents[link]
+                        if isinstance(article_content, ScraperException):
+                            print(f"Error getting TOI article content: {article_content}")
+                            continue
+                        if not article_content:
+                            continue
+                            
+                        yield Article(
+                            title=title,
+                            url=link,
+                            source=self.source_name,
+                            body=article_content,
+                            topic=section
+                        )
                             
         except Exception as e:
-            print(f"Error scraping TOI: {e}")
-            
-        return articles
-        
-    def _get_article_content(self, url: str) -> Optional[str]:
-        """Get the content of a specific article."""
-        try:
-            response = requests.get(url, headers=self.headers)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                content_div = soup.find('div', class_='_3WlLe')
-                if content_div:
-                    # Remove unwanted elements
-                    for element in content_div.find_all(['script', 'style', 'iframe']):
-                        element.decompose()
-                    return content_div.get_text(separator='\n', strip=True)
-        except Exception as e:
-            print(f"Error getting TOI article content: {e}")
-        return None 
\ No newline at end of file
+            print(f"Error scraping TOI: {e}")
\ No newline at end of file
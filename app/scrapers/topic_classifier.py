@@ -0,0 +1,116 @@
+"""
+Keyword-based topic classifier compiled once from the configured topics.
+"""
+import re
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+from utils.config import TOPICS
+
+# Words are runs of letters and digits; everything else separates them
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class TopicClassifier:
+    """
+    Classifies articles into topics by matching topic keywords as whole words.
+
+    The keywords of all topics are compiled once into a token index that also
+    covers their plural forms. Classifying a text then takes a single tokenizing
+    pass and a set intersection against the index, however many topics and
+    keywords are configured. Because matching is on whole words, "market" matches
+    "markets" but not "supermarket", and "art" no longer matches "start".
+
+    Scoring follows the original rules: a keyword found in the title adds 2, found
+    in the content adds 1, each topic's total is weighted by its probability, and
+    ties go to the topic listed first in TOPICS.
+    """
+
+    def __init__(self, topics: Dict = TOPICS):
+        """
+        Build the classifier.
+
+        Args:
+            topics: Topic configuration (see utils.config.TOPICS)
+        """
+        self.topic_keys = list(topics.keys())
+        self.weights = [topics[key].get("probability", 1.0) for key in self.topic_keys]
+
+        # Map every accepted word form to the indexes of the topics it scores for
+        self.word_topics: Dict[str, Tuple[int, ...]] = {}
+        for index, key in enumerate(self.topic_keys):
+            for keyword in topics[key]["keywords"]:
+                for form in self._word_forms(keyword.lower()):
+                    topic_indexes = self.word_topics.get(form, ())
+                    if index not in topic_indexes:
+                        self.word_topics[form] = topic_indexes + (index,)
+        self.vocabulary: FrozenSet[str] = frozenset(self.word_topics)
+
+    @staticmethod
+    def _word_forms(keyword: str) -> List[str]:
+        """Return the singular and plural forms a keyword matches."""
+        forms = [keyword, keyword + "s", keyword + "es"]
+        if keyword.endswith("y"):
+            forms.append(keyword[:-1] + "ies")
+        return forms
+
+    def _matches(self, lowered_text: str) -> FrozenSet[str]:
+        """Return the keyword forms found in an already lower-cased text."""
+        return self.vocabulary.intersection(WORD_PATTERN.findall(lowered_text))
+
+    def _best_topic(self, title_hits: FrozenSet[str], content_hits: FrozenSet[str]) -> str:
+        """Score the matched keywords and return the winning topic key."""
+        scores = [0] * len(self.topic_keys)
+        for word in title_hits:
+            for index in self.word_topics[word]:
+                scores[index] += 2
+        for word in content_hits:
+            for index in self.word_topics[word]:
+                scores[index] += 1
+
+        best_index = 0
+        best_score = scores[0] * self.weights[0]
+        for index in range(1, len(scores)):
+            score = scores[index] * self.weights[index]
+            if score > best_score:
+                best_index, best_score = index, score
+        return self.topic_keys[best_index]
+
+    def classify(self, title: str, content: str) -> str:
+        """
+        Classify a single article.
+
+        Args:
+            title: Article title
+            content: Article content or summary
+
+        Returns:
+            Topic key (e.g., "business", "science", etc.)
+        """
+        return self._best_topic(
+            self._matches((title or "").lower()),
+            self._matches((content or "").lower())
+        )
+
+    def classify_many(self, items: Sequence[Tuple[str, str]]) -> List[str]:
+        """
+        Classify a batch of articles, such as a whole scraped feed.
+
+        Each text is tokenized and matched against the index exactly once, with
+        the lookups bound outside the loop.
+
+        Args:
+            items: (title, content) pairs
+
+        Returns:
+            List of topic keys, in the same order as items
+        """
+        matches = self._matches
+        best_topic = self._best_topic
+        return [
+            best_topic(matches((title or "").lower()), matches((content or "").lower()))
+            for title, content in items
+        ]
+
+
+# Shared classifier built from the configured topics
+topic_classifier = TopicClassifier()
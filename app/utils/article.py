@@ -0,0 +1,177 @@
+"""
+Typed record for a scraped article, shared by the scrapers and everything downstream.
+"""
+import datetime
+import sys
+import time
+from dataclasses import dataclass, field, fields
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+from utils.config import TOPICS
+
+
+def _intern(value: Optional[str]) -> str:
+    """Intern a string that many articles repeat, so they all share one copy."""
+    return sys.intern(value) if value else ""
+
+
+def normalize_date(value: Any) -> Optional[str]:
+    """
+    Convert a publication date as found in feeds and pages to an ISO 8601 string.
+
+    Args:
+        value: A datetime, a struct_time, an ISO or RFC 2822 date string, or None
+
+    Returns:
+        str or None: The date in ISO format, or the original string if it can't be parsed
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    if isinstance(value, time.struct_time):
+        return datetime.datetime(*value[:6]).isoformat()
+    value = str(value).strip()
+    try:
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+    except ValueError:
+        pass
+    try:
+        # RSS feeds use RFC 2822 dates, e.g. "Mon, 01 Jan 2024 10:00:00 GMT"
+        return parsedate_to_datetime(value).isoformat()
+    except (TypeError, ValueError):
+        return value
+
+
+@dataclass(slots=True, eq=False)
+class Article:
+    """
+    One scraped article.
+
+    Articles use __slots__, so the thousands kept in memory carry no per-instance
+    __dict__, and the strings every article of a source repeats (source,
+    source_key, topic, category) are interned. The body text is only held while
+    an article is being scraped: articles loaded from the article store leave
+    `body` unset, and `content` reads it from the store when it is needed.
+    """
+    url: str
+    title: str = ""
+    summary: str = ""
+    source: str = ""
+    source_key: str = ""
+    topic: str = ""
+    category: str = ""
+    image_url: str = ""
+    published_date: Optional[str] = None
+    scraped_date: str = ""
+    # When the article store cached the article, as a timestamp
+    cached_at: Optional[float] = None
+    authors: Tuple[str, ...] = ()
+    images: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
+    # URL of the canonical copy, if this is a syndicated copy of another story
+    duplicate_of: str = ""
+    # Title and summary text from the RSS entry, when the article's own come from
+    # its extracted page; near-duplicate signatures are built from the feed's
+    feed_title: str = ""
+    feed_summary: str = ""
+    body: Optional[str] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self.title = self.title or ""
+        self.summary = self.summary or ""
+        self.image_url = self.image_url or ""
+        self.source = _intern(self.source)
+        self.source_key = _intern(self.source_key)
+        self.topic = _intern(self.topic)
+        self.category = _intern(self.category)
+        self.scraped_date = self.scraped_date or ""
+        self.published_date = normalize_date(self.published_date)
+        self.authors = tuple(self.authors or ())
+        self.images = tuple(self.images or ())
+        self.keywords = tuple(self.keywords or ())
+        self.duplicate_of = self.duplicate_of or ""
+        self.feed_title = self.feed_title or ""
+        self.feed_summary = self.feed_summary or ""
+
+    @property
+    def cached_time(self) -> Optional[str]:
+        """The cache time as an ISO string, formatted only when it is displayed."""
+        return datetime.datetime.fromtimestamp(self.cached_at).isoformat() if self.cached_at is not None else None
+
+    def story_fields(self) -> Tuple[str, str]:
+        """
+        Get the title and summary the story is fingerprinted by: the feed's if
+        the article came with them, so a story matches the check a scraper made
+        against its RSS entry before extraction.
+        """
+        if self.feed_title:
+            return self.feed_title, self.feed_summary
+        return self.title, self.summary
+
+    @property
+    def content(self) -> str:
+        """The body text, read from the article store if it isn't held in memory."""
+        if self.body is not None:
+            return self.body
+        # Imported here because the store itself builds on this module
+        from utils.article_store import get_article_store
+        return get_article_store().load_content(self.url) or ""
+
+    @property
+    def topic_name(self) -> str:
+        """Display name of the article's topic."""
+        return TOPICS[self.topic]["name"] if self.topic in TOPICS else self.topic
+
+    @property
+    def published_at(self) -> Optional[datetime.datetime]:
+        """The publication date, if it is known and could be parsed."""
+        if not self.published_date:
+            return None
+        try:
+            return datetime.datetime.fromisoformat(self.published_date)
+        except ValueError:
+            return None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Article":
+        """
+        Build an article from a dictionary, such as a stored or legacy cache record.
+
+        Both `published_date` and the `publish_date` used by some scrapers are
+        accepted, `content` becomes the body, and unknown keys are ignored.
+
+        Args:
+            data: Article dictionary; needs a `url`
+
+        Returns:
+            Article: The article
+        """
+        values = {name: data[name] for name in _FIELD_NAMES if name in data}
+        if "published_date" not in values and "publish_date" in data:
+            values["published_date"] = data["publish_date"]
+        if "body" not in values and "content" in data:
+            values["body"] = data["content"]
+        return cls(**values)
+
+    def to_dict(self, include_body: bool = True) -> Dict:
+        """
+        Convert the article to a JSON-serializable dictionary.
+
+        Args:
+            include_body: Whether to include the body text as `content`, if held
+
+        Returns:
+            Dict: The article's fields
+        """
+        data = {name: getattr(self, name) for name in _FIELD_NAMES if name != "body"}
+        for name in ("authors", "images", "keywords"):
+            data[name] = list(data[name])
+        if include_body and self.body is not None:
+            data["content"] = self.body
+        return data
+
+
+_FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(Article))
+
@@ -0,0 +1,252 @@
+"""
+In-memory index of articles by topic and source for constant-time selection.
+"""
+import random
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from utils.article import Article
+
+
+class _Bucket:
+    """
+    Array of items with O(1) add, remove and uniform random choice.
+
+    Removal swaps the last item into the removed item's slot, so the array never
+    has holes and choosing an item is a single random index.
+    """
+
+    __slots__ = ("items", "positions")
+
+    def __init__(self):
+        self.items: List[Hashable] = []
+        self.positions: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: Hashable) -> None:
+        if item not in self.positions:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def remove(self, item: Hashable) -> None:
+        position = self.positions.pop(item)
+        last = self.items.pop()
+        if last != item:
+            self.items[position] = last
+            self.positions[last] = position
+
+    def choice(self, rng) -> Hashable:
+        return self.items[int(rng.random() * len(self.items))]
+
+
+class ArticleIndex:
+    """
+    Articles indexed by (topic, source) so a selection never scans the corpus.
+
+    Every article gets an integer id and is listed in the id arrays of its topic,
+    its (topic, source) group and its (topic, source_key) group, each also under
+    the "any topic" key None. For every topic the index also keeps the sources
+    that have articles in it. Selecting an article is then one or two random
+    picks from these arrays, whatever the size of the corpus, and adding or
+    removing an article touches only the arrays it is listed in.
+
+    Groups are formed like select_article always did: the source filter matches
+    `source_key` case-insensitively, while the uniform-across-sources policy
+    groups articles by their `source` name.
+    """
+
+    def __init__(self, articles: Iterable[Article] = (), rng: Optional[random.Random] = None):
+        """
+        Build the index.
+
+        Args:
+            articles: Articles to index
+            rng: Random number generator, the random module's by default
+        """
+        self.rng = rng or random
+        self._articles: Dict[int, Article] = {}
+        self._ids: Dict[str, int] = {}
+        self._next_id = 0
+        # (topic or None, source) -> article ids
+        self._by_source: Dict[Tuple[Optional[str], str], _Bucket] = {}
+        # (topic or None, lower-cased source_key) -> article ids
+        self._by_source_key: Dict[Tuple[Optional[str], str], _Bucket] = {}
+        # topic or None -> article ids
+        self._by_topic: Dict[Optional[str], _Bucket] = {}
+        # topic or None -> sources that have articles in the topic
+        self._sources: Dict[Optional[str], _Bucket] = {}
+        self._lock = threading.Lock()
+        for article in articles:
+            self._add(article)
+
+    def __len__(self) -> int:
+        return len(self._articles)
+
+    @staticmethod
+    def _keys(article: Article) -> Tuple[str, str]:
+        """Return the source and source key an article is grouped under."""
+        return article.source or "unknown", article.source_key.lower()
+
+    def _add(self, article: Article) -> None:
+        """Add an article, replacing any indexed article with the same URL."""
+        if article.url in self._ids:
+            self._remove(article.url)
+        article_id = self._next_id
+        self._next_id += 1
+        self._articles[article_id] = article
+        self._ids[article.url] = article_id
+
+        source, source_key = self._keys(article)
+        for topic in (None, article.topic):
+            group = self._by_source.get((topic, source))
+            if group is None:
+                group = self._by_source[(topic, source)] = _Bucket()
+                self._sources.setdefault(topic, _Bucket()).add(source)
+            group.add(article_id)
+            self._by_source_key.setdefault((topic, source_key), _Bucket()).add(article_id)
+            self._by_topic.setdefault(topic, _Bucket()).add(article_id)
+
+    def _remove(self, url: str) -> Optional[Article]:
+        """Remove the article with a URL, if indexed."""
+        article_id = self._ids.pop(url, None)
+        if article_id is None:
+            return None
+        article = self._articles.pop(article_id)
+
+        source, source_key = self._keys(article)
+        for topic in (None, article.topic):
+            group = self._by_source[(topic, source)]
+            group.remove(article_id)
+            if not group:
+                del self._by_source[(topic, source)]
+                self._sources[topic].remove(source)
+            group = self._by_source_key[(topic, source_key)]
+            group.remove(article_id)
+            if not group:
+                del self._by_source_key[(topic, source_key)]
+            group = self._by_topic[topic]
+            group.remove(article_id)
+            if not group:
+                del self._by_topic[topic]
+        return article
+
+    def add(self, article: Article) -> None:
+        """
+        Add an article, replacing any indexed article with the same URL.
+
+        Args:
+            article: The article
+        """
+        with self._lock:
+            self._add(article)
+
+    def remove(self, url: str) -> Optional[Article]:
+        """
+        Remove an article.
+
+        Args:
+            url: URL of the article
+
+        Returns:
+            Optional[Article]: The removed article, or None if it wasn't indexed
+        """
+        with self._lock:
+            return self._remove(url)
+
+    def sync(self, articles: Iterable[Article]) -> List[str]:
+        """
+        Make the index hold exactly the given articles, touching only those that
+        were added, replaced or dropped.
+
+        Args:
+            articles: The full set of articles
+
+        Returns:
+            List of the URLs that were dropped
+        """
+        articles = {article.url: article for article in articles}
+        with self._lock:
+            dropped = [url for url in self._ids if url not in articles]
+            for url in dropped:
+                self._remove(url)
+            for url, article in articles.items():
+                current = self._articles.get(self._ids.get(url))
+                if current is None or self._keys(current) != self._keys(article) or current.topic != article.topic:
+                    self._add(article)
+                else:
+                    # Same groups, so the article can take over its predecessor's id
+                    self._articles[self._ids[url]] = article
+        return dropped
+
+    def articles(self) -> List[Article]:
+        """
+        List the indexed articles.
+
+        Returns:
+            List of articles, in the order they were added
+        """
+        with self._lock:
+            return list(self._articles.values())
+
+    def select(self, topic: Optional[str] = None, source: Optional[str] = None) -> Optional[Article]:
+        """
+        Select an article based on topic and source with uniform probability across sources.
+
+        Args:
+            topic: Selected topic or None for all topics
+            source: Selected source key or None for all sources
+
+        Returns:
+            Optional[Article]: Selected article or None if no match
+        """
+        with self._lock:
+            # If source is specified, just select a random article from that source
+            if source:
+                group = self._by_source_key.get((topic or None, source.lower()))
+                return self._articles[group.choice(self.rng)] if group else None
+
+            # Otherwise pick a random source that has articles, then an article from it
+            sources = self._sources.get(topic or None)
+            if not sources:
+                return None
+            group = self._by_source[(topic or None, sources.choice(self.rng))]
+            return self._articles[group.choice(self.rng)]
+
+    def select_by_topic(self, topic: str) -> Optional[Article]:
+        """
+        Select a random article with the specified topic, uniformly over its articles.
+
+        Args:
+            topic: The topic to select from
+
+        Returns:
+            Optional[Article]: Selected article or None if the topic has no articles
+        """
+        with self._lock:
+            group = self._by_topic.get(topic)
+            return self._articles[group.choice(self.rng)] if group else None
+
+    def topic_counts(self) -> Dict[str, int]:
+        """
+        Count the articles of every topic.
+
+        Returns:
+            Dict mapping each topic that has articles to its number of articles
+        """
+        with self._lock:
+            return {topic: len(group) for topic, group in self._by_topic.items() if topic is not None}
+
+    def count(self, topic: Optional[str] = None) -> int:
+        """
+        Count the articles in a topic.
+
+        Args:
+            topic: The topic, or None for all articles
+
+        Returns:
+            int: Number of indexed articles in the topic
+        """
+        group = self._by_topic.get(topic)
+        return len(group) if group else 0
@@ -3,13 +3,16 @@ Utility for selecting articles based on topic.
 """
 import os
 import json
-import random
 import datetime
-from typing import Dict, Optional, List
+from typing import Optional, List, Union
 
-import numpy as np
+from utils.article import Article
+from utils.article_index import ArticleIndex
+from utils.topic_sampler import TopicSampler
+from utils.config import TOPICS, DAILY_SELECTION_FILE, DAILY_PLAN_DAYS
 
-from utils.config import TOPICS, DAILY_SELECTION_FILE
+# Draws topics with the configured probabilities; the alias table is built once
+topic_sampler = TopicSampler()
 
 def get_random_topic() -> str:
     """
@@ -18,110 +21,135 @@ def get_random_topic() -> str:
     Returns:
         str: The selected topic key
     """
-    topic_keys = list(TOPICS.keys())
-    probabilities = [TOPICS[topic]["probability"] for topic in topic_keys]
-    
-    # Select topic based on probabilities
-    selected_topic = np.random.choice(topic_keys, p=probabilities)
-    return selected_topic
+    return topic_sampler.sample()
 
-def save_daily_selection(article_data: Dict) -> None:
+def save_daily_selection(articles: List[Article], start_date: Optional[str] = None) -> None:
     """
-    Save the selected article for today.
+    Save the planned daily articles, one per day.
     
     Args:
-        article_data: Dictionary containing article information
+        articles: The articles, in the order of their days
+        start_date: Day of the first article as YYYY-MM-DD, today by default
     """
-    today = datetime.datetime.now().strftime("%Y-%m-%d")
-    
     selection_data = {
-        "date": today,
-        "article": article_data
+        "date": start_date or datetime.date.today().isoformat(),
+        "articles": [article.to_dict(include_body=False) for article in articles]
     }
     
     with open(DAILY_SELECTION_FILE, "w", encoding="utf-8") as f:
         json.dump(selection_data, f, indent=4)
 
-def get_daily_selection() -> Optional[Dict]:
+def get_daily_selection(candidates: Union[ArticleIndex, List[Article], None] = None) -> Optional[Article]:
     """
     Get the selected article for today.
     
+    Today's article comes from the saved plan. Once the plan has run out, and
+    candidates are given, the next DAILY_PLAN_DAYS articles are picked with
+    plan_daily_selections and saved first.
+    
+    Args:
+        candidates: Index or list of articles to plan from, if needed
+        
     Returns:
-        Dict or None: The article data if available for today, None otherwise
+        Article or None: The article for today, None if there is none
     """
-    today = datetime.datetime.now().strftime("%Y-%m-%d")
-    
-    # Check if selection file exists
-    if not os.path.exists(DAILY_SELECTION_FILE):
-        return None
+    today = datetime.date.today()
     
-    # Load the selection data
-    try:
-        with open(DAILY_SELECTION_FILE, "r", encoding="utf-8") as f:
-            selection_data = json.load(f)
+    # Load the plan, if one was saved
+    if os.path.exists(DAILY_SELECTION_FILE):
+        try:
+            with open(DAILY_SELECTION_FILE, "r", encoding="utf-8") as f:
+                selection_data = json.load(f)
             
-        # Check if selection is for today
-        if selection_data.get("date") == today:
-            return selection_data.get("article")
-    except (json.JSONDecodeError, KeyError):
-        # If file is empty or corrupted
-        return None
+            # Selections saved before plans hold a single article
+            planned = selection_data.get("articles") or [selection_data["article"]]
+            day = (today - datetime.date.fromisoformat(selection_data["date"])).days
+            if 0 <= day < len(planned):
+                return Article.from_dict(planned[day])
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            # If file is empty or corrupted, plan again
+            pass
     
-    return None
+    if not candidates:
+        return None
+    planned = plan_daily_selections(candidates, DAILY_PLAN_DAYS)
+    if not planned:
+        return None
+    save_daily_selection(planned, today.isoformat())
+    return planned[0]
+
+def _as_index(candidates: Union[ArticleIndex, List[Article]]) -> ArticleIndex:
+    """Return the candidates as an index, indexing a plain list first."""
+    return candidates if isinstance(candidates, ArticleIndex) else ArticleIndex(candidates)
 
-def select_article_from_candidates(candidates: List[Dict], topic: str) -> Optional[Dict]:
+def select_article_from_candidates(candidates: Union[ArticleIndex, List[Article]], topic: str) -> Optional[Article]:
     """
-    Select a random article from the list of candidates for the given topic.
+    Select a random article from the candidates for the given topic.
     
     Args:
-        candidates: List of article dictionaries
+        candidates: Index or list of articles
         topic: The topic to select from
         
     Returns:
-        Dict or None: The selected article or None if no suitable candidates
+        Article or None: The selected article or None if no suitable candidates
     """
     if not candidates:
         return None
     
-    # Filter candidates with the specified topic
-    topic_candidates = [article for article in candidates if article.get("topic") == topic]
+    index = _as_index(candidates)
     
     # If no articles found for the specified topic, use all candidates
-    if not topic_candidates:
-        topic_candidates = candidates
-    
-    # Select a random article from the candidates
-    if topic_candidates:
-        return random.choice(topic_candidates)
-    
-    return None
+    return index.select_by_topic(topic) or index.select_by_topic(None)
 
-def select_article_by_topic(candidates: List[Dict], topic: str) -> Optional[Dict]:
+def select_article_by_topic(candidates: Union[ArticleIndex, List[Article]], topic: str) -> Optional[Article]:
     """
     Select a random article with the specified topic.
     Unlike the regular selection process, this doesn't save the selection as the daily article.
     
     Args:
-        candidates: List of article dictionaries
+        candidates: Index or list of articles
         topic: The specific topic to select (e.g., "business", "science")
         
     Returns:
-        Dict or None: The selected article or None if no suitable candidates
+        Article or None: The selected article or None if no suitable candidates
     """
     if not candidates:
         return None
     
-    # Filter candidates by the specified topic
-    topic_candidates = [article for article in candidates if article.get("topic") == topic]
+    # The topic's display name is available as selected_article.topic_name
+    return _as_index(candidates).select_by_topic(topic)
+
+def plan_daily_selections(candidates: Union[ArticleIndex, List[Article]], days: int) -> List[Article]:
+    """
+    Pick the articles for the next several days at once, without repeats.
     
-    # If we found candidates with the requested topic, select one randomly
-    if topic_candidates:
-        selected_article = random.choice(topic_candidates)
-        
-        # Add topic name to the article data
-        if topic in TOPICS:
-            selected_article["topic_name"] = TOPICS[topic]["name"]
-            
-        return selected_article
+    The topics of all days are drawn in one batch, with the configured
+    probabilities restricted to the topics the candidates cover. Each pick is
+    taken out of the pool; when a topic runs out, it is masked out and the
+    remaining days are drawn again.
     
-    return None 
\ No newline at end of file
+    Args:
+        candidates: Index or list of articles (left unchanged)
+        days: Number of daily articles to pick
+        
+    Returns:
+        List of distinct articles, one per day for as long as candidates last
+    """
+    if not candidates:
+        return []
+    
+    pool = ArticleIndex(_as_index(candidates).articles())
+    sampler = TopicSampler(counts=pool.topic_counts())
+    picks = []
+    while len(picks) < days:
+        topics = sampler.sample_many(days - len(picks))
+        if not topics:
+            break
+        for topic in topics:
+            article = pool.select_by_topic(topic)
+            if article is None:
+                break
+            pool.remove(article.url)
+            picks.append(article)
+        sampler.update_counts(pool.topic_counts())
+    return picks
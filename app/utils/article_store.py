@@ -0,0 +1,399 @@
+"""
+SQLite-backed storage for scraped articles.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.article import Article
+from utils.config import ARTICLES_DB_FILE, ARTICLES_CACHE_FILE
+
+# Bump when the schema changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 4
+
+# Meta keys under which the ingest daemon shares its state with the app
+LAST_INGEST_KEY = "last_ingest"
+RUNNING_KEY = "ingest_running"
+ERRORS_KEY = "ingest_errors"
+SOURCE_HEALTH_KEY = "source_health"
+# Bumped by every write that changes the stored articles, unlike PRAGMA data_version,
+# which also changes on meta writes and differs between connections
+CONTENT_VERSION_KEY = "content_version"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    source TEXT,
+    topic TEXT,
+    cached_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    content TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+CREATE INDEX IF NOT EXISTS idx_articles_topic ON articles(topic);
+CREATE INDEX IF NOT EXISTS idx_articles_cached_at ON articles(cached_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS feed_state (
+    source_id TEXT NOT NULL,
+    feed TEXT NOT NULL,
+    last_success REAL,
+    last_attempt REAL NOT NULL,
+    last_error TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (source_id, feed)
+);
+"""
+
+
+class ArticleStore:
+    """
+    Article store keeping one row per URL, indexed by source, topic and cache time.
+    
+    Article bodies are kept in a column of their own, so loading the corpus
+    doesn't read them; Article.content fetches a body when it is needed.
+    
+    The database runs in WAL mode so readers never block the writer. Each thread
+    gets its own connection.
+    """
+    
+    def __init__(self, db_path: str = ARTICLES_DB_FILE, legacy_json_path: Optional[str] = ARTICLES_CACHE_FILE):
+        """
+        Initialize the store, creating the schema and importing the legacy JSON
+        cache the first time the database is created.
+        
+        Args:
+            db_path: Path of the SQLite database file
+            legacy_json_path: JSON cache file to migrate from, if any
+        """
+        self.db_path = db_path
+        self.logger = logging.getLogger("article_store")
+        self._local = threading.local()
+        
+        conn = self._connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with conn:
+                conn.executescript(SCHEMA)
+                if 0 < version < 3:
+                    self._split_content(conn)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            if version == 0 and legacy_json_path:
+                self.migrate_from_json(legacy_json_path)
+    
+    @staticmethod
+    def _split_content(conn: sqlite3.Connection) -> None:
+        """Move article bodies out of the JSON data of a version 1 or 2 database."""
+        conn.execute("ALTER TABLE articles ADD COLUMN content TEXT")
+        conn.execute(
+            """
+            UPDATE articles
+            SET content = json_extract(data, '$.content'), data = json_remove(data, '$.content')
+            WHERE json_extract(data, '$.content') IS NOT NULL
+            """
+        )
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    @staticmethod
+    def _cutoff(ttl_days: float) -> float:
+        """Return the oldest cache timestamp that is still considered fresh."""
+        return time.time() - ttl_days * 86400
+    
+    def upsert_articles(self, articles: Iterable[Article]) -> int:
+        """
+        Insert new articles and refresh the data of known ones in a single transaction.
+        
+        An article that is already stored keeps its original cache time, so
+        scraping it again doesn't extend its lifetime.
+        
+        Args:
+            articles: Articles to store
+            
+        Returns:
+            int: Number of articles written
+        """
+        conn = self._connection()
+        with conn:
+            return self._upsert(conn, articles)
+    
+    def write_batch(self, articles: Iterable[Article], ttl_days: float) -> int:
+        """
+        Commit the results of a full refresh: upsert every article and drop expired
+        ones in one transaction, so a crash mid-write leaves the previous state intact.
+        
+        Args:
+            articles: Articles from all sources
+            ttl_days: Maximum article age in days
+            
+        Returns:
+            int: Number of articles written
+        """
+        conn = self._connection()
+        with conn:
+            written = self._upsert(conn, articles)
+            cursor = conn.execute("DELETE FROM articles WHERE cached_at < ?", (self._cutoff(ttl_days),))
+            if cursor.rowcount:
+                self._bump_content_version(conn)
+        return written
+    
+    @staticmethod
+    def _row(article: Article, cached_at: float) -> tuple:
+        """Turn an article into an (url, source, topic, cached_at, data, content) row."""
+        data = article.to_dict(include_body=False)
+        del data["cached_at"]
+        return (article.url, article.source, article.topic, cached_at, json.dumps(data), article.body)
+    
+    def _upsert(self, conn: sqlite3.Connection, articles: Iterable[Article]) -> int:
+        """Upsert articles on a connection that is already inside a transaction."""
+        now = time.time()
+        rows = [self._row(article, now) for article in articles if article.url]
+        
+        conn.executemany(
+            """
+            INSERT INTO articles (url, source, topic, cached_at, data, content)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                source = excluded.source,
+                topic = excluded.topic,
+                data = excluded.data,
+                content = excluded.content
+            """,
+            rows
+        )
+        if rows:
+            self._bump_content_version(conn)
+        return len(rows)
+    
+    def load_articles(self, ttl_days: float) -> List[Article]:
+        """
+        Load all articles cached within the TTL, without their bodies.
+        
+        Args:
+            ttl_days: Maximum article age in days
+            
+        Returns:
+            List of articles, each with its `cached_at`
+        """
+        return [article for article, _ in self.load_timed_articles(ttl_days)]
+    
+    def load_timed_articles(self, ttl_days: float) -> List[Tuple[Article, float]]:
+        """
+        Load all articles cached within the TTL with their cache timestamps, so
+        callers can schedule their expiry without reading them off each article.
+        
+        Args:
+            ttl_days: Maximum article age in days
+            
+        Returns:
+            List of (article, cached_at) pairs, oldest first
+        """
+        rows = self._connection().execute(
+            "SELECT data, cached_at FROM articles WHERE cached_at >= ? ORDER BY cached_at, rowid",
+            (self._cutoff(ttl_days),)
+        )
+        articles = []
+        for data, cached_at in rows:
+            article = Article.from_dict(json.loads(data))
+            article.cached_at = cached_at
+            articles.append((article, cached_at))
+        return articles
+    
+    def load_content(self, url: str) -> Optional[str]:
+        """
+        Load the body text of an article.
+        
+        Args:
+            url: URL of the article
+            
+        Returns:
+            str or None: The body text, if the article has one
+        """
+        row = self._connection().execute("SELECT content FROM articles WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+    
+    def expire(self, ttl_days: float) -> int:
+        """
+        Delete every article older than the TTL.
+        
+        Args:
+            ttl_days: Maximum article age in days
+            
+        Returns:
+            int: Number of articles deleted
+        """
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute("DELETE FROM articles WHERE cached_at < ?", (self._cutoff(ttl_days),))
+            if cursor.rowcount:
+                self._bump_content_version(conn)
+        return cursor.rowcount
+    
+    @staticmethod
+    def _bump_content_version(conn: sqlite3.Connection) -> None:
+        """Bump the content version, inside the transaction that changed the articles."""
+        conn.execute(
+            """
+            INSERT INTO meta (key, value) VALUES (?, '1')
+            ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1
+            """,
+            (CONTENT_VERSION_KEY,)
+        )
+    
+    def content_version(self) -> int:
+        """
+        Return a number that changes whenever the stored articles change, from
+        any process, so readers can cheaply tell whether they need to reload.
+        Ingest bookkeeping (the meta values) doesn't change it.
+        """
+        return int(self.get_meta(CONTENT_VERSION_KEY) or 0)
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        """
+        Read a bookkeeping value.
+        
+        Args:
+            key: Name of the value
+            
+        Returns:
+            str or None: The stored value, if any
+        """
+        row = self._connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set_meta(self, key: str, value: str) -> None:
+        """
+        Write a bookkeeping value.
+        
+        Args:
+            key: Name of the value
+            value: Value to store
+        """
+        conn = self._connection()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    
+    def count(self) -> int:
+        """Return the number of stored articles, expired or not."""
+        return self._connection().execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+    
+    def known_urls(self) -> Set[str]:
+        """Return the URLs of all stored articles, so an ingest can skip them."""
+        return {row[0] for row in self._connection().execute("SELECT url FROM articles")}
+    
+    def load_feed_states(self) -> Dict[Tuple[str, str], Dict]:
+        """
+        Load when each feed was last fetched.
+        
+        Returns:
+            Dict mapping (source id, feed name) to its last_success (None if it never
+            succeeded), last_attempt and last_error
+        """
+        rows = self._connection().execute(
+            "SELECT source_id, feed, last_success, last_attempt, last_error FROM feed_state"
+        )
+        return {
+            (source_id, feed): {"last_success": last_success, "last_attempt": last_attempt, "last_error": last_error}
+            for source_id, feed, last_success, last_attempt, last_error in rows
+        }
+    
+    def record_feed_results(self, results: Iterable[Tuple[str, str, str]], attempted_at: float) -> None:
+        """
+        Record the outcome of fetching feeds in one transaction.
+        
+        Args:
+            results: (source id, feed name, error) triples; an empty error means
+                the feed was fetched successfully
+            attempted_at: Time the feeds were fetched
+        """
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO feed_state (source_id, feed, last_success, last_attempt, last_error)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (source_id, feed) DO UPDATE SET
+                    last_success = COALESCE(excluded.last_success, feed_state.last_success),
+                    last_attempt = excluded.last_attempt,
+                    last_error = excluded.last_error
+                """,
+                [
+                    (source_id, feed, None if error else attempted_at, attempted_at, error)
+                    for source_id, feed, error in results
+                ]
+            )
+    
+    def migrate_from_json(self, json_path: str) -> int:
+        """
+        Import articles from the legacy JSON cache file, keeping their cache times.
+        Articles already in the store are left untouched.
+        
+        Args:
+            json_path: Path of the JSON cache file
+            
+        Returns:
+            int: Number of articles imported
+        """
+        if not os.path.exists(json_path):
+            return 0
+        
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.warning(f"Could not read legacy cache {json_path}: {e}")
+            return 0
+        
+        rows = []
+        for item in cached:
+            if not item.get("url"):
+                continue
+            try:
+                cached_at = datetime.fromisoformat(item.get("cached_time", "2000-01-01")).timestamp()
+            except ValueError:
+                cached_at = 0.0
+            rows.append(self._row(Article.from_dict(item), cached_at))
+        
+        conn = self._connection()
+        with conn:
+            cursor = conn.executemany(
+                "INSERT OR IGNORE INTO articles (url, source, topic, cached_at, data, content) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            if cursor.rowcount:
+                self._bump_content_version(conn)
+        self.logger.info(f"Imported {cursor.rowcount} articles from {json_path}")
+        return cursor.rowcount
+
+
+_store: Optional[ArticleStore] = None
+_store_lock = threading.Lock()
+
+
+def get_article_store() -> ArticleStore:
+    """
+    Get the process-wide article store.
+    
+    Returns:
+        ArticleStore: The shared store
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArticleStore()
+    return _store
@@ -12,24 +12,117 @@ DATA_DIR = os.path.join(BASE_DIR, "data")
 os.makedirs(DATA_DIR, exist_ok=True)
 
 # File paths
+ARTICLES_DB_FILE = os.path.join(DATA_DIR, "articles.db")
+# Legacy JSON article cache, imported into ARTICLES_DB_FILE the first time it is created
 ARTICLES_CACHE_FILE = os.path.join(DATA_DIR, "articles_cache.json")
 DAILY_SELECTION_FILE = os.path.join(DATA_DIR, "daily_selection.json")
+# Number of upcoming daily articles picked (and saved) at once
+DAILY_PLAN_DAYS = 7
+FEED_CACHE_DIR = os.path.join(DATA_DIR, "feeds")
+CONTENT_CACHE_DB_FILE = os.path.join(DATA_DIR, "content_cache.db")
+# Snapshot of the pipeline metrics, rewritten after every ingest run
+METRICS_FILE = os.path.join(DATA_DIR, "metrics.json")
+# Snapshot of the Streamlit app's own metrics (content cache, corpus evictions)
+APP_METRICS_FILE = os.path.join(DATA_DIR, "app_metrics.json")
+# How often (in seconds) the app rewrites its metrics snapshot
+APP_METRICS_SECONDS = 60
 
-# News sources
+# Maximum time (in seconds) to wait for a single source during a refresh
+SCRAPER_TIMEOUT_SECONDS = 180
+
+# How often (in seconds) the ingest daemon checks whether a refresh is due
+INGEST_CHECK_SECONDS = 300
+
+# Days an ingested article is kept in the article store and shown by the app
+CACHE_TTL_DAYS = 1
+
+# How often (in seconds) the app checks the article store for newly ingested articles
+CORPUS_RELOAD_SECONDS = 30
+
+# Run the ingest job inside the Streamlit process (for hosts without a separate daemon)
+EMBEDDED_INGEST = os.environ.get("VARC_EMBEDDED_INGEST", "0") == "1"
+
+# Extracted article content cache used by the article view
+CONTENT_CACHE_SETTINGS = {
+    "ttl_hours": 24,
+    "max_entries": 500,     # Articles kept on disk
+    "memory_entries": 64    # Articles kept in memory
+}
+
+# Background prefetching of the articles a reader is likely to open next
+PREFETCH_SETTINGS = {
+    "lookahead": 3,  # Articles kept queued (and prefetched) per reader
+    "workers": 2     # Articles extracted in parallel
+}
+
+# Connection pooling and retry policy for the shared HTTP session
+HTTP_POOL_SETTINGS = {
+    "pool_connections": 16,  # Number of hosts to keep pools for
+    "pool_maxsize": 8,       # Connections kept alive per host
+    "retries": 3,
+    "backoff_factor": 1.0
+}
+
+# Concurrency limits for the asyncio fetch engine (scrapers/async_fetcher.py)
+ASYNC_FETCH_SETTINGS = {
+    "max_concurrency": 32,      # Requests in flight across all hosts
+    "per_host_concurrency": 4,  # Requests in flight to any one host
+    "timeout_seconds": 20,      # Per request, including reading the body
+    "batch_timeout_seconds": 60,  # Per batch of articles extracted together, e.g. one feed's
+    "parse_workers": 4          # Threads parsing HTML and feeds off the event loop
+}
+
+# Worker processes extracting article content from downloaded pages
+EXTRACTION_SETTINGS = {
+    "workers": None  # None for one per CPU core, 0 to extract in the scraper's own thread
+}
+
+# Near-duplicate detection of syndicated stories at ingest (utils/near_duplicates.py)
+NEAR_DUPLICATE_SETTINGS = {
+    "threshold": 0.5,  # Share of title + summary words two stories need in common to count as copies
+    "num_perm": 64,    # MinHash signature length
+    "bands": 16,       # LSH bands of 4 values; finds copies at 0.5 similarity about 2 in 3 times, at 0.7 99%
+    "min_tokens": 8    # Shorter title + summary texts are too short to compare
+}
+
+# Default politeness budget for hosts without their own rate limit
+DEFAULT_RATE_LIMIT = {"calls": 1, "period": 2}
+
+# How stale (in minutes) a feed may get before the ingest scheduler fetches it again,
+# for sources without their own "refresh_minutes"
+DEFAULT_REFRESH_MINUTES = 1440
+
+# How long (in minutes) the scheduler waits before retrying a feed that failed
+FEED_RETRY_MINUTES = 30
+
+# News sources, by source id. "scraper" names the class that scrapes a source as
+# "module:Class" (imported only when the source is scraped); sources with
+# "enabled" set to False are neither scraped nor offered as a filter. A source
+# reads the feeds in "rss_feeds" (or the site pages in "sections"), and each feed
+# is fetched again once it is older than its "feed_refresh_minutes" entry, or
+# else the source's "refresh_minutes".
 NEWS_SOURCES = {
     "hindu": {
         "name": "The Hindu",
         "base_url": "https://www.thehindu.com",
+        "scraper": "scrapers.hindu_scraper:HinduScraper",
+        "enabled": True,
+        "refresh_minutes": 180,
         "rss_feeds": {
             "general": "https://www.thehindu.com/news/feeder/default.rss",
             "business": "https://www.thehindu.com/business/feeder/default.rss",
             "science": "https://www.thehindu.com/sci-tech/feeder/default.rss",
             "entertainment": "https://www.thehindu.com/entertainment/feeder/default.rss"
-        }
+        },
+        "rate_limit": {"calls": 1, "period": 2}
     },
     "telegraph": {
         "name": "The Telegraph",
         "base_url": "https://www.telegraph.co.uk",
+        "scraper": "scrapers.telegraph_scraper:TelegraphScraper",
+        "enabled": True,
+        "refresh_minutes": 180,
+        "feed_refresh_minutes": {"culture": 1440},
         "rss_feeds": {
             "general": "https://www.telegraph.co.uk/rss.xml",
             "news": "https://www.telegraph.co.uk/news/rss.xml",
@@ -37,28 +130,70 @@ NEWS_SOURCES = {
             "technology": "https://www.telegraph.co.uk/technology/rss.xml",
             "culture": "https://www.telegraph.co.uk/culture/rss.xml",
             "science": "https://www.telegraph.co.uk/science/rss.xml"
-        }
+        },
+        "rate_limit": {"calls": 1, "period": 2}
     },
     # Backup sources in case the above are blocked
     "bbc": {
         "name": "BBC News",
         "base_url": "https://www.bbc.com",
+        "scraper": "scrapers.bbc_scraper:BBCScraper",
+        "enabled": True,
+        "refresh_minutes": 60,
+        "feed_refresh_minutes": {"entertainment": 1440},
         "rss_feeds": {
             "general": "http://feeds.bbci.co.uk/news/rss.xml",
             "science": "http://feeds.bbci.co.uk/news/science_and_environment/rss.xml",
             "technology": "http://feeds.bbci.co.uk/news/technology/rss.xml",
             "business": "http://feeds.bbci.co.uk/news/business/rss.xml",
             "entertainment": "http://feeds.bbci.co.uk/news/entertainment_and_arts/rss.xml"
-        }
+        },
+        "rate_limit": {"calls": 1, "period": 2}
     },
     "reuters": {
         "name": "Reuters",
         "base_url": "https://www.reuters.com",
+        "scraper": "scrapers.reuters_scraper:ReutersScraper",
+        "enabled": True,
+        "refresh_minutes": 60,
         "rss_feeds": {
             "general": "https://www.reutersagency.com/feed/",
             "business": "https://www.reutersagency.com/feed/?best-topics=business-finance&post_type=best",
             "science": "https://www.reutersagency.com/feed/?best-topics=health&post_type=best"
-        }
+        },
+        "rate_limit": {"calls": 1, "period": 2}
+    },
+    "guardian": {
+        "name": "The Guardian",
+        "base_url": "https://www.theguardian.com",
+        "scraper": "scrapers.guardian_scraper:GuardianScraper",
+        "enabled": True,
+        "refresh_minutes": 360,
+        "sections": {
+            "business": "https://www.theguardian.com/business",
+            "technology": "https://www.theguardian.com/technology",
+            "science": "https://www.theguardian.com/science",
+            "environment": "https://www.theguardian.com/environment",
+            "education": "https://www.theguardian.com/education",
+            "health": "https://www.theguardian.com/society/health"
+        },
+        "rate_limit": {"calls": 1, "period": 2}
+    },
+    "toi": {
+        "name": "Times of India",
+        "base_url": "https://timesofindia.indiatimes.com",
+        "scraper": "scrapers.toi_scraper:TOIScraper",
+        "enabled": True,
+        "refresh_minutes": 360,
+        "sections": {
+            "business": "https://timesofindia.indiatimes.com/topic/business",
+            "technology": "https://timesofindia.indiatimes.com/topic/technology",
+            "science": "https://timesofindia.indiatimes.com/topic/science",
+            "environment": "https://timesofindia.indiatimes.com/topic/environment",
+            "education": "https://timesofindia.indiatimes.com/topic/education",
+            "health": "https://timesofindia.indiatimes.com/topic/health"
+        },
+        "rate_limit": {"calls": 1, "period": 2}
     }
 }
 
@@ -0,0 +1,180 @@
+"""
+Persistent cache of extracted article content, keyed by article URL.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from utils.config import CONTENT_CACHE_DB_FILE, CONTENT_CACHE_SETTINGS
+from utils.metrics import metrics
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    url TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    cached_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_content_accessed_at ON content(accessed_at);
+"""
+
+
+class ContentCache:
+    """
+    Two-level LRU cache for extracted article content.
+    
+    A small in-memory LRU sits in front of a SQLite table on disk. Entries expire
+    after a TTL, and once the disk cache holds more than `max_entries` articles the
+    least recently viewed ones are evicted. The cache is shared by every session in
+    the process and survives restarts.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = CONTENT_CACHE_DB_FILE,
+        ttl_hours: float = CONTENT_CACHE_SETTINGS["ttl_hours"],
+        max_entries: int = CONTENT_CACHE_SETTINGS["max_entries"],
+        memory_entries: int = CONTENT_CACHE_SETTINGS["memory_entries"]
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            db_path: Path of the SQLite database file
+            ttl_hours: How long extracted content stays valid
+            max_entries: Maximum number of articles kept on disk
+            memory_entries: Maximum number of articles kept in memory
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger("content_cache")
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        
+        conn = self._connection()
+        with conn:
+            conn.executescript(SCHEMA)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def _remember(self, url: str, content: Dict, cached_at: float) -> None:
+        """Put an entry at the front of the in-memory LRU, evicting the oldest if full."""
+        with self._lock:
+            self._memory[url] = (content, cached_at)
+            self._memory.move_to_end(url)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Get the cached content of an article.
+        
+        Args:
+            url: URL of the article
+            
+        Returns:
+            Dict or None: The extracted content, or None if missing or expired
+        """
+        now = time.time()
+        cutoff = now - self.ttl_seconds
+        
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                if entry[1] >= cutoff:
+                    self._memory.move_to_end(url)
+                    self.hits += 1
+                    metrics.inc("cache_requests_total", cache="content", result="hit")
+                    return entry[0]
+                del self._memory[url]
+        
+        try:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT data, cached_at FROM content WHERE url = ? AND cached_at >= ?",
+                (url, cutoff)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                metrics.inc("cache_requests_total", cache="content", result="miss")
+                return None
+            with conn:
+                conn.execute("UPDATE content SET accessed_at = ? WHERE url = ?", (now, url))
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to read content cache for {url}: {e}")
+            self.misses += 1
+            metrics.inc("cache_requests_total", cache="content", result="miss")
+            return None
+        
+        content = json.loads(row[0])
+        self._remember(url, content, row[1])
+        self.hits += 1
+        metrics.inc("cache_requests_total", cache="content", result="hit")
+        return content
+    
+    def put(self, url: str, content: Dict) -> None:
+        """
+        Cache the extracted content of an article.
+        
+        Args:
+            url: URL of the article
+            content: Extracted content (must be JSON serializable)
+        """
+        now = time.time()
+        self._remember(url, content, now)
+        
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO content (url, data, cached_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (url, json.dumps(content), now, now)
+                )
+                # Drop expired entries, then the least recently viewed beyond the size bound
+                conn.execute("DELETE FROM content WHERE cached_at < ?", (now - self.ttl_seconds,))
+                conn.execute(
+                    """
+                    DELETE FROM content WHERE url IN (
+                        SELECT url FROM content ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,)
+                )
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to write content cache for {url}: {e}")
+
+
+_cache: Optional[ContentCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_content_cache() -> ContentCache:
+    """
+    Get the process-wide content cache.
+    
+    Returns:
+        ContentCache: The shared cache
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ContentCache()
+    return _cache
@@ -0,0 +1,102 @@
+"""
+Min-heap of expiry times for evicting cached entries incrementally.
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# Rebuild the heap once stale entries outnumber live ones by this factor
+COMPACT_FACTOR = 2
+
+
+class ExpiryQueue:
+    """
+    Keys ordered by the time they expire, so expired keys are found without
+    looking at the live ones.
+
+    Expiry times are plain timestamps, compared as floats. Popping the expired
+    keys costs O(log n) per expired key, and a key that is pushed again or
+    discarded leaves its old heap entry behind to be skipped when it surfaces,
+    so every operation is amortized O(log n) and an eviction pass that finds
+    nothing expired is O(1).
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._expiry: Dict[Hashable, float] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._expiry
+
+    def push(self, key: Hashable, expires_at: float) -> None:
+        """
+        Schedule a key to expire, replacing its previous expiry time.
+
+        Args:
+            key: The key
+            expires_at: Timestamp at which the key expires
+        """
+        with self._lock:
+            if self._expiry.get(key) == expires_at:
+                return
+            self._expiry[key] = expires_at
+            heapq.heappush(self._heap, (expires_at, next(self._sequence), key))
+            self._maybe_compact()
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Stop tracking a key, if tracked.
+
+        Args:
+            key: The key
+        """
+        with self._lock:
+            if self._expiry.pop(key, None) is not None:
+                self._maybe_compact()
+
+    def pop_expired(self, now: Optional[float] = None) -> List[Hashable]:
+        """
+        Remove and return every key whose expiry time has passed.
+
+        Args:
+            now: Current timestamp, time.time() by default
+
+        Returns:
+            List of the expired keys, oldest first
+        """
+        now = time.time() if now is None else now
+        expired = []
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                expires_at, _, key = heapq.heappop(heap)
+                # Skip entries left behind by a later push or a discard
+                if self._expiry.get(key) == expires_at:
+                    del self._expiry[key]
+                    expired.append(key)
+        return expired
+
+    def next_expiry(self) -> Optional[float]:
+        """
+        Return the earliest expiry time of a tracked key.
+
+        Returns:
+            float or None: The timestamp, or None if nothing is tracked
+        """
+        with self._lock:
+            while self._heap and self._expiry.get(self._heap[0][2]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def _maybe_compact(self) -> None:
+        """Drop stale heap entries once they dominate the heap."""
+        if len(self._heap) > COMPACT_FACTOR * len(self._expiry) + 64:
+            self._heap = [(expires_at, next(self._sequence), key) for key, expires_at in self._expiry.items()]
+            heapq.heapify(self._heap)
@@ -0,0 +1,124 @@
+"""
+Shared HTTP session with per-host connection pooling and retries.
+"""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.config import REQUEST_HEADERS, HTTP_POOL_SETTINGS
+from utils.metrics import metrics
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a session whose adapter keeps connections to each host alive and
+    retries transient failures with exponential backoff.
+    
+    Returns:
+        requests.Session: Configured session
+    """
+    retry = Retry(
+        total=HTTP_POOL_SETTINGS["retries"],
+        backoff_factor=HTTP_POOL_SETTINGS["backoff_factor"],
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        # Hand the final response back so callers can raise_for_status() as usual
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SETTINGS["pool_connections"],
+        pool_maxsize=HTTP_POOL_SETTINGS["pool_maxsize"],
+        max_retries=retry
+    )
+    
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session shared by all scrapers and UI components.
+    
+    Returns:
+        requests.Session: The shared session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url: str, headers: Optional[Dict] = None, timeout: float = 10, **kwargs) -> requests.Response:
+    """
+    Send a GET request through the shared session.
+    
+    Args:
+        url: URL to fetch
+        headers: Extra headers merged over the session defaults
+        timeout: Request timeout in seconds
+        **kwargs: Extra arguments passed on to Session.get
+        
+    Returns:
+        requests.Response: The response
+    """
+    host = (urlparse(url).hostname or "").lower()
+    started = time.perf_counter()
+    try:
+        response = get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+    except requests.RequestException:
+        metrics.inc("http_responses_total", host=host, status="error")
+        raise
+    finally:
+        metrics.observe("http_request_seconds", time.perf_counter() - started, host=host)
+    metrics.inc("http_responses_total", host=host, status=response.status_code)
+    metrics.inc("http_response_bytes_total", len(response.content), host=host)
+    return response
+
+
+def connection_stats() -> Dict:
+    """
+    Report how well connections are being reused, per host and in total.
+    
+    Counts only cover pools that are still alive; a host whose pool was evicted
+    (more than `pool_connections` hosts in use) starts counting from zero again.
+    
+    Returns:
+        Dict: Request, connection and reuse counts
+    """
+    hosts = {}
+    if _session is not None:
+        for adapter in set(_session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats = hosts.setdefault(pool.host, {"requests": 0, "connections": 0})
+                stats["requests"] += pool.num_requests
+                stats["connections"] += pool.num_connections
+    
+    total_requests = sum(stats["requests"] for stats in hosts.values())
+    total_connections = sum(stats["connections"] for stats in hosts.values())
+    return {
+        "requests": total_requests,
+        "connections": total_connections,
+        "reused": max(total_requests - total_connections, 0),
+        "hosts": hosts
+    }
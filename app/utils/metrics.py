@@ -0,0 +1,242 @@
+"""
+Process-wide counters and timers for the scrape pipeline, exported as
+Prometheus text or a JSON snapshot.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# What each metric measures, for the Prometheus HELP lines
+DESCRIPTIONS = {
+    "http_request_seconds": "Time to fetch a URL, by host",
+    "http_responses_total": "HTTP responses received, by host and status",
+    "http_response_bytes_total": "Response body bytes received, by host",
+    "rate_limit_wait_seconds": "Time requests waited for their host's rate limit, by host",
+    "parse_seconds": "Time spent parsing, by parser (feedparser, beautifulsoup, newspaper)",
+    "classify_seconds": "Time spent classifying article topics",
+    "extract_seconds": "Time from submitting an article for extraction to its result, by extractor",
+    "cache_requests_total": "Cache lookups, by cache and result (hit or miss)",
+    "ingest_seconds": "Duration of ingest runs",
+    "ingest_articles_total": "Articles ingested",
+    "ingest_known_urls_skipped_total": "Feed entries skipped because their article was already stored",
+    "corpus_evictions_total": "Expired articles evicted from the app's corpus between reloads",
+    "corpus_eviction_seconds": "Duration of the corpus's expired-article eviction passes",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters and timers, each identified by a name and
+    a set of labels.
+
+    Timers keep a count, a sum and a maximum per label set, which is what a
+    Prometheus summary without quantiles holds, so recording stays O(1).
+    Worker processes record into their own registry; drain() hands their
+    numbers to the parent, which adds them in with merge().
+    """
+
+    def __init__(self):
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        # (name, labels) -> [count, sum, max]
+        self._timers: Dict[Tuple[str, LabelKey], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Metric name
+            value: Amount to add
+            **labels: Label values
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        """
+        Record a duration.
+
+        Args:
+            name: Metric name
+            seconds: The duration
+            **labels: Label values
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            timer = self._timers.get(key)
+            if timer is None:
+                self._timers[key] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                if seconds > timer[2]:
+                    timer[2] = seconds
+
+    @contextmanager
+    def timed(self, name: str, **labels) -> Iterator[None]:
+        """
+        Time the enclosed block, whether or not it raises.
+
+        Args:
+            name: Metric name
+            **labels: Label values
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def snapshot(self) -> Dict:
+        """
+        Return the current values.
+
+        Returns:
+            Dict with a "counters" and a "timers" list of metrics, each with its
+            name and labels
+        """
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            timers = [
+                {"name": name, "labels": dict(labels), "count": count, "sum": total, "max": longest}
+                for (name, labels), (count, total, longest) in sorted(self._timers.items())
+            ]
+        return {"time": time.time(), "counters": counters, "timers": timers}
+
+    def drain(self) -> Dict:
+        """
+        Return the current values and reset the registry.
+
+        Returns:
+            Dict: The snapshot taken before the reset
+        """
+        with self._lock:
+            snapshot_counters, snapshot_timers = self._counters, self._timers
+            self._counters, self._timers = {}, {}
+        drained = MetricsRegistry()
+        drained._counters, drained._timers = snapshot_counters, snapshot_timers
+        return drained.snapshot()
+
+    def merge(self, snapshot: Dict) -> None:
+        """
+        Add the values of a snapshot, e.g. one drained in a worker process.
+
+        Args:
+            snapshot: Result of snapshot() or drain()
+        """
+        for counter in snapshot["counters"]:
+            self.inc(counter["name"], counter["value"], **counter["labels"])
+        with self._lock:
+            for timer in snapshot["timers"]:
+                key = (timer["name"], _label_key(timer["labels"]))
+                current = self._timers.setdefault(key, [0, 0.0, 0.0])
+                current[0] += timer["count"]
+                current[1] += timer["sum"]
+                current[2] = max(current[2], timer["max"])
+
+    def to_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Counters as counters, timers as summaries plus a _max gauge
+        """
+        snapshot = self.snapshot()
+        lines = []
+        declared = set()
+
+        def declare(name: str, kind: str) -> None:
+            if name not in declared:
+                declared.add(name)
+                if name in DESCRIPTIONS:
+                    lines.append(f"# HELP {name} {DESCRIPTIONS[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        def labels(values: Dict) -> str:
+            if not values:
+                return ""
+            escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for value in values.values())
+            return "{" + ",".join(f'{name}="{value}"' for name, value in zip(values, escaped)) + "}"
+
+        for counter in snapshot["counters"]:
+            declare(counter["name"], "counter")
+            lines.append(f"{counter['name']}{labels(counter['labels'])} {counter['value']:g}")
+        for timer in snapshot["timers"]:
+            name = timer["name"]
+            declare(name, "summary")
+            lines.append(f"{name}_count{labels(timer['labels'])} {timer['count']}")
+            lines.append(f"{name}_sum{labels(timer['labels'])} {timer['sum']:.6f}")
+        for timer in snapshot["timers"]:
+            declare(f"{timer['name']}_max", "gauge")
+            lines.append(f"{timer['name']}_max{labels(timer['labels'])} {timer['max']:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str) -> None:
+        """
+        Write a snapshot to a JSON file, replacing it atomically.
+
+        Args:
+            path: Target file
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+
+
+# Shared registry every component records into
+metrics = MetricsRegistry()
+
+
+def serve_metrics(port: int, registry: Optional[MetricsRegistry] = None, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """
+    Serve the metrics over HTTP in a background thread: Prometheus text at
+    /metrics and a JSON snapshot at /metrics.json.
+
+    Args:
+        port: Port to listen on
+        registry: Registry to serve, the shared one by default
+        host: Interface to listen on
+
+    Returns:
+        ThreadingHTTPServer: The running server; call shutdown() to stop it
+    """
+    registry = registry or metrics
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = registry.to_prometheus().encode("utf-8"), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, content_type = json.dumps(registry.snapshot()).encode("utf-8"), "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
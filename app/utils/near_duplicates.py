@@ -0,0 +1,200 @@
+"""
+Near-duplicate detection of syndicated stories with MinHash and LSH banding.
+"""
+import hashlib
+import random
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.config import NEAR_DUPLICATE_SETTINGS
+
+# Modulus of the universal hash functions standing in for random permutations (a Mersenne prime)
+_PRIME = (1 << 61) - 1
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _token_hash(token: str) -> int:
+    """Hash a token to 64 bits, the same in every process (unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def story_text(title: str, summary: str = "") -> str:
+    """Return the text a story is compared by."""
+    return f"{title or ''} {summary or ''}"
+
+
+class MinHasher:
+    """
+    Computes MinHash signatures, whose share of equal values estimates the
+    Jaccard similarity of the word sets of two texts.
+    """
+
+    def __init__(self, num_perm: int = NEAR_DUPLICATE_SETTINGS["num_perm"], seed: int = 1):
+        """
+        Draw the hash functions.
+
+        Args:
+            num_perm: Number of hash functions, i.e. the signature length
+            seed: Seed of the hash functions; signatures only compare under the same seed
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [(rng.randrange(1, _PRIME), rng.randrange(_PRIME)) for _ in range(num_perm)]
+
+    def signature(self, text: str, min_tokens: int = NEAR_DUPLICATE_SETTINGS["min_tokens"]) -> Optional[Tuple[int, ...]]:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: The text
+            min_tokens: Fewest words worth comparing
+
+        Returns:
+            Tuple of num_perm ints, or None if the text is too short
+        """
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        if len(tokens) < min_tokens:
+            return None
+        hashes = [_token_hash(token) for token in set(tokens)]
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self._params)
+
+
+class NearDuplicateIndex:
+    """
+    Groups stories whose title and summary share most of their words.
+
+    A story's MinHash signature is split into `bands` bands, and each band is a
+    hash bucket. Two stories land in a common bucket with a probability that
+    rises steeply around the similarity threshold, so looking up a story's
+    bucket in each band finds its copies without comparing it against the whole
+    corpus; only the few stories sharing a bucket have their similarity checked.
+
+    The first story of a group is its canonical copy; later copies are grouped
+    under its URL.
+    """
+
+    def __init__(self,
+                 threshold: float = NEAR_DUPLICATE_SETTINGS["threshold"],
+                 num_perm: int = NEAR_DUPLICATE_SETTINGS["num_perm"],
+                 bands: int = NEAR_DUPLICATE_SETTINGS["bands"],
+                 min_tokens: int = NEAR_DUPLICATE_SETTINGS["min_tokens"]):
+        """
+        Initialize an empty index.
+
+        Args:
+            threshold: Estimated Jaccard similarity above which stories are copies
+            num_perm: MinHash signature length
+            bands: Number of LSH bands; must divide num_perm
+            min_tokens: Fewest words of a story worth comparing
+
+        Raises:
+            ValueError: If bands doesn't divide num_perm
+        """
+        if num_perm % bands:
+            raise ValueError(f"{bands} bands don't divide a signature of {num_perm} values")
+        self.threshold = threshold
+        self.bands = bands
+        self.min_tokens = min_tokens
+        self.hasher = MinHasher(num_perm)
+        self._rows = num_perm // bands
+        # (band, band values) -> (signature, canonical URL) of the stories in the bucket
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[Tuple[Tuple[int, ...], str]]] = {}
+        # URL -> canonical URL of its group
+        self._groups: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        # Metrics
+        self.comparisons = 0
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        """Return the bucket of a signature in every band."""
+        rows = self._rows
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def _find(self, signature: Tuple[int, ...]) -> Optional[str]:
+        """Return the canonical URL of the most similar indexed copy of a signature, if any."""
+        best, best_similarity = None, self.threshold
+        seen = set()
+        for key in self._band_keys(signature):
+            for other, canonical in self._buckets.get(key, ()):
+                if id(other) in seen:
+                    continue
+                seen.add(id(other))
+                self.comparisons += 1
+                similarity = sum(x == y for x, y in zip(signature, other)) / len(signature)
+                if similarity >= best_similarity:
+                    best, best_similarity = canonical, similarity
+        return best
+
+    def match(self, title: str, summary: str = "") -> Optional[str]:
+        """
+        Look up an indexed copy of a story without adding it.
+
+        Args:
+            title: Title of the story
+            summary: Summary of the story
+
+        Returns:
+            str or None: Canonical URL of the story's group, if it has copies
+        """
+        signature = self.hasher.signature(story_text(title, summary), self.min_tokens)
+        if signature is None:
+            return None
+        with self._lock:
+            return self._find(signature)
+
+    def add(self, url: str, title: str, summary: str = "", canonical: Optional[str] = None) -> str:
+        """
+        Add a story, grouping it with an indexed copy if there is one.
+
+        Args:
+            url: URL of the story
+            title: Title of the story
+            summary: Summary of the story
+            canonical: Known canonical URL of the story's group, e.g. from the
+                article store; looked up if not given
+
+        Returns:
+            str: Canonical URL of the story's group, the story's own URL if it
+            has no copies
+        """
+        signature = self.hasher.signature(story_text(title, summary), self.min_tokens)
+        with self._lock:
+            if url in self._groups:
+                return self._groups[url]
+            if canonical is None and signature is not None:
+                canonical = self._find(signature)
+            canonical = canonical or url
+            self._groups[url] = canonical
+            if canonical != url:
+                self.duplicates += 1
+            if signature is not None:
+                for key in self._band_keys(signature):
+                    self._buckets.setdefault(key, []).append((signature, canonical))
+            return canonical
+
+    def add_all(self, stories: Iterable[Tuple[str, str, str, Optional[str]]]) -> None:
+        """
+        Add already grouped stories, such as the stored ones.
+
+        Args:
+            stories: (url, title, summary, canonical URL or None) tuples
+        """
+        for url, title, summary, canonical in stories:
+            self.add(url, title, summary, canonical)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the detection metrics.
+
+        Returns:
+            Dict with the number of stories, duplicates found and similarity
+            checks made
+        """
+        with self._lock:
+            return {"stories": len(self._groups), "duplicates": self.duplicates, "comparisons": self.comparisons}
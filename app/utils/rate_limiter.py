@@ -0,0 +1,137 @@
+"""
+Per-host token-bucket rate limiting for outgoing requests.
+"""
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+from utils.config import NEWS_SOURCES, DEFAULT_RATE_LIMIT
+from utils.metrics import metrics
+
+
+class TokenBucket:
+    """
+    Token bucket that allows bursts of up to `calls` requests and refills at
+    `calls / period` tokens per second.
+    """
+    
+    def __init__(self, calls: int, period: float):
+        """
+        Initialize the bucket.
+        
+        Args:
+            calls: Number of requests allowed per period (also the burst size)
+            period: Length of the period in seconds
+        """
+        self.capacity = float(calls)
+        self.rate = calls / period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket.
+        
+        The token may be borrowed from the future, in which case the caller has to
+        wait before using it. Waiting callers queue up behind each other, so the
+        configured rate holds no matter how many threads share the bucket.
+        
+        Returns:
+            float: Number of seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """
+    Rate limiter keeping one token bucket per host.
+    
+    Limits are taken from the `rate_limit` entry of each source in NEWS_SOURCES and
+    apply to every host that source's URLs point at. Hosts that aren't configured
+    fall back to DEFAULT_RATE_LIMIT.
+    """
+    
+    def __init__(self, sources: Dict = NEWS_SOURCES, default_limit: Dict = DEFAULT_RATE_LIMIT):
+        """
+        Initialize the limiter.
+        
+        Args:
+            sources: News source configuration (see utils.config.NEWS_SOURCES)
+            default_limit: Limit for hosts not covered by any source
+        """
+        self.default_limit = (default_limit["calls"], default_limit["period"])
+        self.host_limits: Dict[str, Tuple[int, float]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        
+        for source_config in sources.values():
+            limit = source_config.get("rate_limit")
+            if not limit:
+                continue
+            urls = [source_config.get("base_url", "")]
+            urls += list(source_config.get("rss_feeds", {}).values())
+            urls += list(source_config.get("sections", {}).values())
+            for url in urls:
+                host = self._host(url)
+                if host:
+                    self.host_limits[host] = (limit["calls"], limit["period"])
+    
+    @staticmethod
+    def _host(url: str) -> str:
+        """Return the lower-cased host name of a URL."""
+        return (urlparse(url).hostname or "").lower()
+    
+    def _bucket(self, host: str) -> TokenBucket:
+        """Get or create the token bucket for a host."""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    calls, period = self.host_limits.get(host, self.default_limit)
+                    bucket = TokenBucket(calls, period)
+                    self._buckets[host] = bucket
+        return bucket
+    
+    def reserve(self, url: str) -> float:
+        """
+        Reserve a request slot for the host of a URL without blocking.
+        
+        Args:
+            url: URL that is about to be requested
+            
+        Returns:
+            float: Number of seconds to wait before sending the request
+        """
+        host = self._host(url)
+        wait = self._bucket(host).reserve()
+        metrics.observe("rate_limit_wait_seconds", wait, host=host)
+        return wait
+    
+    def acquire(self, url: str) -> float:
+        """
+        Block until a request to the host of a URL is allowed.
+        
+        Args:
+            url: URL that is about to be requested
+            
+        Returns:
+            float: Number of seconds spent waiting
+        """
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# Shared limiter so every scraper draws from the same per-host budgets
+rate_limiter = HostRateLimiter()
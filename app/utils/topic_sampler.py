@@ -0,0 +1,155 @@
+"""
+Weighted topic sampling with a Walker/Vose alias table.
+"""
+import random
+from typing import Dict, Hashable, List, Optional, Sequence
+
+from utils.config import TOPICS
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table for drawing from a fixed discrete distribution.
+
+    Building the table takes O(n) for n outcomes; every draw after that takes a
+    single random number and O(1) time, however skewed the weights are.
+    """
+
+    __slots__ = ("keys", "probabilities", "aliases")
+
+    def __init__(self, keys: Sequence[Hashable], weights: Sequence[float]):
+        """
+        Build the table.
+
+        Args:
+            keys: The outcomes
+            weights: Non-negative weight of each outcome; they needn't sum to 1
+
+        Raises:
+            ValueError: If there are no outcomes or no positive weight
+        """
+        total = float(sum(weights))
+        if not keys or len(keys) != len(weights) or total <= 0:
+            raise ValueError("An alias table needs outcomes with a positive total weight")
+
+        n = len(keys)
+        self.keys = list(keys)
+        self.probabilities = [0.0] * n
+        self.aliases = list(range(n))
+
+        # Scale so the average weight is 1, then pair each light outcome with a heavy one
+        scaled = [weight * n / total for weight in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            light, heavy = small.pop(), large.pop()
+            self.probabilities[light] = scaled[light]
+            self.aliases[light] = heavy
+            scaled[heavy] -= 1.0 - scaled[light]
+            (small if scaled[heavy] < 1.0 else large).append(heavy)
+        # Whatever is left is 1 up to rounding error
+        for i in small + large:
+            self.probabilities[i] = 1.0
+
+    def sample(self, rng=random) -> Hashable:
+        """
+        Draw one outcome.
+
+        Args:
+            rng: Random number generator, the random module's by default
+
+        Returns:
+            The drawn key
+        """
+        # One uniform number picks the column (integer part) and the coin flip (fraction)
+        u = rng.random() * len(self.keys)
+        column = int(u)
+        return self.keys[column if u - column < self.probabilities[column] else self.aliases[column]]
+
+    def sample_many(self, k: int, rng=random) -> List[Hashable]:
+        """
+        Draw k outcomes independently.
+
+        Args:
+            k: Number of draws
+            rng: Random number generator, the random module's by default
+
+        Returns:
+            List of the drawn keys
+        """
+        keys, probabilities, aliases, n = self.keys, self.probabilities, self.aliases, len(self.keys)
+        draws = []
+        for _ in range(k):
+            u = rng.random() * n
+            column = int(u)
+            draws.append(keys[column if u - column < probabilities[column] else aliases[column]])
+        return draws
+
+
+class TopicSampler:
+    """
+    Draws topics with the probabilities configured in TOPICS.
+
+    Topics without any live articles are masked out, so a draw never lands on a
+    topic there is nothing to show for. Topics that have articles but aren't
+    configured get the smallest configured probability. The alias table is
+    rebuilt only when the per-topic counts change; draws never rebuild it.
+    """
+
+    def __init__(self, topics: Dict = TOPICS, counts: Optional[Dict[str, int]] = None, rng=random):
+        """
+        Initialize the sampler.
+
+        Args:
+            topics: Topic configuration (see utils.config.TOPICS)
+            counts: Live number of articles per topic; None to draw from all
+                configured topics
+            rng: Random number generator, the random module's by default
+        """
+        self.probabilities = {key: config["probability"] for key, config in topics.items()}
+        self.min_probability = min(self.probabilities.values())
+        self.rng = rng
+        self._table: Optional[AliasTable] = None
+        self.update_counts(counts)
+
+    def update_counts(self, counts: Optional[Dict[str, int]]) -> None:
+        """
+        Rebuild the alias table for new per-topic article counts.
+
+        Args:
+            counts: Live number of articles per topic; None to draw from all
+                configured topics
+        """
+        if counts is None:
+            live = list(self.probabilities)
+        else:
+            live = [topic for topic, count in counts.items() if count > 0]
+        if not live:
+            self._table = None
+            return
+        weights = [self.probabilities.get(topic, self.min_probability) for topic in live]
+        # Swap in the finished table in one step, so concurrent draws never see a partial one
+        self._table = AliasTable(live, weights)
+
+    def sample(self) -> Optional[str]:
+        """
+        Draw one topic.
+
+        Returns:
+            str or None: The topic key, or None if no topic has articles
+        """
+        table = self._table
+        return table.sample(self.rng) if table else None
+
+    def sample_many(self, k: int) -> List[str]:
+        """
+        Draw k topics at once, e.g. to plan the next k daily articles.
+
+        Args:
+            k: Number of draws
+
+        Returns:
+            List of topic keys; empty if no topic has articles
+        """
+        table = self._table
+        return table.sample_many(k, self.rng) if table else []
@@ -0,0 +1,90 @@
+"""
+Benchmark article selection with the topic/source index against the original list scan.
+
+Usage:
+    python benchmarks/bench_article_selection.py [--sizes 100,1000,10000] [--picks N]
+
+The corpus is synthesized from the legacy JSON cache in data/, duplicated with
+fresh URLs until it reaches each size, so no network access is needed.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from collections import Counter, defaultdict
+
+# The app modules import each other relative to the app directory
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+sys.path.insert(0, APP_DIR)
+
+from utils.config import ARTICLES_CACHE_FILE
+from utils.article import Article
+from utils.article_index import ArticleIndex
+
+
+def legacy_select_article(articles, topic=None, source=None):
+    """The original select_article, kept here as the baseline."""
+    if not articles:
+        return None
+    filtered_articles = articles
+    if topic:
+        filtered_articles = [a for a in filtered_articles if a.topic == topic]
+        if not filtered_articles:
+            return None
+    if source:
+        filtered_articles = [a for a in filtered_articles if a.source_key.lower() == source.lower()]
+        if not filtered_articles:
+            return None
+    if source:
+        return random.choice(filtered_articles)
+    articles_by_source = defaultdict(list)
+    for article in filtered_articles:
+        articles_by_source[article.source or 'unknown'].append(article)
+    if not articles_by_source:
+        return None
+    selected_source = random.choice(list(articles_by_source.keys()))
+    return random.choice(articles_by_source[selected_source])
+
+
+def load_corpus(size):
+    """Build a corpus of `size` articles from the cached ones."""
+    with open(ARTICLES_CACHE_FILE, "r", encoding="utf-8") as f:
+        cached = [item for item in json.load(f) if item.get("url")]
+    articles = []
+    for i in range(size):
+        item = dict(cached[i % len(cached)])
+        item["url"] = f"{item['url']}#{i}"
+        item.setdefault("source_key", item.get("source", ""))
+        articles.append(Article.from_dict(item))
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma-separated corpus sizes")
+    parser.add_argument("--picks", type=int, default=2000, help="Selections per timing")
+    args = parser.parse_args()
+
+    for size in [int(s) for s in args.sizes.split(",")]:
+        articles = load_corpus(size)
+        topic = Counter(a.topic for a in articles).most_common(1)[0][0]
+        build = min(timeit.repeat(lambda: ArticleIndex(articles), number=1, repeat=3))
+        index = ArticleIndex(articles)
+
+        print(f"{size} articles (index built in {build * 1000:.1f} ms), {args.picks} picks, best of 5")
+        for label, filters in (("any topic", (None, None)), (f"topic={topic}", (topic, None))):
+            legacy = min(timeit.repeat(lambda: legacy_select_article(articles, *filters), number=args.picks, repeat=5))
+            indexed = min(timeit.repeat(lambda: index.select(*filters), number=args.picks, repeat=5))
+            print(f"  {label:<22} list scan {legacy / args.picks * 1e6:9.2f} us   "
+                  f"index {indexed / args.picks * 1e6:6.2f} us  ({legacy / indexed:7.1f}x)")
+
+        # Uniform across sources: each source should get an equal share of picks
+        picks = Counter(index.select().source for _ in range(20000))
+        shares = ", ".join(f"{source} {count / 20000:.0%}" for source, count in sorted(picks.items()))
+        print(f"  source shares with the index: {shares}")
+
+
+if __name__ == "__main__":
+    main()
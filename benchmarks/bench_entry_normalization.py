@@ -0,0 +1,88 @@
+"""
+Compare RSS entry normalization against the two BeautifulSoup passes it replaced.
+
+Usage:
+    python benchmarks/bench_entry_normalization.py [--repeat N] [--fixtures DIR]
+
+Parses every RSS feed in the fixtures with feedparser, then times, per entry,
+turning the summary HTML into text and looking for an image: once the old way
+(a BeautifulSoup tree for the text plus a second one over that text for the
+image) and once with BaseScraper.normalize_entry's single pass.
+"""
+import argparse
+import html
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+import feedparser
+from bs4 import BeautifulSoup
+
+# The app modules import each other relative to the app directory
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+sys.path.insert(0, APP_DIR)
+
+from fixtures import FIXTURES_DIR, load_fixtures
+
+
+def double_soup(entry: Dict) -> tuple:
+    """The scrapers' previous summary handling."""
+    summary = ''
+    if 'summary' in entry:
+        summary = BeautifulSoup(entry.summary, 'lxml').get_text().strip()
+    elif 'description' in entry:
+        summary = BeautifulSoup(entry.description, 'lxml').get_text().strip()
+    image_url = ''
+    if summary:
+        img_tag = BeautifulSoup(summary, 'lxml').find('img')
+        if img_tag and img_tag.has_attr('src'):
+            image_url = img_tag['src']
+    return html.unescape(summary), image_url
+
+
+def time_per_entry(normalize: Callable, entries: List[Dict], repeat: int) -> List[float]:
+    """Time normalize on every entry, returning microseconds per call."""
+    samples = []
+    for _ in range(repeat):
+        for entry in entries:
+            started = time.perf_counter()
+            normalize(entry)
+            samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the entries")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Directory of recorded fixtures")
+    args = parser.parse_args()
+
+    from scrapers.bbc_scraper import BBCScraper
+
+    fixtures = load_fixtures(args.fixtures)
+    entries = []
+    for status, content_type, body in fixtures.responses.values():
+        if status == 200 and "xml" in content_type:
+            entries += feedparser.parse(body).entries
+    if not entries:
+        print("No RSS feeds in the fixtures")
+        return 1
+
+    scraper = BBCScraper()
+    print(f"{len(entries)} entries from {fixtures.description}, {args.repeat} passes")
+    results = {}
+    for name, normalize in (("double soup", double_soup), ("normalize_entry", scraper.normalize_entry)):
+        samples = time_per_entry(normalize, entries, args.repeat)
+        results[name] = statistics.median(samples)
+        print(f"  {name:<16} median {results[name]:8.1f} us  mean {statistics.fmean(samples):8.1f} us per entry")
+    print(f"  speedup {results['double soup'] / results['normalize_entry']:.1f}x")
+
+    mismatches = sum(double_soup(entry)[0] != scraper.normalize_entry(entry)[0] for entry in entries)
+    print(f"  summaries differing from the old text: {mismatches}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
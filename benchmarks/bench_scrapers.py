@@ -0,0 +1,248 @@
+"""
+Benchmark the scraping pipeline offline, stage by stage, against recorded responses.
+
+Usage:
+    python benchmarks/bench_scrapers.py [--repeat N] [--fixtures DIR]
+                                        [--baseline PATH] [--save-baseline] [--fail-on-regression]
+
+Every scraper runs against a local stub server replaying the fixtures (see
+fixtures.py and record_fixtures.py), with the per-host rate limits lifted, so
+the timings cover parsing and extraction rather than the network or politeness
+delays. For each stage the report lists latency percentiles per operation and,
+from a separate traced pass, the peak and retained Python allocations of the
+main process (extraction workers run in their own processes and aren't traced).
+The results are compared with a saved baseline so regressions stand out.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import requests
+
+# The app modules import each other relative to the app directory
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+sys.path.insert(0, APP_DIR)
+
+from fixtures import FIXTURES_DIR, load_fixtures
+from stub_server import StubServer, route_to_stub
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def isolate_app(workdir: str, server: StubServer) -> None:
+    """
+    Point the app's shared state at the stub server and a scratch directory.
+
+    Args:
+        workdir: Directory for the feed cache and the article store
+        server: The running stub server
+    """
+    from utils import http_client, article_store
+    from utils.rate_limiter import rate_limiter
+    from scrapers import async_fetcher
+    from scrapers.feed_cache import feed_cache
+
+    route_to_stub(http_client.get_session(), server)
+    # No politeness delays against the stub
+    rate_limiter.host_limits.clear()
+    rate_limiter.default_limit = (10 ** 6, 1.0)
+    rate_limiter._buckets.clear()
+    # The stub only speaks through the requests session
+    async_fetcher.AIOHTTP_AVAILABLE = False
+    async_fetcher.REQUEST_ERRORS = (requests.RequestException,)
+    feed_cache.cache_dir = workdir
+    article_store._store = article_store.ArticleStore(os.path.join(workdir, "articles.db"), legacy_json_path=None)
+
+
+def time_operations(operations: List[Callable], repeat: int) -> List[float]:
+    """
+    Time each operation individually.
+
+    Args:
+        operations: Zero-argument callables
+        repeat: Passes over the operations
+
+    Returns:
+        List of durations in seconds, one per call
+    """
+    samples = []
+    for _ in range(repeat):
+        for operation in operations:
+            started = time.perf_counter()
+            operation()
+            samples.append(time.perf_counter() - started)
+    return samples
+
+
+def trace_allocations(operations: List[Callable]) -> Dict[str, float]:
+    """
+    Run the operations once with tracemalloc on.
+
+    Args:
+        operations: Zero-argument callables
+
+    Returns:
+        Dict with the peak and the retained allocations in KiB
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        results = [operation() for operation in operations]
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del results
+    return {"peak_kib": (peak - before) / 1024, "retained_kib": (current - before) / 1024}
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Turn durations into latency percentiles in milliseconds."""
+    ms = sorted(sample * 1000 for sample in samples)
+    if len(ms) > 1:
+        cuts = statistics.quantiles(ms, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    else:
+        p50 = p90 = p99 = ms[0]
+    return {"n": len(ms), "mean_ms": statistics.fmean(ms), "p50_ms": p50, "p90_ms": p90, "p99_ms": p99, "max_ms": ms[-1]}
+
+
+def build_stages(scrapers: Dict, articles: List) -> Dict[str, List[Callable]]:
+    """
+    Build the operations of every stage.
+
+    Args:
+        scrapers: Scraper instances by source id
+        articles: Articles scraped in the warm-up pass
+
+    Returns:
+        Operations by stage name
+    """
+    from scrapers.base_scraper import BaseScraper
+    from components.article_selector import select_article
+    from utils.article_index import ArticleIndex
+    from utils.article_store import get_article_store
+    from utils.config import TOPICS
+
+    stages = {f"scrape_articles.{key}": [scraper.scrape_articles] for key, scraper in scrapers.items()}
+
+    any_scraper = next(iter(scrapers.values()))
+    stages["classify_topic"] = [
+        (lambda a=article: any_scraper.classify_topic(a.title, a.body or a.summary)) for article in articles
+    ]
+
+    # Article pages as each source's extractor sees them, a few per source
+    extract = []
+    for key, scraper in scrapers.items():
+        urls = [article.url for article in articles if article.source_key == key][:5]
+        extract += [(lambda s=scraper, u=url: s.extract_article_content(u)) for url in urls]
+    stages["extract_article_content"] = extract
+
+    store = get_article_store()
+    stages["cache_save"] = [lambda: store.write_batch(articles, BaseScraper.CACHE_TTL_DAYS)]
+    stages["cache_load"] = [lambda: store.load_articles(BaseScraper.CACHE_TTL_DAYS)]
+
+    index = ArticleIndex(articles)
+    rng = random.Random(3)
+    topics = [None] + list(TOPICS)
+    sources = [None] + sorted({article.source_key for article in articles})
+    filters = [(rng.choice(topics), rng.choice(sources)) for _ in range(1000)]
+    stages["select_article"] = [(lambda t=t, s=s: select_article(index, t, s)) for t, s in filters]
+    return stages
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results: Stage results of this run
+        baseline: Stage results of the baseline run
+        tolerance: Allowed relative slowdown of the median before it counts as a regression
+
+    Returns:
+        Names of the stages that regressed
+    """
+    regressions = []
+    print(f"\nAgainst the baseline (regression: median more than {tolerance:.0%} slower)")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            print(f"  {name:<34} new stage")
+            continue
+        change = result["p50_ms"] / base["p50_ms"] - 1 if base["p50_ms"] else 0.0
+        flag = ""
+        if change > tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"  {name:<34} p50 {base['p50_ms']:9.3f} -> {result['p50_ms']:9.3f} ms ({change:+6.1%})"
+              f"  peak {base['peak_kib']:8.1f} -> {result['peak_kib']:8.1f} KiB{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over each stage's operations")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Directory of recorded fixtures")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Save this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed median slowdown, e.g. 0.5 for 50%%")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with 1 if any stage regressed")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    with tempfile.TemporaryDirectory() as workdir, StubServer(fixtures) as server:
+        isolate_app(workdir, server)
+        from scrapers.scraper_factory import ScraperFactory
+        # Per-request log lines would swamp the report
+        logging.disable(logging.INFO)
+
+        scrapers = {scraper.source_id: scraper for scraper in ScraperFactory.get_all_scrapers()}
+        # Warm-up pass: starts the extraction workers and collects the articles later stages use
+        articles = []
+        for scraper in scrapers.values():
+            for article in scraper.scrape_articles():
+                article.source_key = scraper.source_id
+                articles.append(article)
+
+        print(f"{len(fixtures)} fixtures {fixtures.description}, {len(articles)} articles, "
+              f"{args.repeat} passes per stage")
+        print(f"  {'stage':<34} {'n':>5} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9} ms  {'peak':>9} {'kept':>8} KiB")
+        results = {}
+        for name, operations in build_stages(scrapers, articles).items():
+            result = summarize(time_operations(operations, args.repeat))
+            result.update(trace_allocations(operations))
+            results[name] = result
+            print(f"  {name:<34} {result['n']:>5} {result['p50_ms']:9.3f} {result['p90_ms']:9.3f} "
+                  f"{result['p99_ms']:9.3f} {result['max_ms']:9.3f}     {result['peak_kib']:9.1f} "
+                  f"{result['retained_kib']:8.1f}")
+        print(f"  stub server: {server.requests} requests, {server.misses} not recorded")
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f)["stages"], args.tolerance)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "fixtures": fixtures.description,
+                "repeat": args.repeat,
+                "stages": results
+            }, f, indent=2)
+        print(f"\nSaved baseline to {args.baseline}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
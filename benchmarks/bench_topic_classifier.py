@@ -0,0 +1,78 @@
+"""
+Benchmark the compiled topic classifier against the original nested-loop implementation.
+
+Usage:
+    python benchmarks/bench_topic_classifier.py [--repeat N]
+
+Articles are taken from the legacy JSON cache in data/, so no network access is needed.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+# The app modules import each other relative to the app directory
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+sys.path.insert(0, APP_DIR)
+
+from utils.config import TOPICS, ARTICLES_CACHE_FILE
+from scrapers.topic_classifier import TopicClassifier
+
+
+def legacy_classify_topic(title: str, content: str) -> str:
+    """The original BaseScraper.classify_topic, kept here as the baseline."""
+    text = (title + " " + content).lower()
+    
+    topic_scores = {}
+    for topic_key, topic_data in TOPICS.items():
+        score = 0
+        for keyword in topic_data["keywords"]:
+            keyword = keyword.lower()
+            if keyword in title.lower():
+                score += 2
+            if keyword in content.lower():
+                score += 1
+        topic_scores[topic_key] = score * topic_data.get("probability", 1.0)
+    
+    return max(topic_scores.items(), key=lambda x: x[1])[0]
+
+
+def load_items():
+    """Load (title, content) pairs from the cached articles."""
+    with open(ARTICLES_CACHE_FILE, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    return [(a.get("title", ""), a.get("content") or a.get("summary", "")) for a in articles]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50, help="Passes over the corpus per timing")
+    args = parser.parse_args()
+    
+    items = load_items()
+    classifier = TopicClassifier()
+    
+    timings = {
+        "legacy loop": lambda: [legacy_classify_topic(t, c) for t, c in items],
+        "compiled classify": lambda: [classifier.classify(t, c) for t, c in items],
+        "compiled classify_many": lambda: classifier.classify_many(items),
+    }
+    
+    print(f"{len(items)} articles, {args.repeat} passes, best of 5")
+    baseline = None
+    for name, run in timings.items():
+        best = min(timeit.repeat(run, number=args.repeat, repeat=5))
+        per_article_us = best / (args.repeat * len(items)) * 1e6
+        baseline = baseline or per_article_us
+        print(f"  {name:<24} {per_article_us:8.2f} us/article  ({baseline / per_article_us:5.1f}x)")
+    
+    # Word-boundary matching is stricter than substring matching, so some labels change
+    legacy = [legacy_classify_topic(t, c) for t, c in items]
+    compiled = classifier.classify_many(items)
+    agreement = sum(a == b for a, b in zip(legacy, compiled)) / len(items)
+    print(f"Label agreement with legacy classifier: {agreement:.1%}")
+
+
+if __name__ == "__main__":
+    main()
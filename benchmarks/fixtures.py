@@ -0,0 +1,231 @@
+"""
+Recorded (or synthesized) HTTP responses for replaying the scrapers offline.
+
+A fixture set maps every URL the scrapers request to the response they got.
+Recorded sets live in a directory holding a manifest.json and one file per
+response body (see record_fixtures.py). Without a recording, a deterministic set
+is synthesized from the legacy JSON cache in data/, shaped like each site's
+feeds and pages so every scraper parses it the way it parses the real thing.
+"""
+import datetime
+import email.utils
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# The app modules import each other relative to the app directory
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+sys.path.insert(0, APP_DIR)
+
+from utils.config import ARTICLES_CACHE_FILE, NEWS_SOURCES
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+MANIFEST = "manifest.json"
+
+# (status, content type, body)
+Response = Tuple[int, str, bytes]
+
+RSS_TYPE = "application/rss+xml; charset=utf-8"
+HTML_TYPE = "text/html; charset=utf-8"
+
+
+class FixtureSet:
+    """Responses by URL, either recorded or synthesized."""
+
+    def __init__(self, responses: Dict[str, Response], description: str):
+        """
+        Initialize the set.
+
+        Args:
+            responses: (status, content type, body) by URL
+            description: Where the responses came from, for reports
+        """
+        self.responses = responses
+        self.description = description
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def get(self, url: str) -> Optional[Response]:
+        """
+        Look up the response to a URL.
+
+        Args:
+            url: The requested URL
+
+        Returns:
+            (status, content type, body), or None if the URL wasn't recorded
+        """
+        return self.responses.get(url)
+
+    def save(self, directory: str) -> None:
+        """
+        Write the set to a directory as a manifest plus one file per body.
+
+        Args:
+            directory: Target directory, created if missing
+        """
+        os.makedirs(os.path.join(directory, "responses"), exist_ok=True)
+        manifest = {}
+        for url, (status, content_type, body) in sorted(self.responses.items()):
+            name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+            path = f"responses/{name}.{'xml' if 'xml' in content_type else 'html'}"
+            with open(os.path.join(directory, path), "wb") as f:
+                f.write(body)
+            manifest[url] = {"status": status, "content_type": content_type, "path": path}
+        with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+    @classmethod
+    def load(cls, directory: str) -> "FixtureSet":
+        """
+        Read a set written by save().
+
+        Args:
+            directory: Directory holding the manifest
+
+        Returns:
+            FixtureSet: The recorded responses
+        """
+        with open(os.path.join(directory, MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        responses = {}
+        for url, entry in manifest.items():
+            with open(os.path.join(directory, entry["path"]), "rb") as f:
+                responses[url] = (entry["status"], entry["content_type"], f.read())
+        return cls(responses, f"recorded in {directory}")
+
+
+def load_fixtures(directory: str = FIXTURES_DIR) -> FixtureSet:
+    """
+    Load the recorded fixtures, or synthesize a set if nothing was recorded.
+
+    Args:
+        directory: Directory of a recording
+
+    Returns:
+        FixtureSet: The fixtures
+    """
+    if os.path.exists(os.path.join(directory, MANIFEST)):
+        return FixtureSet.load(directory)
+    return synthesize_fixtures()
+
+
+def _slug(title: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")[:60] or "article"
+
+
+def _rss(title: str, link: str, items: List[Dict]) -> bytes:
+    """Render an RSS 2.0 feed."""
+    entries = "".join(
+        f"<item><title>{html.escape(item['title'])}</title><link>{html.escape(item['url'])}</link>"
+        f"<guid>{html.escape(item['url'])}</guid>"
+        f"<description>{html.escape('<p>' + html.escape(item['summary']) + '</p>')}</description>"
+        f"<pubDate>{item['pub_date']}</pubDate>"
+        f"<media:content url=\"{html.escape(item['image_url'])}\" medium=\"image\"/></item>"
+        for item in items
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+        f"<title>{html.escape(title)}</title><link>{html.escape(link)}</link><description>{html.escape(title)}</description>"
+        f"{entries}</channel></rss>"
+    ).encode("utf-8")
+
+
+def _article_page(item: Dict) -> bytes:
+    """
+    Render an article page that the generic, Guardian and TOI extractors all
+    recognize, wrapped in the kind of navigation and script noise real pages carry.
+    """
+    paragraphs = "".join(f"<p>{html.escape(paragraph)}</p>" for paragraph in item["paragraphs"])
+    navigation = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(40))
+    return (
+        "<!DOCTYPE html><html><head>"
+        f"<title>{html.escape(item['title'])}</title>"
+        f'<meta name="description" content="{html.escape(item["summary"])}">'
+        f'<meta property="og:image" content="{html.escape(item["image_url"])}">'
+        f'<meta property="article:published_time" content="{item["iso_date"]}">'
+        '<meta name="author" content="Staff Reporter">'
+        "<script>window.__state = {\"ads\": true};</script></head><body>"
+        f"<header><nav><ul>{navigation}</ul></nav></header>"
+        f"<main><article><h1>{html.escape(item['title'])}</h1>"
+        f'<div class="article-body-commercial-selector _3WlLe">{paragraphs}'
+        f'<img src="{html.escape(item["image_url"])}"><script>track();</script></div></article></main>'
+        f"<footer><ul>{navigation}</ul></footer></body></html>"
+    ).encode("utf-8")
+
+
+def synthesize_fixtures(seed: int = 7) -> FixtureSet:
+    """
+    Build fixtures for every scraper from the articles in the legacy JSON cache.
+
+    Args:
+        seed: Seed for the choice of articles, so runs are comparable
+
+    Returns:
+        FixtureSet: Feeds, section listings and article pages for all sources
+    """
+    with open(ARTICLES_CACHE_FILE, "r", encoding="utf-8") as f:
+        cached = [item for item in json.load(f) if item.get("title") and item.get("summary")]
+    rng = random.Random(seed)
+    summaries = [item["summary"] for item in cached]
+    responses: Dict[str, Response] = {}
+    counter = iter(range(10 ** 9))
+
+    def story(base_url: str, section: str) -> Dict:
+        source = rng.choice(cached)
+        n = next(counter)
+        published = 1743984000 + n * 977
+        return {
+            "title": source["title"],
+            "summary": source["summary"],
+            "url": f"{base_url}/{section}/{_slug(source['title'])}-{n}",
+            "image_url": f"{base_url}/images/{n}.jpg",
+            "pub_date": email.utils.formatdate(published, usegmt=True),
+            "iso_date": datetime.datetime.fromtimestamp(published, datetime.timezone.utc).isoformat(),
+            "paragraphs": [" ".join(rng.sample(summaries, 3)) for _ in range(8)]
+        }
+
+    # RSS sources: 15 entries per feed, plus the article page of each entry
+    for key in ("hindu", "telegraph", "bbc", "reuters"):
+        config = NEWS_SOURCES[key]
+        for category, feed_url in config["rss_feeds"].items():
+            items = [story(config["base_url"], category) for _ in range(15)]
+            responses[feed_url] = (200, RSS_TYPE, _rss(config["name"], config["base_url"], items))
+            for item in items:
+                responses[item["url"]] = (200, HTML_TYPE, _article_page(item))
+
+    # The Guardian: section pages linking to articles
+    for section, section_url in NEWS_SOURCES["guardian"]["sections"].items():
+        items = [story("https://www.theguardian.com", section) for _ in range(8)]
+        links = "".join(
+            f'<div class="fc-item"><a class="u-faux-block-link__overlay" href="{html.escape(item["url"])}">'
+            f"{html.escape(item['title'])}</a></div>"
+            for item in items
+        )
+        responses[section_url] = (200, HTML_TYPE, f"<html><body><main>{links}</main></body></html>".encode("utf-8"))
+        for item in items:
+            responses[item["url"]] = (200, HTML_TYPE, _article_page(item))
+
+    # Times of India: topic pages with relative links
+    base_url = NEWS_SOURCES["toi"]["base_url"]
+    for section, section_url in NEWS_SOURCES["toi"]["sections"].items():
+        items = [story(base_url, section) for _ in range(8)]
+        links = "".join(
+            f'<div class="uwU81"><a href="{html.escape(item["url"][len(base_url):])}">'
+            f'<div class="fHv_i">{html.escape(item["title"])}</div></a></div>'
+            for item in items
+        )
+        responses[section_url] = (
+            200, HTML_TYPE, f"<html><body>{links}</body></html>".encode("utf-8")
+        )
+        for item in items:
+            responses[item["url"]] = (200, HTML_TYPE, _article_page(item))
+
+    return FixtureSet(responses, f"synthesized from {os.path.basename(ARTICLES_CACHE_FILE)}")
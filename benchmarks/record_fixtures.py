@@ -0,0 +1,93 @@
+"""
+Record the live responses every scraper gets, as fixtures for bench_scrapers.py.
+
+Usage:
+    python benchmarks/record_fixtures.py [--output DIR] [--sources bbc,hindu,...]
+
+Runs each scraper once against the real sites (rate limits apply as usual) and
+saves every successful response it received to benchmarks/fixtures/. Re-record
+when a site's markup changes; until a recording exists, the benchmarks replay
+fixtures synthesized from the legacy JSON cache instead.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# The app modules import each other relative to the app directory
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+sys.path.insert(0, APP_DIR)
+
+from fixtures import FIXTURES_DIR, FixtureSet
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter keeping a copy of every successful response and redirect."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.responses = {}
+        self.redirects = {}
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        with self._lock:
+            if response.is_redirect:
+                self.redirects[request.url] = urljoin(request.url, response.headers["Location"])
+            elif response.status_code == 200:
+                content_type = response.headers.get("Content-Type", "text/html")
+                self.responses[request.url] = (200, content_type, response.content)
+        return response
+
+    def fixtures(self) -> FixtureSet:
+        """Return the recorded responses, serving each redirected URL its final response."""
+        responses = dict(self.responses)
+        for url in self.redirects:
+            target, hops = url, 0
+            while target in self.redirects and hops < 10:
+                target, hops = self.redirects[target], hops + 1
+            if target in self.responses:
+                responses[url] = self.responses[target]
+        return FixtureSet(responses, "recorded")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default=FIXTURES_DIR, help="Directory to write the fixtures to")
+    parser.add_argument("--sources", help="Comma-separated scrapers to record, e.g. bbc,toi (default: all)")
+    args = parser.parse_args()
+
+    from utils import http_client
+    from scrapers import async_fetcher
+    from scrapers.feed_cache import feed_cache
+    from scrapers.scraper_factory import ScraperFactory
+
+    adapter = RecordingAdapter()
+    session = http_client.get_session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Record everything through the requests session, including article downloads
+    async_fetcher.AIOHTTP_AVAILABLE = False
+    async_fetcher.REQUEST_ERRORS = (requests.RequestException,)
+    # Without stored validators no feed is answered with a body-less 304
+    feed_cache.cache_dir = tempfile.mkdtemp()
+
+    for scraper in ScraperFactory.get_scrapers(args.sources.split(",") if args.sources else None):
+        try:
+            print(f"{scraper.source_id}: {len(scraper.scrape_articles())} articles")
+        except Exception as e:
+            print(f"{scraper.source_id}: failed ({e})")
+
+    fixtures = adapter.fixtures()
+    fixtures.save(args.output)
+    print(f"Saved {len(fixtures)} responses to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Local HTTP server replaying fixtures, and the adapter that routes requests to it.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from fixtures import FixtureSet
+
+
+class StubServer:
+    """
+    Serves a fixture set on a local port.
+
+    A request for `/<scheme>/<host><path>?<query>` gets the fixture recorded for
+    `<scheme>://<host><path>?<query>`, or a 404 if there is none. The server runs
+    in a background thread until stopped; it can also be used as a context manager.
+    """
+
+    def __init__(self, fixtures: FixtureSet, port: int = 0):
+        """
+        Initialize the server.
+
+        Args:
+            fixtures: Responses to serve
+            port: Port to listen on, any free one by default
+        """
+        self.fixtures = fixtures
+        self.requests = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections alive, like the real sites do
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; don't let Nagle hold the body back
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                scheme, _, rest = self.path.lstrip("/").partition("/")
+                response = server.fixtures.get(f"{scheme}://{rest}")
+                with server._lock:
+                    server.requests += 1
+                    server.misses += response is None
+                status, content_type, body = response or (404, "text/plain", b"Not recorded")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+class StubAdapter(HTTPAdapter):
+    """
+    Transport adapter sending every request to a stub server instead of the
+    host in its URL. Responses keep the original URL, so the scrapers can't tell
+    the difference.
+    """
+
+    def __init__(self, base_url: str, **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            base_url: Base URL of the stub server
+            **kwargs: Passed on to HTTPAdapter
+        """
+        super().__init__(**kwargs)
+        self.stub_url = base_url
+
+    def send(self, request, **kwargs):
+        original = request.url
+        parts = urlsplit(original)
+        request.url = f"{self.stub_url}/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+        if parts.query:
+            request.url += f"?{parts.query}"
+        response = super().send(request, **kwargs)
+        response.url = original
+        request.url = original
+        return response
+
+
+def route_to_stub(session: requests.Session, server: StubServer) -> None:
+    """
+    Send all of a session's requests to a stub server.
+
+    Args:
+        session: The session, e.g. the scrapers' shared one
+        server: The running stub server
+    """
+    adapter = StubAdapter(server.base_url, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
@@ -1,15 +1,89 @@
 """
 Script to run the Daily Article Selector application.
 """
+import argparse
+import ast
 import subprocess
 import os
 import sys
 
+# Seconds the ingest daemon gets to shut down before it is killed
+INGEST_STOP_SECONDS = 10
+
+def app_imports(app_path):
+    """
+    List the modules the Streamlit app imports at its top level.
+    
+    Args:
+        app_path: Path to the app's main script
+        
+    Returns:
+        list: Module names in import order
+    """
+    with open(app_path) as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+    return modules
+
+def profile_imports(app_path, top):
+    """
+    Import the app's modules under `python -X importtime` and print the slowest
+    imports, to find what delays the first Streamlit frame.
+    
+    Args:
+        app_path: Path to the app's main script
+        top: Number of imports to report
+        
+    Returns:
+        int: Exit code of the profiled interpreter
+    """
+    app_dir = os.path.dirname(app_path)
+    code = f"import sys; sys.path.insert(0, {app_dir!r}); " + "; ".join(
+        f"import {module}" for module in app_imports(app_path)
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except (ValueError, IndexError):
+            # The header line
+            continue
+        timings.append((cumulative_us, self_us, fields[2].rstrip()))
+    
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+    total_us = sum(self_us for _, self_us, _ in timings)
+    print(f"Imported {len(timings)} modules in {total_us / 1000:.0f} ms")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative_us, self_us, module in sorted(timings, reverse=True)[:top]:
+        print(f"{cumulative_us / 1000:>9.1f} ms {self_us / 1000:>7.1f} ms {module}")
+    return result.returncode
+
 def main():
     """
-    Run the Streamlit application.
+    Run the article ingest daemon and the Streamlit application.
     """
-    print("Starting Daily Article Selector...")
+    parser = argparse.ArgumentParser(description="Run the Daily Article Selector.")
+    parser.add_argument("--no-ingest", action="store_true",
+                        help="don't start the ingest daemon (e.g. when it runs elsewhere)")
+    parser.add_argument("--profile-imports", nargs="?", type=int, const=25, metavar="TOP",
+                        help="report the TOP slowest imports of the app (default 25) and exit")
+    args = parser.parse_args()
     
     # Get the directory of this script
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,6 +91,16 @@ def main():
     # Path to the main app file
     app_path = os.path.join(script_dir, "app", "main.py")
     
+    if args.profile_imports:
+        return profile_imports(app_path, args.profile_imports)
+    
+    print("Starting Daily Article Selector...")
+    
+    # Scraping runs in its own process so the app only ever reads the article store
+    ingest = None
+    if not args.no_ingest:
+        ingest = subprocess.Popen([sys.executable, "-m", "app.ingest"], cwd=script_dir)
+    
     # Run the Streamlit app
     try:
         result = subprocess.run(
@@ -30,6 +114,16 @@ def main():
     except Exception as e:
         print(f"Unexpected error: {e}")
         return 1
+    finally:
+        if ingest is not None:
+            # The daemon clears its running flag on SIGTERM, then waits for scraper
+            # threads still stuck in requests; those can be cut short
+            ingest.terminate()
+            try:
+                ingest.wait(timeout=INGEST_STOP_SECONDS)
+            except subprocess.TimeoutExpired:
+                ingest.kill()
+                ingest.wait()
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
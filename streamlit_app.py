@@ -8,5 +8,8 @@ from pathlib import Path
 # Add the current directory to sys.path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# There is no separate ingest daemon on Streamlit Cloud, so scrape from within the app
+os.environ.setdefault("VARC_EMBEDDED_INGEST", "1")
+
 # Import the main app - no need to call main() as it's not a function anymore
 import app.main 
\ No newline at end of file